@@ -0,0 +1,5 @@
+"""
+Benchmarks
+----------
+Timing of the simulation hot path at scale (see benchmarks.run).
+"""
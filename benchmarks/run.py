@@ -0,0 +1,263 @@
+"""
+Tick Benchmarks
+---------------
+Times each engine on the tick hot path, and the full tick, at several
+world sizes.
+
+Benchmarks (one simulation per size, run in this order):
+- price:      MarketPriceEngine.tick (every company's price move + candles)
+- ai_traders: AITraderLogic.decide_batch (every holder's decision)
+- assets:     AssetManager.tick (income, decay, retirement)
+- dividends:  the dividend pass (DividendEngine via _pay_dividends)
+- queues:     routing a decided AI batch through the order books, plus
+              the scheduler (working sell lots, bot exits)
+- full_tick:  MarketSimulation.step(1)
+
+Each reports ticks/sec, p50 / p99 latency per call and peak traced
+memory (tracemalloc, measured in a separate short pass so tracing does
+not slow the timed loop). Results can be stored as a named baseline in
+benchmarks/baselines/ and later runs compared against it.
+
+Usage:
+    python -m benchmarks.run
+    python -m benchmarks.run --sizes 20,200 --save before
+    python -m benchmarks.run --sizes 20,200 --compare before
+"""
+
+import argparse
+import json
+import os
+import platform
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.world import WORLD_VERSION, build_world
+
+DEFAULT_SIZES = (20, 200, 2000, 20000)
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+
+# ------------------------------------------------------------
+#  BENCHMARKS
+# ------------------------------------------------------------
+# Each takes the simulation and returns (prepare, run): prepare() (may be
+# None) runs untimed before every run() call.
+
+def _income(sim):
+    income, _, _ = sim.asset_manager.tick(sim.ticks_per_day)
+    return income
+
+
+def bench_price(sim):
+    return None, sim.market.tick
+
+
+def bench_ai_traders(sim):
+    income = _income(sim)
+    return None, lambda: sim.ai_logic.decide_batch(sim.market, sim.disruption_engine, income, holdings=sim.holdings)
+
+
+def bench_assets(sim):
+    ticks_per_day = sim.ticks_per_day
+    return None, lambda: sim.asset_manager.tick(ticks_per_day)
+
+
+def bench_dividends(sim):
+    income = _income(sim)
+    return None, lambda: sim._pay_dividends(income)
+
+
+def bench_queues(sim):
+    income = _income(sim)
+    batch = []
+
+    def prepare():
+        sim.market.tick()
+        batch[:] = [sim.ai_logic.decide_batch(sim.market, sim.disruption_engine, income, holdings=sim.holdings)]
+
+    def run():
+        if batch[0] is not None:
+            sim._route_ai_orders(batch[0])
+        sim._run_scheduled(sim.market.global_tick)
+
+    return prepare, run
+
+
+def bench_full_tick(sim):
+    return None, lambda: sim.step(1)
+
+
+BENCHMARKS = {
+    "price": bench_price,
+    "ai_traders": bench_ai_traders,
+    "assets": bench_assets,
+    "dividends": bench_dividends,
+    "queues": bench_queues,
+    "full_tick": bench_full_tick,
+}
+
+
+# ------------------------------------------------------------
+#  TIMING
+# ------------------------------------------------------------
+
+def time_calls(prepare, run, seconds, min_calls=5, max_calls=5000, warmup=3):
+    """Latencies (seconds) of run() calls until `seconds` of run time (bounded by min/max calls)."""
+    for _ in range(warmup):
+        if prepare:
+            prepare()
+        run()
+    samples = []
+    spent = 0.0
+    while len(samples) < max_calls and (spent < seconds or len(samples) < min_calls):
+        if prepare:
+            prepare()
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        samples.append(elapsed)
+        spent += elapsed
+    return np.array(samples)
+
+
+def peak_memory(prepare, run, calls=5):
+    """Peak traced allocation (bytes) over a few run() calls."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        for _ in range(calls):
+            if prepare:
+                prepare()
+            run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(0, peak - base)
+
+
+def run_size(size, names, holders, assets, seconds, seed=0, log=print):
+    """{benchmark: stats} for one world size."""
+    start = time.perf_counter()
+    sim = build_world(size, holders=holders, assets=assets, seed=seed)
+    log(f"-- {size} companies (built in {time.perf_counter() - start:.1f}s)")
+    results = {}
+    for name in names:
+        prepare, run = BENCHMARKS[name](sim)
+        samples = time_calls(prepare, run, seconds)
+        stats = {
+            "calls": len(samples),
+            "ticks_per_sec": len(samples) / samples.sum(),
+            "p50_ms": float(np.percentile(samples, 50) * 1e3),
+            "p99_ms": float(np.percentile(samples, 99) * 1e3),
+            "peak_mb": peak_memory(prepare, run) / 2**20,
+        }
+        results[name] = stats
+        log(format_row(name, stats))
+    return results
+
+
+# ------------------------------------------------------------
+#  REPORTING + BASELINES
+# ------------------------------------------------------------
+
+def format_row(name, stats, base=None):
+    row = (f"  {name:<11} {stats['ticks_per_sec']:>10.1f}/s  p50 {stats['p50_ms']:>9.3f}ms  "
+           f"p99 {stats['p99_ms']:>9.3f}ms  peak {stats['peak_mb']:>8.2f}MB")
+    if base:
+        change = stats["ticks_per_sec"] / base["ticks_per_sec"] - 1.0
+        row += f"  {change:+7.1%} vs baseline"
+    return row
+
+
+def baseline_path(name):
+    return os.path.join(BASELINE_DIR, f"{name}.json")
+
+
+def save_baseline(name, report):
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    with open(baseline_path(name), "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=1, sort_keys=True)
+
+
+def load_baseline(name):
+    with open(baseline_path(name), encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def check_comparable(baseline, world_version=WORLD_VERSION):
+    """
+    Raise ValueError when `baseline` was measured on a different world
+    builder (WORLD_VERSION): the deltas would compare two workloads.
+    """
+    base_version = baseline["meta"].get("world_version", 1)  # baselines before versioning
+    if base_version != world_version:
+        raise ValueError(
+            f"baseline was measured on world version {base_version}, this run uses "
+            f"{world_version}: re-save the baseline with --save"
+        )
+
+
+def compare(report, baseline):
+    """Per size / benchmark rows with the throughput change against a baseline."""
+    check_comparable(baseline, report["meta"]["world_version"])
+    lines = [f"compared with baseline from {baseline['meta']['date']} ({baseline['meta']['machine']})"]
+    for size, results in report["results"].items():
+        base_size = baseline["results"].get(size, {})
+        lines.append(f"-- {size} companies")
+        for name, stats in results.items():
+            lines.append(format_row(name, stats, base_size.get(name)))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the simulation tick at several world sizes.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="comma-separated company counts")
+    parser.add_argument("--bench", default=",".join(BENCHMARKS), help="comma-separated benchmarks to run")
+    parser.add_argument("--holders", type=int, default=5, help="AI holders per company")
+    parser.add_argument("--assets", type=int, default=2, help="assets per AI owner")
+    parser.add_argument("--seconds", type=float, default=1.0, help="timed run time per benchmark")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", metavar="NAME", help="store the results as baseline NAME")
+    parser.add_argument("--compare", metavar="NAME", help="compare against baseline NAME")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    names = [b for b in args.bench.split(",") if b]
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+
+    baseline = None
+    if args.compare:
+        baseline = load_baseline(args.compare)
+        try:
+            check_comparable(baseline)
+        except ValueError as exc:
+            parser.error(f"cannot compare with {args.compare}: {exc}")
+
+    report = {
+        "meta": {
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "machine": f"{platform.node()} {platform.machine()} {platform.python_version()}",
+            "holders": args.holders,
+            "assets": args.assets,
+            "seed": args.seed,
+            "world_version": WORLD_VERSION,
+        },
+        "results": {},
+    }
+    for size in sizes:
+        report["results"][str(size)] = run_size(size, names, args.holders, args.assets, args.seconds, args.seed)
+
+    if baseline is not None:
+        print(compare(report, baseline))
+    if args.save:
+        save_baseline(args.save, report)
+        print(f"saved baseline {baseline_path(args.save)}")
+
+
+if __name__ == "__main__":
+    main()
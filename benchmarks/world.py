@@ -0,0 +1,50 @@
+"""
+Benchmark Worlds
+----------------
+Seeded MarketSimulations of any size for the benchmarks.
+
+Worlds come from the large-world generator (generate_world): procedural
+names, bulk warm-up history, and `holders` holders per company drawn
+from the other companies plus an owner universe of funds. Asset counts
+are set explicitly afterwards so runs at different sizes carry the same
+per-company load.
+
+WORLD_VERSION is stored with every baseline: bump it whenever the world
+builder changes the workload, so old baselines are not compared against
+a different world.
+"""
+
+import numpy as np
+
+from core.rng import RngService
+from core.simulation import MarketSimulation
+
+WORLD_VERSION = 2  # 1: hand-built companies + set_holders; 2: generate_world + fund universe
+
+
+def build_world(companies, holders=5, assets=2, seed=0):
+    """
+    MarketSimulation with `companies` companies (the first is the
+    player's), `holders` AI holders per company (besides the CEO stake)
+    and `assets` assets per AI owner.
+    """
+    sim = MarketSimulation.new_world(
+        companies - 1, "Medium", "Bench", "Player Corp", holders=holders, seed=seed,
+    )
+    set_assets(sim, assets, RngService(seed).np_stream("bench/world"))
+    return sim
+
+
+def set_assets(sim, per_owner, gen):
+    """Replace the AI asset books with `per_owner` random assets each."""
+    am = sim.asset_manager
+    am.set_state({
+        "owner_names": [],
+        "type_names": list(am.type_names),
+        "tier_names": [tier[0] for tier in am.QUALITY_TIERS],
+        "columns": {name: np.zeros(0, dtype=dtype) for name, dtype in am.COLUMNS.items()},
+    })
+    types = list(am.ASSET_TYPES)
+    for c in sim.companies[1:]:
+        for k in gen.integers(0, len(types), per_owner):
+            am.purchase(types[k], owner=c.name)
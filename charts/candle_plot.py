@@ -1,87 +1,285 @@
+import math
+
+import numpy as np
 from PyQt6.QtWidgets import QGraphicsItem
 from PyQt6.QtGui import QPainter, QColor, QPen, QBrush
-from PyQt6.QtCore import QRectF, QPointF, Qt
+from PyQt6.QtCore import QRectF, QLineF, Qt
+
+UP_COLOR = "#4caf50"
+DOWN_COLOR = "#e53935"
+WICK_WIDTH = 0.15
+MIN_BODY = 0.05    # flat candles still get a visible body
+MIN_BAR_PX = 2.0   # candles narrower than this on screen are merged (level of detail)
+RANGE_BARS = 1024  # price_range() over a span reads at most ~this many (merged) bars
+
+
+# ----------------------------------------------------------
+# Batched drawing
+# ----------------------------------------------------------
+
+# (wick pen, body brush) per direction (True = up), shared by every paint
+_STYLES = {
+    up: (QPen(QColor(color), WICK_WIDTH), QBrush(QColor(color)))
+    for up, color in ((True, UP_COLOR), (False, DOWN_COLOR))
+}
+_NO_PEN = QPen(Qt.PenStyle.NoPen)
+
+
+def draw_candles(painter: QPainter, bars, start=0, width=0.8, step=1):
+    """
+    Draw OHLC `bars` ((n, 4) array) at x = start, start + step, ... (each
+    bar `step` candles wide): one drawLines (wicks) and one drawRects
+    (bodies) call per color.
+    """
+    if not len(bars):
+        return
+    open_p, high_p, low_p, close_p = np.asarray(bars, dtype=np.float64).T
+    up = close_p >= open_p
+    center = start + (np.arange(len(open_p)) + 0.5) * step
+    width = width * step
+    left = center - width / 2.0
+    bottom = np.minimum(open_p, close_p)
+    height = np.maximum(np.maximum(open_p, close_p) - bottom, MIN_BODY)
+
+    for direction in (True, False):
+        idx = np.flatnonzero(up == direction)
+        if not idx.size:
+            continue
+        wick_pen, body_brush = _STYLES[direction]
+        xs, lows, highs = center[idx].tolist(), low_p[idx].tolist(), high_p[idx].tolist()
+        painter.setPen(wick_pen)
+        painter.drawLines([QLineF(x, lo, x, hi) for x, lo, hi in zip(xs, lows, highs)])
+        painter.setPen(_NO_PEN)
+        painter.setBrush(body_brush)
+        painter.drawRects([
+            QRectF(x, y, width, h) for x, y, h in zip(left[idx].tolist(), bottom[idx].tolist(), height[idx].tolist())
+        ])
+
 
+def merge_pairs(bars):
+    """OHLC bars merged two by two (first open, max high, min low, last close)."""
+    n = len(bars)
+    pairs = bars[:n - n % 2].reshape(-1, 2, 4)
+    out = np.empty((len(pairs) + n % 2, 4))
+    out[:len(pairs), 0] = pairs[:, 0, 0]
+    out[:len(pairs), 1] = pairs[:, :, 1].max(axis=1)
+    out[:len(pairs), 2] = pairs[:, :, 2].min(axis=1)
+    out[:len(pairs), 3] = pairs[:, 1, 3]
+    if n % 2:
+        out[-1] = bars[-1]
+    return out
+
+
+# ----------------------------------------------------------
+# Chart items
+# ----------------------------------------------------------
 
 class CandlestickItem(QGraphicsItem):
     """
-    A clean QGraphicsItem candlestick renderer.
-    Compatible with pyqtgraph PlotWidget.
+    Persistent candlestick renderer for a pyqtgraph PlotWidget.
+
+    Create it once and feed it with set_candles() on every refresh. The
+    forming candle is a small child item, so a tick that only moves it
+    repaints that candle alone; the finished candles are kept in the
+    item's device-coordinate cache and only redrawn when they change or
+    the view moves.
+
+    Level of detail: paint() draws only the candles inside the exposed
+    x-range, and once candles get narrower than MIN_BAR_PX on screen it
+    draws a coarser level instead, where each bar merges 2, 4, 8, ...
+    candles. Levels are built lazily (O(n) in total) and dropped when
+    the candles change, so a paint costs O(visible pixels) whatever the
+    length of the history.
     """
 
-    def __init__(self, candles, candle_width=0.8):
+    def __init__(self, candles=None, candle_width=0.8, forming=None):
+        """
+        candles: (n, 4) OHLC array (e.g. a CandleSeries window view) or a
+        sequence of Candle objects. forming: optional (o, h, l, c) drawn
+        after the finished candles.
+        """
         super().__init__()
-        self.candles = candles
         self.candle_width = float(candle_width)
+        self.candles = np.empty((0, 4))
+        self.forming = None
+        self._levels = [self.candles]  # level k: bars merging 2**k candles each
+        self._bounds = QRectF(0, 0, 1, 1)
+        self._range = None  # (low, high) of the finished candles
+        # Repaints around the forming candle blit the finished ones from a
+        # pixmap; option.exposedRect tells paint() what is on screen
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+        self._forming_item = FormingCandleItem(self)
+        if candles is not None:
+            self.set_candles(candles, forming)
 
-        # Pre-compute bounding rect
-        if candles:
-            xs = [i for i in range(len(candles))]
-            highs = [c.high for c in candles]
-            lows = [c.low for c in candles]
-
-            self._bounds = QRectF(
-                float(min(xs)) - 1,
-                float(min(lows)) - 1,
-                float(max(xs)) - float(min(xs)) + 2,
-                float(max(highs)) - float(min(lows)) + 2,
-            )
+    # ----------------------------------------------------------
+    # Data
+    # ----------------------------------------------------------
+
+    def set_candles(self, candles, forming=None):
+        """
+        Show `candles` (oldest first) and an optional forming bar.
+        Returns True when the finished candles changed (and get redrawn).
+        """
+        if not isinstance(candles, np.ndarray):
+            candles = np.array([(c.open, c.high, c.low, c.close) for c in candles], dtype=np.float64)
+        candles = candles.reshape(-1, 4)
+        changed = not self._same(candles)
+        if changed:
+            self.prepareGeometryChange()
+            self.candles = np.array(candles, dtype=np.float64)  # own copy: callers may pass live ring-buffer views
+            self._levels = [self.candles]
+            self._update_bounds()
+            self.update()
+        self.forming = forming
+        self._forming_item.set_bar(len(self.candles), forming)
+        return changed
+
+    def _same(self, candles):
+        """
+        Finished candles only ever get appended (or replaced wholesale), so
+        equal length and equal first / last bars mean nothing changed.
+        """
+        old = self.candles
+        if len(candles) != len(old):
+            return False
+        return not len(old) or (np.array_equal(candles[0], old[0]) and np.array_equal(candles[-1], old[-1]))
+
+    def _update_bounds(self):
+        if len(self.candles):
+            low, high = float(self.candles[:, 2].min()), float(self.candles[:, 1].max())
+            self._range = (low, high)
+            self._bounds = QRectF(-1.0, low - 1, float(len(self.candles)) + 2, high - low + 2)
         else:
+            self._range = None
             self._bounds = QRectF(0, 0, 1, 1)
 
+    @property
+    def count(self):
+        """Candles on the chart, forming one included."""
+        return len(self.candles) + (1 if self.forming is not None else 0)
+
+    def price_range(self, x0=None, x1=None):
+        """
+        (low, high) over the candles shown, or over those in x-range
+        [x0, x1] (read from a merged level, so it may take in a few
+        neighbours at the edges). None when there is nothing in range.
+        """
+        n = len(self.candles)
+        ranges = []
+        if x0 is None and x1 is None:
+            if self._range is not None:
+                ranges.append(self._range)
+        else:
+            x0 = 0 if x0 is None else x0
+            x1 = n if x1 is None else x1
+            level = self._level_for_span(x1 - x0)
+            bars, lo, hi = self._visible(level, x0, x1)
+            if hi > lo:
+                ranges.append((float(bars[lo:hi, 2].min()), float(bars[lo:hi, 1].max())))
+        if self.forming is not None and (x1 is None or x0 <= n + 1 and x1 >= n):
+            ranges.append((float(self.forming[2]), float(self.forming[1])))
+        if not ranges:
+            return None
+        return min(r[0] for r in ranges), max(r[1] for r in ranges)
+
     # ----------------------------------------------------------
-    # Required by QGraphicsItem
+    # Level of detail
     # ----------------------------------------------------------
 
-    def boundingRect(self):
-        return self._bounds
+    def level(self, k):
+        """Bars of level k (each merging 2**k candles), built on first use."""
+        levels = self._levels
+        while len(levels) <= k:
+            levels.append(merge_pairs(levels[-1]))
+        return levels[k]
+
+    def _level_for_px(self, px_per_candle):
+        """Coarsest level needed so every drawn bar is at least MIN_BAR_PX wide."""
+        if px_per_candle <= 0 or px_per_candle >= MIN_BAR_PX:
+            return 0
+        level = math.ceil(math.log2(MIN_BAR_PX / px_per_candle))
+        return min(level, max(0, len(self.candles) - 1).bit_length())
+
+    def _level_for_span(self, span):
+        if span <= RANGE_BARS:
+            return 0
+        return min(math.ceil(math.log2(span / RANGE_BARS)), max(0, len(self.candles) - 1).bit_length())
+
+    def _exposed_x(self, option):
+        """
+        x-range to draw: the exposed rect, clipped to what the views show
+        (after a zoom Qt exposes the whole item, most of it off screen).
+        """
+        rect = option.exposedRect if option is not None else self._bounds
+        scene = self.scene()
+        if scene is not None:
+            shown = QRectF()
+            for view in scene.views():
+                area = view.mapToScene(view.viewport().rect()).boundingRect()
+                shown = shown.united(self.mapRectFromScene(area))
+            if not shown.isEmpty():
+                rect = rect.intersected(shown)
+        return rect.left(), rect.right()
+
+    def _visible(self, level, x0, x1):
+        """(level bars, first, stop) covering candles x0..x1 (one bar of margin each side)."""
+        bars = self.level(level)
+        step = 1 << level
+        lo = max(0, int(math.floor(x0)) // step - 1)
+        hi = min(len(bars), int(math.ceil(x1)) // step + 2)
+        return bars, lo, max(lo, hi)
 
     # ----------------------------------------------------------
-    # Painting
+    # Required by QGraphicsItem
     # ----------------------------------------------------------
 
+    def boundingRect(self):
+        return self._bounds
+
     def paint(self, painter: QPainter, option, widget=None):
-        if not self.candles:
+        if not len(self.candles):
+            return
+        level = self._level_for_px(abs(painter.worldTransform().m11()))
+        x0, x1 = self._exposed_x(option)
+        bars, lo, hi = self._visible(level, x0, x1)
+        if hi <= lo:
             return
-
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        step = 1 << level
+        draw_candles(painter, bars[lo:hi], lo * step, self.candle_width, step)
 
-        for i, c in enumerate(self.candles):
-            self._draw_candle(painter, i, c)
 
-    # ----------------------------------------------------------
-    # Draw a single candlestick
-    # ----------------------------------------------------------
+class FormingCandleItem(QGraphicsItem):
+    """The still-forming candle: its own small item, repainted every tick."""
 
-    def _draw_candle(self, painter: QPainter, index: int, c):
-        # Determine color
-        up = c.close >= c.open
-        color = QColor("#4caf50") if up else QColor("#e53935")
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.index = 0
+        self.bar = None
+        self._bounds = QRectF()
 
-        # Wick Pen
-        wick_pen = QPen(color, 0.15)
-        painter.setPen(wick_pen)
+    def set_bar(self, index, bar):
+        if bar is not None:
+            bar = tuple(float(v) for v in bar)
+        if index == self.index and bar == self.bar:
+            return
+        self.prepareGeometryChange()
+        self.index = index
+        self.bar = bar
+        if bar is None:
+            self._bounds = QRectF()
+        else:
+            low = min(bar[2], bar[0], bar[3])
+            high = max(bar[1], bar[0], bar[3])
+            self._bounds = QRectF(float(index), low - MIN_BODY, 1.0, high - low + 2 * MIN_BODY)
+        self.update()
 
-        # Wick line: use QPointF to avoid float errors
-        center_x = float(index) + 0.5
-        p1 = QPointF(center_x, float(c.low))
-        p2 = QPointF(center_x, float(c.high))
-        painter.drawLine(p1, p2)
-
-        # Body
-        body_pen = QPen(Qt.PenStyle.NoPen)
-        painter.setPen(body_pen)
-        painter.setBrush(QBrush(color))
-
-        body_top = float(max(c.open, c.close))
-        body_bottom = float(min(c.open, c.close))
-        height = max(body_top - body_bottom, 0.05)
-
-        rect = QRectF(
-            float(index) + 0.1,  # x
-            body_bottom,         # y
-            self.candle_width,   # width
-            height               # height
-        )
-
-        painter.drawRect(rect)
+    def boundingRect(self):
+        return self._bounds
+
+    def paint(self, painter: QPainter, option, widget=None):
+        if self.bar is not None:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            draw_candles(painter, np.array([self.bar]), self.index, self.parentItem().candle_width)
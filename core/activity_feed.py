@@ -0,0 +1,113 @@
+"""
+Activity Feed
+-------------
+Bounded storage and per-tick coalescing for the market activity feed.
+
+- MessageBurst collects the messages emitted during one tick and
+  flushes them as feed lines. Messages sharing a `group` (e.g. every
+  holder trimming the same company) collapse into one summary line;
+  repeats of the same ungrouped message collapse into "text (xN)".
+  Lines keep the order of each group's first message.
+- FeedRing keeps the newest `capacity` lines in a preallocated ring,
+  so memory stays flat however long the session runs and appending or
+  reading a line is O(1).
+
+Qt-free: the simulation worker coalesces, the dashboard's feed model
+stores the lines in a FeedRing.
+"""
+
+FEED_CAPACITY = 500   # lines kept (and shown) in the activity feed
+
+
+# ------------------------------------------------------------
+#  COALESCING
+# ------------------------------------------------------------
+
+class MessageBurst:
+    """Messages of one tick, merged by group on flush()."""
+
+    def __init__(self):
+        self._groups = {}   # key -> [text, color, summary, count] (first-seen order)
+
+    def __len__(self):
+        return len(self._groups)
+
+    def add(self, text, color="#cccccc", group=None):
+        """
+        Queue a message. `group` is the summary line used when several
+        messages share it, with "{n}" standing for their count, e.g.
+        "{n} holders trimmed Acme".
+        """
+        key = group if group is not None else (text, color)
+        entry = self._groups.get(key)
+        if entry is None:
+            self._groups[key] = [text, color, group, 1]
+        else:
+            entry[3] += 1
+
+    def flush(self):
+        """[(text, color), ...] for the queued messages, then start a new burst."""
+        lines = []
+        for text, color, summary, count in self._groups.values():
+            if count > 1:
+                text = summary.replace("{n}", str(count)) if summary is not None else f"{text} (x{count})"
+            lines.append((text, color))
+        self._groups = {}
+        return lines
+
+
+# ------------------------------------------------------------
+#  STORAGE
+# ------------------------------------------------------------
+
+class FeedRing:
+    """Fixed-capacity ring of feed lines, oldest first. Index 0 is the oldest line kept."""
+
+    def __init__(self, capacity=FEED_CAPACITY):
+        self.capacity = max(1, int(capacity))
+        self._slots = [None] * self.capacity
+        self._start = 0     # absolute number of the oldest line kept
+        self._end = 0       # absolute number of the next line
+
+    def __len__(self):
+        return self._end - self._start
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self._slots[(self._start + i) % self.capacity]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    @property
+    def total(self):
+        """Lines ever appended."""
+        return self._end
+
+    def overflow(self, count):
+        """How many old lines appending `count` new ones pushes out."""
+        return max(0, len(self) + min(count, self.capacity) - self.capacity)
+
+    def drop(self, count):
+        """Forget the `count` oldest lines."""
+        count = min(max(0, count), len(self))
+        for i in range(self._start, self._start + count):
+            self._slots[i % self.capacity] = None
+        self._start += count
+
+    def extend(self, lines):
+        """Append lines, dropping the oldest once full. Returns how many were dropped."""
+        lines = list(lines)[-self.capacity:]
+        dropped = self.overflow(len(lines))
+        self.drop(dropped)
+        for line in lines:
+            self._slots[self._end % self.capacity] = line
+            self._end += 1
+        return dropped
+
+    def clear(self):
+        self.drop(len(self))
@@ -1,18 +1,58 @@
 """
 Simple AI trading behaviors for each company.
+
+decide_batch() evaluates every holder of every company as arrays and
+returns the orders as one batch, which the simulation routes through
+the order books. Stakes are valued against the same dividend ladder
+the simulation pays out (core.dividends).
 """
 
 import random
+from dataclasses import dataclass
+
+import numpy as np
+
+from core.dividends import ladder_rates
+
+
+@dataclass
+class AIOrderBatch:
+    """One signed order per (company, holder) pair; qty 0 = no order."""
+    cidx: np.ndarray      # company slot per holder
+    slot: np.ndarray      # holder's position in its company's holder list
+    names: list           # holder names
+    held: np.ndarray      # shares held when the batch was decided
+    qty: np.ndarray       # + buy / - sell
+    dump: np.ndarray      # panic dump orders
+    reported: np.ndarray  # forwarded to trade_callback (maker lots are not)
+
+    def orders(self):
+        """Indices of holders with an order, in holder order."""
+        return np.flatnonzero(self.qty)
 
 
 class AITraderLogic:
-    def __init__(self):
+    def __init__(self, rng=None, rolls=None):
+        # Random source (RngService stream); `rolls` serves decide_batch's
+        # array draws, e.g. a pre-drawn UniformBuffer
+        self.rng = rng if rng is not None else random
+        self.rolls = rolls if rolls is not None else self.rng
         # tuneable knobs (slowed)
         self.base_buy_chance = 0.28
         self.base_sell_chance = 0.18
         self.dump_chance = 0.02
         self.profiles = {}
         self.last_prices = {}
+        self._profile_key = None
+
+    def get_state(self):
+        return {"profiles": {name: dict(p) for name, p in self.profiles.items()},
+                "last_prices": dict(self.last_prices)}
+
+    def set_state(self, state):
+        self.profiles = {name: dict(p) for name, p in state["profiles"].items()}
+        self.last_prices = dict(state["last_prices"])
+        self._profile_key = None  # rebuild the profile columns on next use
 
     def _get_profile(self, company):
         if company.name in self.profiles:
@@ -24,7 +64,7 @@ class AITraderLogic:
             ("holder", 0.13),
             ("speculator", 0.15),
         ]
-        r = random.random()
+        r = self.rng.random()
         acc = 0
         choice = "swing"
         for name, w in archetypes:
@@ -34,165 +74,173 @@ class AITraderLogic:
                 break
         profile = {
             "type": choice,
-            "active_bias": random.uniform(-0.05, 0.15),
-            "size_bias": random.uniform(0.5, 1.5),
-            "hold_bias": random.uniform(0.0, 0.3),
+            "active_bias": self.rng.uniform(-0.05, 0.15),
+            "size_bias": self.rng.uniform(0.5, 1.5),
+            "hold_bias": self.rng.uniform(0.0, 0.3),
         }
         self.profiles[company.name] = profile
         return profile
 
-    def _price_nudge(self, company, shares, direction):
-        frac = shares / max(1, company.total_shares)
-        impact = frac * 0.2
-        company.price = round(max(0.01, company.price * (1 + direction * impact)), 2)
-
-    def tick(self, company, ownership_engine, disruption_engine, event_bus=None, trade_callback=None, income_map=None):
+    # ------------------------------------------------------------
+    #  BATCHED STEP (all companies, all holders)
+    # ------------------------------------------------------------
+
+    def _uniforms(self, n):
+        """n uniforms in [0, 1); one block draw when rolls is a UniformBuffer."""
+        take = getattr(self.rolls, "take", None)
+        if take is not None:
+            return take(n)
+        return np.fromiter((self.rolls.random() for _ in range(n)), dtype=np.float64, count=n)
+
+    def _profile_arrays(self, companies):
+        """Per-company profile columns, rebuilt only when the company list changes."""
+        key = tuple(c.name for c in companies)
+        if self._profile_key != key:
+            profiles = [self._get_profile(c) for c in companies]
+            self._profile_key = key
+            self._p_active = np.array([p["active_bias"] for p in profiles])
+            self._p_size = np.array([p["size_bias"] for p in profiles])
+            self._p_hold = np.array([p["hold_bias"] for p in profiles])
+            types = [p["type"] for p in profiles]
+            self._p_maker = np.array([t == "maker" for t in types])
+            self._p_fast = np.array([t in ("scalper", "speculator") for t in types])
+            self._last_price_arr = np.array([self.last_prices.get(c.name, np.nan) for c in companies])
+        return self._p_active, self._p_size, self._p_hold, self._p_maker, self._p_fast
+
+    def decide_batch(self, market, disruption_engine, income_map=None, holdings=None):
         """
-        Run one AI trading step for a company.
-        AIs are the companies themselves (keys in company.ai_owners).
+        Decision rules evaluated as arrays:
+            1. activity gate per company
+            2. buy / dump / maker / sell thresholds per (company, holder)
+        With a HoldingsStore (rows = market slots) holders and floats are
+        read straight from its arrays.
+        Returns an AIOrderBatch (one signed order per holder, 0 = none),
+        or None when no company is active this tick.
         """
-        if not company.ai_owners:
-            return
-
-        if income_map is None:
-            income_map = {}
-
-        # Dividend ladder helper (mirrors main controller)
-        LADDER = [
-            (0.9, 0.25),
-            (0.8, 0.22),
-            (0.7, 0.19),
-            (0.6, 0.16),
-            (0.5, 0.14),
-            (0.4, 0.12),
-            (0.3, 0.10),
-            (0.2, 0.07),
-            (0.1, 0.04),
-            (0.0, 0.02),
-        ]
-
-        def ladder_rate(frac):
-            for th, rate in LADDER:
-                if frac >= th:
-                    return rate
-            return 0.0
-
-        profile = self._get_profile(company)
-
-        # Global throttle: still throttled but more active
-        throttle = 0.12 - profile["active_bias"]
-        if random.random() > max(0.02, throttle):
-            return
-
-        # Trend signal: compare last daily close vs previous (if available)
-        trend_bias = 0.0
-        if len(company.daily_candles) >= 2:
-            last_close = company.daily_candles[-1].close
-            prev_close = company.daily_candles[-2].close
-            trend_bias = (last_close - prev_close) / max(1.0, prev_close)
-        prev_price = self.last_prices.get(company.name, company.price)
-        price_change = (company.price - prev_price) / max(1.0, prev_price)
-        self.last_prices[company.name] = company.price
-
+        companies = market.companies
+        n = len(companies)
+        if n == 0:
+            return None
+        income_map = income_map or {}
+        active_bias, size_bias, hold_bias, is_maker, is_fast = self._profile_arrays(companies)
+
+        # 1. Activity gate (companies with holders only)
+        if holdings is not None:
+            has_owners = holdings.count > 0
+        else:
+            has_owners = np.fromiter((bool(c.ai_owners) for c in companies), dtype=bool, count=n)
+        gate = np.maximum(0.02, 0.12 - active_bias)
+        active = np.zeros(n, dtype=bool)
+        active[has_owners] = self._uniforms(int(has_owners.sum())) <= gate[has_owners]
+        rows = np.flatnonzero(active)
+        if rows.size == 0:
+            return None
+
+        # Company-level signals
+        price = market.price
+        daily = market.daily
+        last_close = daily.last(back=0)
+        prev_close = daily.last(back=1)
+        trend = np.where(daily.count >= 2, (last_close - prev_close) / np.maximum(1.0, prev_close), 0.0)
+        last_seen = np.where(np.isnan(self._last_price_arr), price, self._last_price_arr)
+        price_change = (price - last_seen) / np.maximum(1.0, last_seen)
+        self._last_price_arr[rows] = price[rows]
+        for i in rows:
+            self.last_prices[companies[i].name] = float(price[i])
+
+        if holdings is not None:
+            total = holdings.total_shares.astype(np.float64)
+            public_float = holdings.public_float.astype(np.float64)
+        else:
+            total = np.fromiter((c.total_shares for c in companies), dtype=np.float64, count=n)
+            public_float = np.fromiter((c.public_float for c in companies), dtype=np.float64, count=n)
+        income = np.fromiter((income_map.get(c.name, 0.0) for c in companies), dtype=np.float64, count=n)
         disruption_penalty = min(1.0, disruption_engine.value / 150.0)
-        float_factor = min(1.0, company.public_float / max(1, company.total_shares))
-
-        asset_income = income_map.get(company.name, 0.0)
-        per_share_income = asset_income / max(1, company.total_shares)
-        yield_est = per_share_income / max(0.01, company.price)
-
-        for ai_name, ai_shares in list(company.ai_owners.items()):
-            # Buy logic
-            buy_roll = random.random()
-            float_bias = float_factor * 0.35  # more float -> more willing to buy
-            # Expected dividend improvement if this AI increases stake modestly
-            probe_shares = max(1, int(company.total_shares * 0.01))
-            now_rate = ladder_rate(ai_shares / max(1, company.total_shares))
-            next_rate = ladder_rate((ai_shares + probe_shares) / max(1, company.total_shares))
-            div_gain = (next_rate - now_rate) * asset_income
-            # Convert to an annualized-ish yield signal (scaled)
-            income_bias = min(0.18, yield_est * 6 + (div_gain / max(1.0, probe_shares * company.price)) * 0.3)
-            buy_threshold = self.base_buy_chance + trend_bias * 0.35 - disruption_penalty * 0.25 + profile["active_bias"] + float_bias + income_bias
-            buy_threshold = max(0.05, min(0.45, buy_threshold))
-
-            if buy_roll < buy_threshold and company.public_float > 0:
-                max_buy = max(1, int(company.total_shares * 0.08 * profile["size_bias"]))
-                shares = random.randint(1, max_buy)
-                shares = min(shares, company.public_float)
-                # Boost size a bit if yield is attractive
-                if yield_est > 0.01:
-                    shares = min(company.public_float, shares + int(company.total_shares * 0.01))
-                if ownership_engine.ai_buy(ai_name, shares):
-                    self._price_nudge(company, shares, +1)
-                    if trade_callback:
-                        trade_callback(company, shares, ai_name)
-                continue  # skip selling same tick
-
-            # Dump (rare, but more likely on downward trend)
-            dump_roll = random.random()
-            if dump_roll < self.dump_chance * (1 + trend_bias * -10):
-                if trend_bias < -0.01 or price_change < -0.02:
-                    dump_amount = ai_shares  # full exit on slide
-                else:
-                    dump_amount = max(1, int(ai_shares * 0.15 * profile["size_bias"]))
-                dump_amount = min(dump_amount, ai_shares)
-                if ownership_engine.ai_sell(ai_name, dump_amount):
-                    if event_bus and dump_amount >= ai_shares:
-                        event_bus.emit(f"{ai_name} panic-dumped all shares of {company.name}", "#ff6666")
-                    self._price_nudge(company, dump_amount, -1)
-                    if trade_callback:
-                        trade_callback(company, -dump_amount, ai_name)
-                continue
-
-            # Maker logic: aim for inventory around 8-15% of total shares
-            if profile["type"] == "maker":
-                target_low = company.total_shares * 0.08
-                target_high = company.total_shares * 0.15
-                # If under target, buy small lots
-                if ai_shares < target_low and company.public_float > 0:
-                    shares = max(1, int(company.total_shares * 0.01))
-                    shares = min(shares, company.public_float)
-                    if ownership_engine.ai_buy(ai_name, shares):
-                        self._price_nudge(company, shares, +1)
-                    continue
-                # If above target_high, sell small lots
-                if ai_shares > target_high:
-                    shares = max(1, int((ai_shares - target_high) * 0.3))
-                    if ownership_engine.ai_sell(ai_name, shares):
-                        self._price_nudge(company, shares, -1)
-                    continue
-
-            # Sell logic
-            sell_roll = random.random()
-            sell_threshold = self.base_sell_chance - trend_bias * 0.25 + disruption_penalty * 0.2 + float_factor * 0.1 - profile["hold_bias"]
-            if price_change > 0.03:
-                sell_threshold += 0.12  # take profits on strong rise
-            if price_change > 0.10:
-                sell_threshold += 0.22   # very strong rise -> more selling
-            # If yield is strong, dampen selling pressure (they prefer collecting income)
-            sell_threshold -= min(0.08, yield_est * 4)
-            # If float is empty, encourage releasing shares to market
-            if company.public_float <= 0:
-                sell_threshold += 0.2
-            # Speculators/scalpers take profits faster on spikes
-            if profile["type"] in ("scalper", "speculator") and price_change > 0.05:
-                sell_threshold += 0.18
-            sell_threshold = max(0.05, min(0.60, sell_threshold))
-
-            if sell_roll < sell_threshold and ai_shares > 0:
-                min_hold = max(5, int(company.total_shares * 0.03))
-                if ai_shares <= min_hold:
-                    continue
-                # If big run-up, sometimes exit a chunk
-                if price_change > 0.1 and random.random() < 0.4:
-                    shares = max(1, int(ai_shares * 0.5))
-                else:
-                    max_sell = max(1, int((ai_shares - min_hold) * 0.5 * profile["size_bias"]))
-                    shares = random.randint(1, max_sell)
-                # Scalpers/speculators trim lighter but more frequently
-                if profile["type"] in ("scalper", "speculator") and price_change > 0.05:
-                    shares = max(1, int(ai_shares * random.uniform(0.15, 0.35)))
-                if ownership_engine.ai_sell(ai_name, shares):
-                    self._price_nudge(company, shares, -1)
-                    if trade_callback:
-                        trade_callback(company, -shares, ai_name)
+        float_factor = np.minimum(1.0, public_float / np.maximum(1.0, total))
+        yield_est = income / np.maximum(1.0, total) / np.maximum(0.01, price)
+
+        # 2. Flatten holders of active companies into parallel arrays
+        if holdings is not None:
+            in_use = holdings.holders_mask()[rows]
+            cidx = np.repeat(rows, holdings.count[rows])
+            slot = np.nonzero(in_use)[1]
+            held = holdings.shares[rows][in_use].astype(np.float64)
+            owner_names = holdings.owner_names
+            names = [owner_names[o] for o in holdings.owner[rows][in_use].tolist()]
+        else:
+            names, cidx, slot, held = [], [], [], []
+            for i in rows:
+                owners = companies[i].ai_owners
+                names.extend(owners)
+                held.extend(owners.values())
+                cidx.extend([i] * len(owners))
+                slot.extend(range(len(owners)))
+            cidx = np.asarray(cidx, dtype=np.int64)
+            slot = np.asarray(slot, dtype=np.int64)
+            held = np.asarray(held, dtype=np.float64)
+        m = len(names)
+        tot = total[cidx]
+        flt = public_float[cidx]
+        pc = price_change[cidx]
+        tr = trend[cidx]
+        yl = yield_est[cidx]
+        sz = size_bias[cidx]
+        buy_roll, size_u, dump_roll, sell_roll, runup_roll, trim_u = self._uniforms(6 * m).reshape(6, m)
+
+        # Buy
+        probe = np.maximum(1, (tot * 0.01).astype(np.int64))
+        div_gain = (ladder_rates((held + probe) / tot) - ladder_rates(held / tot)) * income[cidx]
+        income_bias = np.minimum(0.18, yl * 6 + (div_gain / np.maximum(1.0, probe * price[cidx])) * 0.3)
+        buy_threshold = np.clip(
+            self.base_buy_chance + tr * 0.35 - disruption_penalty * 0.25 + active_bias[cidx]
+            + float_factor[cidx] * 0.35 + income_bias,
+            0.05, 0.45,
+        )
+        buy = (buy_roll < buy_threshold) & (flt > 0)
+        max_buy = np.maximum(1, (tot * 0.08 * sz).astype(np.int64))
+        buy_qty = np.minimum((size_u * max_buy).astype(np.int64) + 1, flt)
+        buy_qty = np.where(yl > 0.01, np.minimum(flt, buy_qty + (tot * 0.01).astype(np.int64)), buy_qty)
+        rest = ~buy
+
+        # Dump (rare, more likely on a downward trend)
+        dump = rest & (dump_roll < self.dump_chance * (1 + tr * -10))
+        full_exit = (tr < -0.01) | (pc < -0.02)
+        dump_qty = np.where(full_exit, held, np.maximum(1, (held * 0.15 * sz).astype(np.int64)))
+        dump_qty = np.minimum(dump_qty, held)
+        rest &= ~dump
+
+        # Maker: inventory around 8-15% of total shares (unreported small lots)
+        maker = rest & is_maker[cidx]
+        maker_buy = maker & (held < tot * 0.08) & (flt > 0)
+        maker_sell = maker & ~maker_buy & (held > tot * 0.15)
+        maker_buy_qty = np.minimum(np.maximum(1, (tot * 0.01).astype(np.int64)), flt)
+        maker_sell_qty = np.maximum(1, ((held - tot * 0.15) * 0.3).astype(np.int64))
+        rest &= ~(maker_buy | maker_sell)
+
+        # Sell
+        fast = is_fast[cidx] & (pc > 0.05)
+        sell_threshold = (
+            self.base_sell_chance - tr * 0.25 + disruption_penalty * 0.2 + float_factor[cidx] * 0.1 - hold_bias[cidx]
+            + np.where(pc > 0.03, 0.12, 0.0) + np.where(pc > 0.10, 0.22, 0.0)
+            - np.minimum(0.08, yl * 4) + np.where(flt <= 0, 0.2, 0.0) + np.where(fast, 0.18, 0.0)
+        )
+        sell_threshold = np.clip(sell_threshold, 0.05, 0.60)
+        min_hold = np.maximum(5, (tot * 0.03).astype(np.int64))
+        sell = rest & (sell_roll < sell_threshold) & (held > min_hold)
+        max_sell = np.maximum(1, ((held - min_hold) * 0.5 * sz).astype(np.int64))
+        sell_qty = np.where(
+            (pc > 0.1) & (runup_roll < 0.4),
+            np.maximum(1, (held * 0.5).astype(np.int64)),
+            (size_u * max_sell).astype(np.int64) + 1,
+        )
+        sell_qty = np.where(fast, np.maximum(1, (held * (0.15 + 0.2 * trim_u)).astype(np.int64)), sell_qty)
+
+        # Signed order per holder (0 = no order); maker lots are not reported
+        qty = np.zeros(m, dtype=np.int64)
+        qty[buy] = buy_qty[buy]
+        qty[dump] = -dump_qty[dump]
+        qty[maker_buy] = maker_buy_qty[maker_buy]
+        qty[maker_sell] = -maker_sell_qty[maker_sell]
+        qty[sell] = -sell_qty[sell]
+        reported = buy | dump | sell
+        return AIOrderBatch(cidx, slot, names, held, qty, dump, reported)
@@ -1,6 +1,26 @@
+"""
+Assets Engine
+-------------
+Income-producing assets for every owner (player, AI companies, CEO...).
+
+Assets live in a columnar ledger: one NumPy array per field (type id,
+owner id, condition, efficiency, tier multipliers, value...), rows in
+purchase order. tick() computes income, decay, value and pruning for
+all assets in one pass; per-owner sums are bincounts over owner ids.
+
+Per-owner aggregates (value, boost, income per day, counts by type and
+tier) are kept alongside and read in O(1). Counts are adjusted in place
+on purchase / scrap / transfer / pruning; the condition-dependent sums
+are recomputed in the tick pass, where every condition changes anyway.
+
+snapshot() / assets still hand out the old per-asset dicts for the UI.
+"""
+
 import math
 import random
 
+import numpy as np
+
 
 class AssetManager:
     """
@@ -28,40 +48,273 @@ class AssetManager:
         ("Epic", 1.2, 0.9, "#f5d76b"),
     ]
 
-    def __init__(self):
-        self.assets = {"player": []}  # owner -> list of assets
+    # Scrapped when condition <= MIN_CONDITION or value <= MIN_VALUE
+    MIN_CONDITION = 0.1
+    MIN_VALUE = 100
+    # scrap_ticks() of an asset that does not decay
+    NEVER_SCRAPPED = np.iinfo(np.int64).max
+
+    # Ledger columns: name -> dtype (one row per asset)
+    COLUMNS = {
+        "type_id": np.int16,
+        "owner_id": np.int32,
+        "tier_id": np.int8,
+        "condition": np.float64,
+        "efficiency": np.float64,
+        "tier_income": np.float64,
+        "tier_decay": np.float64,
+        "value": np.float64,
+        "broken": np.bool_,
+    }
+
+    def __init__(self, rng=None, capacity=256):
+        self.rng = rng if rng is not None else random
+
+        # Type / tier tables (indexed by type_id / tier_id)
+        self.type_names = list(self.ASSET_TYPES)
+        self.type_ids = {name: i for i, name in enumerate(self.type_names)}
+        self.type_cost = np.array([cfg["cost"] for cfg in self.ASSET_TYPES.values()], dtype=np.float64)
+        self.type_income = np.array([cfg["income_per_day"] for cfg in self.ASSET_TYPES.values()], dtype=np.float64)
+        self.type_decay = np.array([cfg["decay"] for cfg in self.ASSET_TYPES.values()], dtype=np.float64)
+        self.type_boost = np.array([cfg["boost"] for cfg in self.ASSET_TYPES.values()], dtype=np.float64)
+        self.tier_ids = {tier[0]: i for i, tier in enumerate(self.QUALITY_TIERS)}
+
+        # Owner registry
+        self.owner_ids = {}
+        self.owner_names = []
+
+        # Aggregates per (owner, type) and per owner
+        self._init_aggregates(8)
+
+        self.n = 0
+        for name, dtype in self.COLUMNS.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+        self.ensure_owner("player")
+
+    # ------------------------------------------------------------
+    #  LEDGER STORAGE
+    # ------------------------------------------------------------
+
+    def _grow(self):
+        capacity = max(16, len(self.condition) * 2)
+        for name, dtype in self.COLUMNS.items():
+            col = np.zeros(capacity, dtype=dtype)
+            col[:self.n] = getattr(self, name)[:self.n]
+            setattr(self, name, col)
+
+    def _keep(self, mask):
+        """Compact the ledger to the rows where mask (length n) is True, in order."""
+        kept = int(mask.sum())
+        if kept == self.n:
+            return
+        for name in self.COLUMNS:
+            col = getattr(self, name)
+            col[:kept] = col[:self.n][mask]
+        self.n = kept
+
+    def _owner_rows(self, owner):
+        oid = self.owner_ids.get(owner)
+        if oid is None:
+            return np.empty(0, dtype=np.int64)
+        return np.flatnonzero(self.owner_id[:self.n] == oid)
+
+    def _asset_dict(self, i):
+        tier = self.QUALITY_TIERS[self.tier_id[i]]
+        return {
+            "type": self.type_names[self.type_id[i]],
+            "condition": float(self.condition[i]),
+            "value": float(self.value[i]),
+            "efficiency": float(self.efficiency[i]),
+            "tier": tier[0],
+            "tier_income": float(self.tier_income[i]),
+            "tier_decay": float(self.tier_decay[i]),
+            "color": tier[3],
+            "broken": bool(self.broken[i]),
+        }
+
+    # ------------------------------------------------------------
+    #  AGGREGATES
+    # ------------------------------------------------------------
+
+    # Indexed by owner id first; transfer_owner moves a whole owner row
+    _AGGREGATES = (
+        "owner_count", "owner_value", "owner_boost", "owner_income",
+        "type_count", "type_condition", "type_income_day", "tier_count",
+    )
+
+    def _init_aggregates(self, owners):
+        types, tiers = len(self.type_names), len(self.QUALITY_TIERS)
+        self.owner_count = np.zeros(owners, dtype=np.int64)
+        self.owner_value = np.zeros(owners)
+        self.owner_boost = np.zeros(owners)
+        self.owner_income = np.zeros(owners)               # per day
+        self.type_count = np.zeros((owners, types), dtype=np.int64)
+        self.type_condition = np.zeros((owners, types))    # sum of condition
+        self.type_income_day = np.zeros((owners, types))
+        self.tier_count = np.zeros((owners, types, tiers), dtype=np.int64)
+
+    def _grow_owners(self):
+        old = {name: getattr(self, name) for name in self._AGGREGATES}
+        self._init_aggregates(len(self.owner_value) * 2)
+        for name, arr in old.items():
+            getattr(self, name)[:len(arr)] = arr
+
+    def _daily_income(self, rows):
+        return self.type_income[self.type_id[rows]] * self.condition[rows] * self.efficiency[rows] * self.tier_income[rows]
+
+    def _account(self, i, sign):
+        """Add (sign=1) or remove (sign=-1) ledger row i from the aggregates."""
+        oid, t, k = self.owner_id[i], self.type_id[i], self.tier_id[i]
+        condition = self.condition[i]
+        income = self._daily_income(i)
+        self.owner_count[oid] += sign
+        self.owner_value[oid] += sign * self.value[i]
+        self.owner_boost[oid] += sign * self.type_boost[t] * condition
+        self.owner_income[oid] += sign * income
+        self.type_count[oid, t] += sign
+        self.type_condition[oid, t] += sign * condition
+        self.type_income_day[oid, t] += sign * income
+        self.tier_count[oid, t, k] += sign
+
+    def _prune(self, keep):
+        """Drop the ledger rows where keep is False, taking them out of the counts."""
+        gone = np.flatnonzero(~keep)
+        if gone.size:
+            oid = self.owner_id[gone].astype(np.int64)
+            t = self.type_id[gone].astype(np.int64)
+            np.subtract.at(self.owner_count, oid, 1)
+            np.subtract.at(self.type_count, (oid, t), 1)
+            np.subtract.at(self.tier_count, (oid, t, self.tier_id[gone].astype(np.int64)), 1)
+            self._keep(keep)
+
+    def _recount(self):
+        """Rebuild the count aggregates from the ledger (after a load)."""
+        n = self.n
+        owners, types, tiers = self.tier_count.shape
+        oid = self.owner_id[:n].astype(np.int64)
+        key = (oid * types + self.type_id[:n]) * tiers + self.tier_id[:n]
+        self.tier_count = np.bincount(key, minlength=owners * types * tiers).reshape(owners, types, tiers)
+        self.type_count = self.tier_count.sum(axis=2)
+        self.owner_count = self.type_count.sum(axis=1)
+
+    def _refresh_condition_aggregates(self):
+        """
+        Recompute the aggregates that move with condition (condition sums,
+        value, income, boost) after a decay pass; counts are kept in place.
+        """
+        n = self.n
+        owners, types = self.type_count.shape
+        key = self.owner_id[:n].astype(np.int64) * types + self.type_id[:n]
+        cells = owners * types
+        self.type_condition = np.bincount(key, weights=self.condition[:n], minlength=cells).reshape(owners, types)
+        self.type_income_day = np.bincount(
+            key, weights=self._daily_income(slice(0, n)), minlength=cells
+        ).reshape(owners, types)
+        self.owner_income = self.type_income_day.sum(axis=1)
+        self.owner_value = np.bincount(self.owner_id[:n], weights=self.value[:n], minlength=owners)
+        self.owner_boost = self.type_condition @ self.type_boost
+
+    # ------------------------------------------------------------
+    #  OWNERS
+    # ------------------------------------------------------------
 
     def ensure_owner(self, owner):
-        if owner not in self.assets:
-            self.assets[owner] = []
+        oid = self.owner_ids.get(owner)
+        if oid is None:
+            oid = len(self.owner_names)
+            self.owner_ids[owner] = oid
+            self.owner_names.append(owner)
+            if oid == len(self.owner_value):
+                self._grow_owners()
+        return oid
+
+    def owners(self):
+        """Every owner seen so far (with or without assets)."""
+        return list(self.owner_names)
+
+    def count(self, owner="player"):
+        oid = self.owner_ids.get(owner)
+        return 0 if oid is None else int(self.owner_count[oid])
+
+    def transfer_owner(self, src, dst):
+        """Move all of src's assets to dst (appended after dst's own). Returns the count moved."""
+        oid = self.owner_ids.get(src)
+        if oid is None:
+            return 0
+        dst_id = self.ensure_owner(dst)
+        owner = self.owner_id[:self.n]
+        moving = owner == oid
+        moved = int(moving.sum())
+        if moved:
+            order = np.concatenate([np.flatnonzero(~moving), np.flatnonzero(moving)])
+            for name in self.COLUMNS:
+                col = getattr(self, name)
+                col[:self.n] = col[:self.n][order]
+            self.owner_id[self.n - moved:self.n] = dst_id
+            for name in self._AGGREGATES:
+                agg = getattr(self, name)
+                agg[dst_id] += agg[oid]
+                agg[oid] = 0
+        return moved
+
+    @property
+    def assets(self):
+        """owner -> list of asset dicts (a copy; use purchase/scrap/transfer to change)."""
+        return {owner: self.snapshot(owner) for owner in self.owner_names}
+
+    # ------------------------------------------------------------
+    #  TRADING
+    # ------------------------------------------------------------
 
     def purchase(self, asset_type, owner="player"):
         cfg = self.ASSET_TYPES.get(asset_type)
         if not cfg:
             return False, 0, False
-        self.ensure_owner(owner)
-        tier = random.choices(self.QUALITY_TIERS, weights=[0.55, 0.35, 0.1])[0]
-        broken = random.random() < 0.15
+        oid = self.ensure_owner(owner)
+        tier = self.rng.choices(self.QUALITY_TIERS, weights=[0.55, 0.35, 0.1])[0]
+        broken = self.rng.random() < 0.15
         condition = 1.0
-        efficiency = 0.7 + 0.6 * random.random()
+        efficiency = 0.7 + 0.6 * self.rng.random()
         if broken:
             condition = 0.35
-            efficiency = 0.4 + 0.2 * random.random()
-        self.assets[owner].append(
-            {
-                "type": asset_type,
-                "condition": condition,
-                "value": float(cfg["cost"]),
-                "efficiency": efficiency,
-                "tier": tier[0],
-                "tier_income": tier[1],
-                "tier_decay": tier[2],
-                "color": tier[3],
-                "broken": broken,
-            }
-        )
+            efficiency = 0.4 + 0.2 * self.rng.random()
+
+        if self.n == len(self.condition):
+            self._grow()
+        i = self.n
+        self.type_id[i] = self.type_ids[asset_type]
+        self.owner_id[i] = oid
+        self.tier_id[i] = self.tier_ids[tier[0]]
+        self.condition[i] = condition
+        self.efficiency[i] = efficiency
+        self.tier_income[i] = tier[1]
+        self.tier_decay[i] = tier[2]
+        self.value[i] = float(cfg["cost"])
+        self.broken[i] = broken
+        self.n += 1
+        self._account(i, 1)
         return True, cfg["cost"], broken
 
+    def scrap_one(self, owner="player", asset_type=None):
+        self.ensure_owner(owner)
+        rows = self._owner_rows(owner)
+        if asset_type:
+            type_id = self.type_ids.get(asset_type)
+            rows = rows[self.type_id[rows] == type_id]
+        if not len(rows):
+            return 0
+        i = int(rows[0])
+        value = float(self.value[i])
+        self._account(i, -1)
+        mask = np.ones(self.n, dtype=bool)
+        mask[i] = False
+        self._keep(mask)
+        return value * 0.4
+
+    # ------------------------------------------------------------
+    #  TICK
+    # ------------------------------------------------------------
+
     def tick(self, ticks_per_day=None):
         """
         Returns dicts: income_by_owner, decay_by_owner.
@@ -69,52 +322,182 @@ class AssetManager:
         if ticks_per_day is None:
             ticks_per_day = self.TICKS_PER_DAY
 
-        income = {}
-        decay_loss = {}
-        events = []
+        n = self.n
+        owners = len(self.owner_names)
+        type_id = self.type_id[:n]
+        owner_id = self.owner_id[:n]
+        condition = self.condition[:n]
+        value = self.value[:n]
 
-        for owner, items in list(self.assets.items()):
-            keep = []
-            owner_income = 0.0
-            owner_decay = 0.0
-            for asset in items:
-                cfg = self.ASSET_TYPES[asset["type"]]
-                # income scales with condition, efficiency, tier bonus
-                owner_income += (cfg["income_per_day"] / ticks_per_day) * asset["condition"] * asset["efficiency"] * asset["tier_income"]
+        # income scales with condition, efficiency, tier bonus
+        earned = (self.type_income[type_id] / ticks_per_day) * condition * self.efficiency[:n] * self.tier_income[:n]
+        income = np.bincount(owner_id, weights=earned, minlength=owners)
 
-                asset["condition"] *= (1.0 - cfg["decay"] * asset["tier_decay"])
-                asset["condition"] = max(0.0, asset["condition"])
+        condition *= (1.0 - self.type_decay[type_id] * self.tier_decay[:n])
+        np.maximum(condition, 0.0, out=condition)
 
-                new_value = cfg["cost"] * asset["condition"]
-                owner_decay += max(0.0, asset["value"] - new_value)
-                asset["value"] = new_value
+        new_value = self.type_cost[type_id] * condition
+        decay_loss = np.bincount(owner_id, weights=np.maximum(0.0, value - new_value), minlength=owners)
+        value[:] = new_value
 
-                if asset["condition"] > 0.1 and asset["value"] > 100:
-                    keep.append(asset)
+        self._prune((condition > self.MIN_CONDITION) & (value > self.MIN_VALUE))
+        self._refresh_condition_aggregates()
 
-            self.assets[owner] = keep
-            income[owner] = owner_income
-            decay_loss[owner] = owner_decay
+        names = self.owner_names
+        return (
+            dict(zip(names, income.tolist())),
+            dict(zip(names, decay_loss.tolist())),
+            [],
+        )
 
-        return income, decay_loss, events
+    # ------------------------------------------------------------
+    #  FAST-FORWARD (closed form)
+    # ------------------------------------------------------------
+    # Per tick, condition *= r with r = 1 - decay * tier_decay, so after
+    # k ticks condition = c0 * r**k. Income is proportional to the
+    # condition at the start of each tick: a geometric series. An asset
+    # is scrapped after the first tick that leaves it at or below
+    # max(MIN_CONDITION, MIN_VALUE / cost).
 
-    def scrap_one(self, owner="player", asset_type=None):
-        self.ensure_owner(owner)
-        if not self.assets[owner]:
-            return 0
-        if asset_type:
-            pool = [a for a in self.assets[owner] if a["type"] == asset_type]
-            if not pool:
-                return 0
-            asset = pool[0]
-            self.assets[owner].remove(asset)
-        else:
-            asset = self.assets[owner].pop(0)
-        return asset["value"] * 0.4
+    def _decay_factors(self):
+        n = self.n
+        type_id = self.type_id[:n]
+        log_r = np.log1p(-self.type_decay[type_id] * self.tier_decay[:n])
+        floor = np.maximum(self.MIN_CONDITION, self.MIN_VALUE / self.type_cost[type_id])
+        return type_id, log_r, floor
+
+    def scrap_ticks(self):
+        """
+        Per asset (ledger row order): ticks from now until tick() would
+        scrap it; NEVER_SCRAPPED for an asset above the floor that does
+        not decay (decay 0).
+        """
+        _, log_r, floor = self._decay_factors()
+        condition = self.condition[:self.n]
+        decays = log_r < 0
+        k = np.where(condition > floor, self.NEVER_SCRAPPED, 1)
+        with np.errstate(divide="ignore"):
+            steps = np.ceil(np.log(floor[decays] / condition[decays]) / log_r[decays])
+        k[decays] = np.maximum(1, steps)
+        return k.astype(np.int64)
+
+    def fast_forward(self, n_ticks, ticks_per_day=None):
+        """
+        Same result as calling tick() n_ticks times, without iterating.
+        Returns (income_by_owner, decay_by_owner, events) summed over the span.
+        """
+        if ticks_per_day is None:
+            ticks_per_day = self.TICKS_PER_DAY
+        n_ticks = int(n_ticks)
+        if n_ticks <= 0 or self.n == 0:
+            names = self.owner_names
+            return dict.fromkeys(names, 0.0), dict.fromkeys(names, 0.0), []
+
+        n = self.n
+        owners = len(self.owner_names)
+        owner_id = self.owner_id[:n]
+        condition = self.condition[:n]
+        value = self.value[:n]
+        type_id, log_r, _ = self._decay_factors()
+        scrap_at = self.scrap_ticks()
+
+        # Ticks each asset lives through (it still earns on its scrap tick)
+        m = np.minimum(scrap_at, n_ticks)
+        r_m = np.exp(m * log_r)
+        # sum_{k<m} r**k = (1 - r**m) / (1 - r), or m when r == 1 (no decay)
+        with np.errstate(invalid="ignore"):
+            series = np.where(log_r < 0, -np.expm1(m * log_r) / -np.expm1(log_r), m)
+        base = (self.type_income[type_id] / ticks_per_day) * condition * self.efficiency[:n] * self.tier_income[:n]
+        income = np.bincount(owner_id, weights=base * series, minlength=owners)
+
+        condition *= r_m
+        new_value = self.type_cost[type_id] * condition
+        decay_loss = np.bincount(owner_id, weights=np.maximum(0.0, value - new_value), minlength=owners)
+        value[:] = new_value
+
+        self._prune(scrap_at > n_ticks)
+        self._refresh_condition_aggregates()
+
+        names = self.owner_names
+        return (
+            dict(zip(names, income.tolist())),
+            dict(zip(names, decay_loss.tolist())),
+            [],
+        )
+
+    # ------------------------------------------------------------
+    #  STATE (save / load)
+    # ------------------------------------------------------------
+
+    def get_state(self):
+        """Owner registry, type / tier names and the live ledger columns."""
+        return {
+            "owner_names": list(self.owner_names),
+            "type_names": list(self.type_names),
+            "tier_names": [tier[0] for tier in self.QUALITY_TIERS],
+            "columns": {name: getattr(self, name)[:self.n].copy() for name in self.COLUMNS},
+        }
+
+    def set_state(self, state):
+        """Restore get_state(); type and tier ids are remapped by name."""
+        self.owner_ids = {}
+        self.owner_names = []
+        self._init_aggregates(8)
+        for owner in state["owner_names"]:
+            self.ensure_owner(owner)
+
+        columns = state["columns"]
+        n = len(columns["condition"])
+        capacity = max(256, n)
+        for name, dtype in self.COLUMNS.items():
+            col = np.zeros(capacity, dtype=dtype)
+            col[:n] = columns[name]
+            setattr(self, name, col)
+        self.n = n
+        type_map = np.array([self.type_ids[name] for name in state["type_names"]], dtype=np.int16)
+        tier_map = np.array([self.tier_ids[name] for name in state["tier_names"]], dtype=np.int8)
+        self.type_id[:n] = type_map[self.type_id[:n]]
+        self.tier_id[:n] = tier_map[self.tier_id[:n]]
+        self._recount()
+        self._refresh_condition_aggregates()
+
+    # ------------------------------------------------------------
+    #  READS
+    # ------------------------------------------------------------
 
     def total_value(self, owner="player"):
-        self.ensure_owner(owner)
-        return sum(a["value"] for a in self.assets.get(owner, []))
+        oid = self.ensure_owner(owner)
+        return float(self.owner_value[oid])
+
+    def boost_sum(self, owner="player"):
+        """Sum of boost * condition over the owner's assets."""
+        oid = self.ensure_owner(owner)
+        return float(self.owner_boost[oid])
+
+    def income_per_day(self, owner="player"):
+        """What the owner's assets earn per day at their current condition."""
+        oid = self.ensure_owner(owner)
+        return float(self.owner_income[oid])
+
+    def summary(self, owner="player"):
+        """
+        Per-type buckets for the owner's assets:
+        {type: {"count", "avg_cond" (%), "income" (per day), "tiers": {tier: n}}}
+        """
+        oid = self.owner_ids.get(owner)
+        if oid is None:
+            return {}
+        tiers = [tier[0] for tier in self.QUALITY_TIERS]
+        out = {}
+        for t in np.flatnonzero(self.type_count[oid]).tolist():
+            count = int(self.type_count[oid, t])
+            out[self.type_names[t]] = {
+                "count": count,
+                "avg_cond": float(self.type_condition[oid, t]) / count * 100,
+                "income": float(self.type_income_day[oid, t]),
+                "tiers": {tiers[k]: int(c) for k, c in enumerate(self.tier_count[oid, t].tolist()) if c},
+            }
+        return out
 
     def ceo_rating(self, cash, portfolio_value, owner="player", disruption=0.0, trend=0.0):
         base = cash + portfolio_value + self.total_value(owner)
@@ -127,7 +510,7 @@ class AssetManager:
 
     def snapshot(self, owner="player"):
         self.ensure_owner(owner)
-        return list(self.assets.get(owner, []))
+        return [self._asset_dict(i) for i in self._owner_rows(owner).tolist()]
 
     def random_ai_pick(self, ai_owner, budget):
         self.ensure_owner(ai_owner)
@@ -137,5 +520,5 @@ class AssetManager:
         # Randomly choose among affordable, bias to mid-cost
         affordable.sort(key=lambda k: self.ASSET_TYPES[k]["cost"])
         mid = affordable[len(affordable) // 2]
-        choice = random.choice(affordable + [mid])  # mid appears twice for slight bias
+        choice = self.rng.choice(affordable + [mid])  # mid appears twice for slight bias
         return choice
@@ -0,0 +1,118 @@
+"""
+Candle Aggregator
+-----------------
+Incremental multi-resolution OHLC for every company at once.
+
+Resolutions:
+- tick:    one bar per tick (open = price before the move)
+- hour:    24 per simulated day
+- day:     the classic daily candle
+- quarter: aggregated from real prices (no synthesized wicks)
+
+Each tick costs O(1) per company per resolution: the forming bars take
+the new price into high/low/close, and a bar is pushed into its
+CandleStore only when its period ends. Reading any resolution is a
+window() on the matching store, never a re-scan of history.
+"""
+
+import numpy as np
+
+from core.candle_store import CandleSeries, CandleStore, OPEN, HIGH, LOW, CLOSE
+
+RESOLUTIONS = ("tick", "hour", "day", "quarter")
+HOURS_PER_DAY = 24
+
+
+class CandleAggregator:
+    """
+    Forming bars are (4, n) arrays (rows OPEN/HIGH/LOW/CLOSE) per resolution;
+    finished bars go to self.stores[resolution].
+    """
+
+    DEFAULT_DEPTHS = {"tick": 256, "hour": 240}
+
+    def __init__(self, companies, prices, depths=None):
+        depths = dict(self.DEFAULT_DEPTHS, **(depths or {}))
+        n = len(companies)
+        self.stores = {
+            "tick": CandleStore(n, depths["tick"]),
+            "hour": CandleStore(n, depths["hour"]),
+            # Existing day/quarter history moves into bulk stores (handles stay valid)
+            "day": CandleStore.pack([c.daily_candles for c in companies], depths.get("day")),
+            "quarter": CandleStore.pack([c.quarterly_candles for c in companies], depths.get("quarter")),
+        }
+        self.forming = {res: np.tile(prices, (4, 1)) for res in ("hour", "day", "quarter")}
+        self.hour = 0
+
+        for i, c in enumerate(companies):
+            c.tick_candles = CandleSeries(self.stores["tick"], i)
+            c.hourly_candles = CandleSeries(self.stores["hour"], i)
+
+    # ------------------------------------------------------------
+    #  PER-TICK UPDATE
+    # ------------------------------------------------------------
+
+    def update(self, prev_prices, prices):
+        """Fold one tick of prices into every resolution."""
+        self.stores["tick"].append_all(
+            prev_prices, np.maximum(prev_prices, prices), np.minimum(prev_prices, prices), prices
+        )
+        for bar in self.forming.values():
+            np.maximum(bar[HIGH], prices, out=bar[HIGH])
+            np.minimum(bar[LOW], prices, out=bar[LOW])
+            np.copyto(bar[CLOSE], prices)
+
+    def advance_clock(self, ticks_today, ticks_per_day, prices):
+        """Close the hourly bar when the intraday hour changes."""
+        hour = ticks_today * HOURS_PER_DAY // ticks_per_day
+        if hour != self.hour:
+            self.close("hour", prices)
+            self.hour = hour % HOURS_PER_DAY
+
+    def close(self, resolution, prices):
+        """Push the forming bar of `resolution` to its store and start a new one at `prices`."""
+        bar = self.forming[resolution]
+        self.stores[resolution].append_all(*np.round(bar, 2))
+        bar[:] = prices
+
+    # ------------------------------------------------------------
+    #  SINGLE-COMPANY RESET
+    # ------------------------------------------------------------
+
+    def reset_row(self, row, price):
+        """Restart intraday series for one company (e.g. after a respawn)."""
+        for bar in self.forming.values():
+            bar[:, row] = price
+        self.stores["tick"].clear(row)
+        self.stores["hour"].clear(row)
+
+    # ------------------------------------------------------------
+    #  STATE (save / load)
+    # ------------------------------------------------------------
+
+    def get_state(self):
+        return {
+            "stores": {res: store.get_state() for res, store in self.stores.items()},
+            "forming": {res: bar.copy() for res, bar in self.forming.items()},
+            "hour": self.hour,
+        }
+
+    def set_state(self, state):
+        for res, store_state in state["stores"].items():
+            self.stores[res].set_state(store_state)
+        # Copied in place: the market's open/high/low/close are views of forming["day"]
+        for res, bar in state["forming"].items():
+            np.copyto(self.forming[res], bar)
+        self.hour = int(state["hour"])
+
+    # ------------------------------------------------------------
+    #  READS
+    # ------------------------------------------------------------
+
+    def forming_bar(self, resolution, row):
+        """Current (o, h, l, c) of one company's forming bar ('tick' has none)."""
+        bar = self.forming[resolution]
+        return tuple(float(bar[k, row]) for k in (OPEN, HIGH, LOW, CLOSE))
+
+    def window(self, resolution, row, n=None):
+        return self.stores[resolution].window(row, n)
@@ -0,0 +1,215 @@
+"""
+Candle Store
+------------
+Fixed-capacity, array-backed OHLC ring buffers.
+
+- CandleStore: many series (rows) in one float64 array, O(1) append per
+  row and a vectorized append for all rows at once.
+- CandleSeries: list-like handle for one row (what Company.daily_candles
+  and Company.quarterly_candles are).
+
+Each row is stored twice back to back (slot i and i + capacity), so the
+newest N candles are always one contiguous slice: window() returns a
+zero-copy NumPy view instead of copying a list.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+OPEN, HIGH, LOW, CLOSE = range(4)
+
+
+@dataclass
+class Candle:
+    """Represents a single OHLC candle."""
+    open: float
+    high: float
+    low: float
+    close: float
+
+
+class CandleStore:
+    """OHLC ring buffers for `rows` series with `capacity` candles each."""
+
+    def __init__(self, rows, capacity):
+        self.capacity = int(capacity)
+        self.data = np.zeros((rows, 2 * self.capacity, 4), dtype=np.float64)
+        self.head = np.zeros(rows, dtype=np.int64)   # next write slot (0..capacity-1)
+        self.count = np.zeros(rows, dtype=np.int64)  # valid candles (<= capacity)
+
+    @property
+    def rows(self):
+        return self.data.shape[0]
+
+    # ------------------------------------------------------------
+    #  WRITES
+    # ------------------------------------------------------------
+
+    def append(self, row, open_p, high_p, low_p, close_p):
+        """O(1) append for one row."""
+        h = self.head[row]
+        bar = (open_p, high_p, low_p, close_p)
+        self.data[row, h] = bar
+        self.data[row, h + self.capacity] = bar
+        self.head[row] = (h + 1) % self.capacity
+        if self.count[row] < self.capacity:
+            self.count[row] += 1
+
+    def append_all(self, open_p, high_p, low_p, close_p):
+        """Append one candle to every row (arrays of length `rows`)."""
+        idx = np.arange(self.rows)
+        bars = np.stack((open_p, high_p, low_p, close_p), axis=1)
+        self.data[idx, self.head] = bars
+        self.data[idx, self.head + self.capacity] = bars
+        self.head += 1
+        self.head %= self.capacity
+        np.minimum(self.count + 1, self.capacity, out=self.count)
+
+    def fill(self, row, bars):
+        """Replace one row with `bars` ((k, 4), oldest first; only the newest `capacity` kept)."""
+        bars = np.asarray(bars, dtype=np.float64)[-self.capacity:]
+        k = len(bars)
+        self.data[row, :k] = bars
+        self.data[row, self.capacity:self.capacity + k] = bars
+        self.head[row] = k % self.capacity
+        self.count[row] = k
+
+    def clear(self, row):
+        self.head[row] = 0
+        self.count[row] = 0
+
+    # ------------------------------------------------------------
+    #  READS
+    # ------------------------------------------------------------
+
+    def window(self, row, n=None):
+        """Newest n candles of one row as a zero-copy (n, 4) view, oldest first."""
+        count = int(self.count[row])
+        n = count if n is None else min(int(n), count)
+        end = int(self.head[row]) + self.capacity
+        return self.data[row, end - n:end]
+
+    def window_all(self, n):
+        """
+        Newest n candles of every row as an array (rows, n, 4).
+        Zero-copy when all rows share the same write position.
+        """
+        n = min(int(n), int(self.count.min()) if self.rows else 0)
+        heads = self.head
+        if self.rows and (heads == heads[0]).all():
+            end = int(heads[0]) + self.capacity
+            return self.data[:, end - n:end]
+        offsets = np.arange(-n, 0)
+        cols = heads[:, None] + self.capacity + offsets[None, :]
+        return self.data[np.arange(self.rows)[:, None], cols]
+
+    def last(self, field=CLOSE, back=0):
+        """Value of `field` `back` candles before the newest, every row (undefined if count <= back)."""
+        return self.data[np.arange(self.rows), self.head + self.capacity - 1 - back, field]
+
+    # ------------------------------------------------------------
+    #  STATE (save / load)
+    # ------------------------------------------------------------
+
+    def get_state(self):
+        """Arrays for a save (one copy of each row; the mirror is rebuilt on load)."""
+        return {
+            "data": self.data[:, :self.capacity].copy(),
+            "head": self.head.copy(),
+            "count": self.count.copy(),
+        }
+
+    def set_state(self, state):
+        """Restore get_state() in place (handles on this store stay valid)."""
+        data = np.asarray(state["data"], dtype=np.float64)
+        self.capacity = data.shape[1]
+        self.data = np.concatenate((data, data), axis=1)
+        self.head = np.asarray(state["head"], dtype=np.int64).copy()
+        self.count = np.asarray(state["count"], dtype=np.int64).copy()
+
+    # ------------------------------------------------------------
+    #  PACKING
+    # ------------------------------------------------------------
+
+    @classmethod
+    def from_bars(cls, bars, capacity=None):
+        """Store whose rows start with `bars` (rows, k, 4), oldest first."""
+        bars = np.asarray(bars, dtype=np.float64)
+        rows, k = bars.shape[:2]
+        store = cls(rows, k if capacity is None else capacity)
+        k = min(k, store.capacity)
+        store.data[:, :k] = bars[:, -k:]
+        store.data[:, store.capacity:store.capacity + k] = bars[:, -k:]
+        store.head[:] = k % store.capacity
+        store.count[:] = k
+        return store
+
+    @classmethod
+    def pack(cls, series_list, capacity=None):
+        """
+        Move several CandleSeries into one bulk store (row i = series i)
+        and rebind each handle, so existing references keep working.
+        Series that already are rows 0..n-1 of one store (in order, same
+        capacity) keep that store as is.
+        """
+        if capacity is None:
+            capacity = max((s.store.capacity for s in series_list), default=1)
+        first = series_list[0].store if series_list else None
+        if (first is not None and first.rows == len(series_list) and first.capacity == capacity
+                and all(s.store is first and s.row == row for row, s in enumerate(series_list))):
+            return first
+        store = cls(len(series_list), capacity)
+        for row, series in enumerate(series_list):
+            store.fill(row, series.window())
+            series.store = store
+            series.row = row
+        return store
+
+
+class CandleSeries:
+    """
+    List-like view of one CandleStore row.
+    Supports len(), indexing (returns Candle), iteration, append(Candle)
+    and clear(); window() gives the raw (n, 4) array for charts/indicators.
+    """
+
+    def __init__(self, store, row=0):
+        self.store = store
+        self.row = row
+
+    @classmethod
+    def standalone(cls, capacity):
+        return cls(CandleStore(1, capacity), 0)
+
+    @property
+    def capacity(self):
+        return self.store.capacity
+
+    def __len__(self):
+        return int(self.store.count[self.row])
+
+    def __bool__(self):
+        return bool(self.store.count[self.row] > 0)
+
+    def __getitem__(self, index):
+        bars = self.window()
+        if isinstance(index, slice):
+            return [Candle(*map(float, bar)) for bar in bars[index]]
+        return Candle(*map(float, bars[index]))
+
+    def __iter__(self):
+        for bar in self.window():
+            yield Candle(*map(float, bar))
+
+    def append(self, candle):
+        self.store.append(self.row, candle.open, candle.high, candle.low, candle.close)
+
+    def clear(self):
+        self.store.clear(self.row)
+
+    def window(self, n=None):
+        return self.store.window(self.row, n)
+
+    def closes(self, n=None):
+        return self.window(n)[:, CLOSE]
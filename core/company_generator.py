@@ -10,11 +10,17 @@ Each company receives:
 - Volatility rating
 - AI count (5-20)
 - Placeholder logo
+
+Worlds above CLASSIC_MAX_COMPANIES go through generate_world(): names
+are built procedurally (collision-free, any count), prices, volatility,
+warm-up history and holders are drawn as arrays from numpy streams, and
+companies are held by an owner universe of procedurally named funds as
+well as by each other.
 """
 
 import random
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap
+
+import numpy as np
 
 from core.company_model import Company
 
@@ -52,6 +58,80 @@ COMPANY_NAME_BANK = [
 ]
 
 
+CLASSIC_MAX_COMPANIES = 20
+
+
+# ------------------------------------------------------------
+#  PROCEDURAL NAMES (large worlds)
+# ------------------------------------------------------------
+# Names are picked as distinct indices into the product of the part
+# banks, so they never collide. Past the number of combinations a
+# numbered series starts ("Nova Robotics Group 2"), still unique.
+
+COMPANY_NAME_PARTS = (
+    [
+        "Solar", "Astra", "Nova", "Orbit", "Helio", "Quantum", "Stellar", "Ion",
+        "Vector", "Zenith", "Cosmo", "Lumen", "Astro", "Nebula", "Photon", "Titan",
+        "Vertex", "Horizon", "Meridian", "Pulsar", "Quasar", "Radiant", "Polaris", "Sirius",
+        "Vega", "Orion", "Lyra", "Cygnus", "Draco", "Aether", "Graviton", "Flux",
+        "Axion", "Kepler", "Halley", "Celest", "Nadir", "Equinox", "Obsidian", "Starforge",
+    ],
+    [
+        "Dynamics", "Robotics", "Logistics", "Analytics", "Mining", "Systems", "Industries",
+        "Extraction", "Freight", "Automation", "Technologies", "Resources", "Labs",
+        "Engineering", "Mechanics", "Energy", "Fabrication", "Ventures", "Materials",
+        "Propulsion", "Orbital", "Refining", "Networks", "Forge", "Salvage", "Cargo",
+        "Metals", "Optics", "Reactors", "Drydocks",
+    ],
+    ["", "Corp", "Group", "Co.", "Inc.", "Consolidated", "Collective", "Works", "Syndicate", "Alliance", "Union", "Interstellar"],
+)
+
+OWNER_NAME_PARTS = (
+    [
+        "Apex", "Hyperion", "Solstice", "Momentum", "Cosmic", "Prime", "Helios", "Unified",
+        "Ascendant", "Constellation", "CrestGate", "Northstar", "Lumina", "Summit", "Keystone",
+        "Sentinel", "Beacon", "Aurora", "Gemini", "Corona", "Meteor", "Comet", "Eclipse",
+        "Parallax", "Perihelion", "Trident", "Bastion", "Citadel", "Harbor", "Frontier",
+    ],
+    [
+        "Equity", "Securities", "Capital", "Yield", "Trust", "Arbitrage", "Charter", "Wealth",
+        "Bridge", "Market", "Asset", "Credit", "Pension", "Sovereign", "Reserve",
+    ],
+    ["Group", "Holdings", "Fund", "Partners", "Management", "Advisors", "Financial", "Authority", "Investments", "Markets", "Syndicate", "Trustees"],
+)
+
+
+def procedural_names(count, parts, gen, reserved=()):
+    """
+    `count` distinct names from the word banks in `parts` (one word from
+    each, empty words skipped), in random order. `gen` is a numpy
+    Generator; names in `reserved` are never returned.
+    """
+    reserved = set(reserved)
+    sizes = [len(bank) for bank in parts]
+    combos = int(np.prod(sizes))
+    wanted = count + len(reserved)
+    series = -(-wanted // combos)  # ceil: numbered series needed on top of the plain names
+    picks = gen.choice(combos * series, wanted, replace=False) if wanted else np.zeros(0, dtype=np.int64)
+
+    names = []
+    for pick in picks.tolist():
+        number, idx = divmod(pick, combos)
+        words = []
+        for bank, size in zip(reversed(parts), reversed(sizes)):
+            idx, k = divmod(idx, size)
+            words.append(bank[k])
+        name = " ".join(w for w in reversed(words) if w)
+        if number:
+            name = f"{name} {number + 1}"
+        if name in reserved:
+            continue
+        names.append(name)
+        if len(names) == count:
+            break
+    return names
+
+
 # ------------------------------------------------------------
 #  SECTOR BANK
 # ------------------------------------------------------------
@@ -72,50 +152,72 @@ SECTORS = [
 # ------------------------------------------------------------
 
 def generate_placeholder_logo():
-    """Returns a small placeholder 48x48 pixmap."""
+    """Returns a small placeholder 48x48 pixmap (needs a running QApplication)."""
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QPixmap
+
     pix = QPixmap(48, 48)
     pix.fill(Qt.GlobalColor.darkGray)
     return pix
 
 
+# ------------------------------------------------------------
+#  DIFFICULTY
+# ------------------------------------------------------------
+
+def difficulty_ranges(difficulty):
+    """(price_range, vol_range) for a difficulty."""
+    if difficulty == "Easy":
+        return (15, 85), (0.4, 1.2)
+    if difficulty == "Hard":
+        return (30, 140), (1.0, 2.8)
+    return (20, 110), (0.8, 2.0)  # Medium
+
+
 # ------------------------------------------------------------
 #  MAIN GENERATOR FUNCTION
 # ------------------------------------------------------------
 
-def generate_companies(count, difficulty="Medium", player_company_name=None):
-    """Creates N companies with parameters tuned for difficulty."""
-    count = max(5, min(count, 20))  # clamp 5-20
+def generate_companies(count, difficulty="Medium", player_company_name=None, with_logos=True, rng=None):
+    """
+    Creates N companies with parameters tuned for difficulty.
+    Pass with_logos=False for headless runs (no Qt pixmaps).
+    rng: optional RngService; each company then gets its own stream.
+    Counts above CLASSIC_MAX_COMPANIES build a large world (generate_world).
+    """
+    if count > CLASSIC_MAX_COMPANIES:
+        return generate_world(count, difficulty, player_company_name, with_logos=with_logos, rng=rng)
+
+    world_rng = rng.stream("world") if rng is not None else random
+
+    def company_rng(name):
+        return rng.company_stream(name) if rng is not None else None
+
+    count = max(5, count)  # at least 5
 
     # Difficulty affects average volatility
-    if difficulty == "Easy":
-        vol_range = (0.4, 1.2)
-        price_range = (15, 85)
-    elif difficulty == "Hard":
-        vol_range = (1.0, 2.8)
-        price_range = (30, 140)
-    else:  # Medium
-        vol_range = (0.8, 2.0)
-        price_range = (20, 110)
+    price_range, vol_range = difficulty_ranges(difficulty)
 
     # AI competitor count should mirror total companies (player adds separately)
     ai_count = count
 
-    chosen_names = random.sample(COMPANY_NAME_BANK, count)
+    chosen_names = world_rng.sample(COMPANY_NAME_BANK, count)
     companies = []
 
     # Player company if provided
     if player_company_name:
-        sector = random.choice(SECTORS)
-        price = round(random.uniform(*price_range), 2)
-        vol = round(random.uniform(*vol_range), 2)
+        sector = world_rng.choice(SECTORS)
+        price = round(world_rng.uniform(*price_range), 2)
+        vol = round(world_rng.uniform(*vol_range), 2)
         player_co = Company(
             name=player_company_name,
             base_price=price,
             volatility=vol,
             sector=sector,
-            logo=generate_placeholder_logo(),
+            logo=generate_placeholder_logo() if with_logos else None,
             ai_count=ai_count,
             is_player=True,
+            rng=company_rng(player_company_name),
         )
         # Give CEO starter stake (10%)
         starter = int(player_co.total_shares * 0.10)
@@ -124,17 +226,18 @@ def generate_companies(count, difficulty="Medium", player_company_name=None):
         companies.append(player_co)
 
     for name in chosen_names:
-        sector = random.choice(SECTORS)
-        price = round(random.uniform(*price_range), 2)
-        vol = round(random.uniform(*vol_range), 2)
+        sector = world_rng.choice(SECTORS)
+        price = round(world_rng.uniform(*price_range), 2)
+        vol = round(world_rng.uniform(*vol_range), 2)
 
         company = Company(
             name=name,
             base_price=price,
             volatility=vol,
             sector=sector,
-            logo=generate_placeholder_logo(),
+            logo=generate_placeholder_logo() if with_logos else None,
             ai_count=ai_count,
+            rng=company_rng(name),
         )
         # Give AI CEO starter stake (10%)
         starter = int(company.total_shares * 0.10)
@@ -144,3 +247,89 @@ def generate_companies(count, difficulty="Medium", player_company_name=None):
         companies.append(company)
 
     return companies
+
+
+# ------------------------------------------------------------
+#  LARGE WORLDS
+# ------------------------------------------------------------
+
+def generate_world(count, difficulty="Medium", player_company_name=None, owners=None, holders=5,
+                   with_logos=False, rng=None):
+    """
+    Large-world generator: `count` AI companies (plus the player's) built
+    in bulk. Same starting stakes as generate_companies() (10% player /
+    CEO); on top of that every company gets `holders` holders drawn from
+    the other companies and an owner universe of `owners` funds
+    (default: one per company).
+
+    Companies come back with their holders already set: pass
+    seed_holders=False to MarketSimulation (new_world does).
+    """
+    if rng is None:
+        from core.rng import RngService
+        rng = RngService()
+    gen = rng.np_stream("world/large")
+    count = max(1, int(count))
+    owners = count if owners is None else max(0, int(owners))
+
+    reserved = [player_company_name] if player_company_name else []
+    names = reserved + procedural_names(count, COMPANY_NAME_PARTS, gen, reserved=reserved)
+    n = len(names)
+    fund_names = procedural_names(owners, OWNER_NAME_PARTS, gen, reserved=names)
+
+    price_range, vol_range = difficulty_ranges(difficulty)
+    prices = np.round(gen.uniform(*price_range, n), 2)
+    vols = np.round(gen.uniform(*vol_range, n), 2)
+    sectors = gen.integers(0, len(SECTORS), n)
+
+    companies = []
+    for i, name in enumerate(names):
+        is_player = bool(player_company_name) and i == 0
+        companies.append(Company(
+            name=name,
+            base_price=float(prices[i]),
+            volatility=float(vols[i]),
+            sector=SECTORS[sectors[i]],
+            logo=generate_placeholder_logo() if with_logos else None,
+            is_player=is_player,
+            warm_up=False,
+        ))
+
+    Company.generate_initial_histories(companies, gen)
+    _assign_world_holders(companies, fund_names, holders, gen)
+    return companies
+
+
+def _assign_world_holders(companies, fund_names, holders, gen):
+    """Starter stakes plus `holders` holders per company from companies + funds, drawn as arrays."""
+    n = len(companies)
+    universe = [c.name for c in companies] + list(fund_names)
+    total = Company.TOTAL_SHARES
+    starter = int(total * 0.10)
+    holders = min(holders, len(universe) - 1)
+
+    if holders > 0:
+        # Offsets 1.. from the company's own index never pick itself;
+        # duplicates within a row just merge into one stake
+        picks = (np.arange(n)[:, None] + gen.integers(1, len(universe), (n, holders))) % len(universe)
+        stakes = gen.integers(1, max(2, int(total * 0.05)) + 1, (n, holders))
+    else:
+        picks = stakes = np.zeros((n, 0), dtype=np.int64)
+
+    for c, row_picks, row_stakes in zip(companies, picks.tolist(), stakes.tolist()):
+        owners = {}
+        if c.is_player:
+            c.player_shares = starter
+        else:
+            c.player_shares = 0
+            owners["CEO"] = starter
+        remaining = total - starter
+        for j, give in zip(row_picks, row_stakes):
+            if remaining <= 0:
+                break
+            give = min(give, remaining)
+            name = universe[j]
+            owners[name] = owners.get(name, 0) + give
+            remaining -= give
+        c.ai_owners = owners
+        c.public_float = remaining
@@ -1,5 +1,9 @@
 import random
-from dataclasses import dataclass
+
+import numpy as np
+
+from core.candle_store import Candle, CandleSeries, CandleStore  # noqa: F401  (Candle re-exported)
+from core.holdings import HoldingsView
 
 
 # ------------------------------------------------------------
@@ -21,16 +25,47 @@ AI_NAME_BANK = [
 
 
 # ------------------------------------------------------------
-#  DATA STRUCTURES
+#  MARKET-BACKED FIELDS
 # ------------------------------------------------------------
 
-@dataclass
-class Candle:
-    """Represents a single OHLC candle."""
-    open: float
-    high: float
-    low: float
-    close: float
+class MarketField:
+    """
+    Company attribute that lives on the instance until the company is
+    bound to a MarketPriceEngine, then reads/writes market.<array>[slot].
+    """
+
+    store_attr = "_market"
+    slot_attr = "_slot"
+    cast = float
+
+    def __init__(self, array_name):
+        self.array_name = array_name
+
+    def __set_name__(self, owner, name):
+        self.local_name = "_" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        store = getattr(obj, self.store_attr)
+        if store is None:
+            return obj.__dict__[self.local_name]
+        return self.cast(getattr(store, self.array_name)[getattr(obj, self.slot_attr)])
+
+    def __set__(self, obj, value):
+        store = getattr(obj, self.store_attr)
+        if store is None:
+            obj.__dict__[self.local_name] = value
+        else:
+            getattr(store, self.array_name)[getattr(obj, self.slot_attr)] = value
+
+
+class HoldingsField(MarketField):
+    """Same, backed by a HoldingsStore row (share counts)."""
+
+    store_attr = "_holdings"
+    slot_attr = "_holdings_row"
+    cast = int
 
 
 # ------------------------------------------------------------
@@ -48,9 +83,32 @@ class Company:
     """
 
     TOTAL_SHARES = 10000  # Fixed supply for now
-
-    def __init__(self, name, base_price, volatility, sector, logo=None, ai_count=10, is_player=False):
+    DAILY_HISTORY_DEPTH = 365     # ring-buffer capacity (candles kept)
+    QUARTERLY_HISTORY_DEPTH = 120
+
+    # Price + forming candle move into MarketPriceEngine arrays once bound
+    price = MarketField("price")
+    current_open = MarketField("open")
+    current_high = MarketField("high")
+    current_low = MarketField("low")
+    current_close = MarketField("close")
+
+    # Share counts move into a HoldingsStore once bound
+    player_shares = HoldingsField("player")
+    public_float = HoldingsField("public_float")
+
+    _market = None
+    _slot = -1
+    _holdings = None
+    _holdings_row = -1
+    # Intraday series, attached by the market's CandleAggregator
+    tick_candles = None
+    hourly_candles = None
+
+    def __init__(self, name, base_price, volatility, sector, logo=None, ai_count=10, is_player=False, rng=None, warm_up=True):
         self.name = name
+        # Per-company random stream (owner assignment, warm-up history)
+        self.rng = rng if rng is not None else random
         self.sector = sector
         self.logo = logo
         self.is_player = is_player
@@ -62,12 +120,12 @@ class Company:
 
         # Ownership fields
         self.player_shares = 0
-        self.ai_owners: dict[str, int] = {}  # { "AI Name": shares }
+        self.ai_owners = {}  # { "AI Name": shares } (HoldingsView once bound)
         self.public_float = 0
 
-        # Candle containers
-        self.daily_candles: list[Candle] = []
-        self.quarterly_candles: list[Candle] = []
+        # Candle containers (fixed-capacity ring buffers)
+        self.daily_candles = CandleSeries.standalone(self.DAILY_HISTORY_DEPTH)
+        self.quarterly_candles = CandleSeries.standalone(self.QUARTERLY_HISTORY_DEPTH)
 
         # Intra-day working candle
         self.current_open = self.price
@@ -75,13 +133,84 @@ class Company:
         self.current_low = self.price
         self.current_close = self.price
 
-        self.ticks_today = 0  # Counts 15-minute increments
+        self._ticks_today = 0  # Counts 15-minute increments
+
+        # warm_up=False skips owners + history (a save load fills them in)
+        if warm_up:
+            # Assign AI shareholders (scalable 5-20)
+            self.assign_ai_owners(ai_count)
 
-        # Assign AI shareholders (scalable 5-20)
-        self.assign_ai_owners(ai_count)
+            # Initialize history
+            self.generate_initial_history()
+
+    # ------------------------------------------------------------
+    #  MARKET BINDING
+    # ------------------------------------------------------------
 
-        # Initialize history
-        self.generate_initial_history()
+    def bind_market(self, market, slot):
+        """Hand price/candle storage over to a MarketPriceEngine row."""
+        market.price[slot] = self.price
+        market.open[slot] = self.current_open
+        market.high[slot] = self.current_high
+        market.low[slot] = self.current_low
+        market.close[slot] = self.current_close
+        self._market = market
+        self._slot = slot
+
+    def bind_holdings(self, store, row):
+        """Hand share counts over to a HoldingsStore row."""
+        store.player[row] = self.player_shares
+        store.public_float[row] = self.public_float
+        store.clear_row(row)
+        for name, shares in self._ai_owners.items():
+            store.set(row, name, shares)
+        self._holdings = store
+        self._holdings_row = row
+        self._ai_view = HoldingsView(store, row)
+
+    @property
+    def ai_owners(self):
+        """AI holders {name: shares}; a live HoldingsView once bound."""
+        if self._holdings is None:
+            return self._ai_owners
+        return self._ai_view
+
+    @ai_owners.setter
+    def ai_owners(self, owners):
+        owners = dict(owners)
+        if self._holdings is None:
+            self._ai_owners = owners
+            return
+        self._holdings.clear_row(self._holdings_row)
+        for name, shares in owners.items():
+            self._holdings.set(self._holdings_row, name, shares)
+
+    @property
+    def ai_shares(self):
+        """Total shares held by AIs (cached row total once bound)."""
+        if self._holdings is None:
+            return sum(self._ai_owners.values())
+        return int(self._holdings.ai_total[self._holdings_row])
+
+    def forming_candle(self, resolution="day"):
+        """(o, h, l, c) of the bar still forming at `resolution` ("hour"/"day"/"quarter")."""
+        if self._market is not None:
+            return self._market.candles.forming_bar(resolution, self._slot)
+        return (self.current_open, self.current_high, self.current_low, self.current_close)
+
+    @property
+    def ticks_today(self):
+        """Intraday tick counter (shared market clock once bound)."""
+        if self._market is None:
+            return self._ticks_today
+        return self._market.ticks_today
+
+    @ticks_today.setter
+    def ticks_today(self, value):
+        if self._market is None:
+            self._ticks_today = value
+        else:
+            self._market.ticks_today = value
 
     # ------------------------------------------------------------
     #  AI Ownership Assignment
@@ -91,12 +220,12 @@ class Company:
         """Distributes shares among a dynamic number of AI competitors."""
         ai_count = max(5, min(ai_count, 20))  # safety clamp
 
-        chosen_names = random.sample(AI_NAME_BANK, ai_count)
+        chosen_names = self.rng.sample(AI_NAME_BANK, ai_count)
 
         remaining = self.total_shares
 
         for ai in chosen_names:
-            shares = min(random.randint(0, 10), max(0, remaining))
+            shares = min(self.rng.randint(0, 10), max(0, remaining))
             self.ai_owners[ai] = shares
             remaining -= shares
             if remaining <= 0:
@@ -114,18 +243,18 @@ class Company:
         """Creates 30 daily + 30 quarterly candles for chart warm-up."""
         for _ in range(30):
             open_p = self.price
-            close_p = open_p + random.uniform(-self.volatility, self.volatility)
-            high_p = max(open_p, close_p) + random.uniform(0, self.volatility)
-            low_p = min(open_p, close_p) - random.uniform(0, self.volatility)
+            close_p = open_p + self.rng.uniform(-self.volatility, self.volatility)
+            high_p = max(open_p, close_p) + self.rng.uniform(0, self.volatility)
+            low_p = min(open_p, close_p) - self.rng.uniform(0, self.volatility)
 
             self.daily_candles.append(
                 Candle(round(open_p, 2), round(high_p, 2),
                        round(low_p, 2), round(close_p, 2))
             )
 
-            q_close = close_p + random.uniform(-self.volatility * 2, self.volatility * 2)
-            q_high = max(open_p, q_close) + random.uniform(0, self.volatility * 1.5)
-            q_low = min(open_p, q_close) - random.uniform(0, self.volatility * 1.5)
+            q_close = close_p + self.rng.uniform(-self.volatility * 2, self.volatility * 2)
+            q_high = max(open_p, q_close) + self.rng.uniform(0, self.volatility * 1.5)
+            q_low = min(open_p, q_close) - self.rng.uniform(0, self.volatility * 1.5)
 
             self.quarterly_candles.append(
                 Candle(round(open_p, 2), round(q_high, 2),
@@ -137,65 +266,33 @@ class Company:
         self.current_low = self.price
         self.current_close = self.price
 
-    # ------------------------------------------------------------
-    #  TICK UPDATE (15 MIN)
-    # ------------------------------------------------------------
-
-    def tick_price(self):
+    @classmethod
+    def generate_initial_histories(cls, companies, gen, days=30):
         """
-        Engine already sets the price. This updates the forming candle
-        without double-counting ticks.
+        Batched generate_initial_history() for many companies at once (same
+        candle rules, drawn as arrays from the numpy Generator `gen`).
+        Writes straight into one daily and one quarterly CandleStore and
+        rebinds each company's series to its row.
         """
-        self.current_close = self.price
-        self.current_high = max(self.current_high, self.price)
-        self.current_low = min(self.current_low, self.price)
-
-    # ------------------------------------------------------------
-    #  DAILY CANDLE FINALIZATION
-    # ------------------------------------------------------------
-
-    def finalize_daily_candle(self):
-        """When a simulated day passes, close the candle."""
-        candle = Candle(
-            round(self.current_open, 2),
-            round(self.current_high, 2),
-            round(self.current_low, 2),
-            round(self.current_close, 2),
-        )
-
-        self.daily_candles.append(candle)
-        if len(self.daily_candles) > 30:
-            self.daily_candles.pop(0)
-
-        self.current_open = self.price
-        self.current_high = self.price
-        self.current_low = self.price
-        self.current_close = self.price
-        self.ticks_today = 0
-
-    # ------------------------------------------------------------
-    #  QUARTERLY CANDLE FINALIZATION
-    # ------------------------------------------------------------
-
-    def finalize_quarterly_candle(self):
-        """After 90 days lock a new quarterly candle."""
-        open_p = self.quarterly_candles[-1].close
-        close_p = self.daily_candles[-1].close
-
-        high_p = max(open_p, close_p) + random.uniform(0, self.volatility * 1.0)
-        low_p = min(open_p, close_p) - random.uniform(0, self.volatility * 1.0)
-
-        q_candle = Candle(
-            round(open_p, 2),
-            round(high_p, 2),
-            round(low_p, 2),
-            round(close_p, 2),
-        )
-
-        self.quarterly_candles.append(q_candle)
-
-        if len(self.quarterly_candles) > 30:
-            self.quarterly_candles.pop(0)
+        n = len(companies)
+        price = np.array([c.price for c in companies])[:, None]
+        vol = np.array([c.volatility for c in companies])[:, None]
+        u = gen.random((6, n, days))
+
+        open_p = np.broadcast_to(price, (n, days))
+        close_p = open_p + (2 * u[0] - 1) * vol
+        high_p = np.maximum(open_p, close_p) + u[1] * vol
+        low_p = np.minimum(open_p, close_p) - u[2] * vol
+        q_close = close_p + (2 * u[3] - 1) * 2 * vol
+        q_high = np.maximum(open_p, q_close) + u[4] * 1.5 * vol
+        q_low = np.minimum(open_p, q_close) - u[5] * 1.5 * vol
+
+        daily = CandleStore.from_bars(np.round(np.stack((open_p, high_p, low_p, close_p), axis=2), 2), cls.DAILY_HISTORY_DEPTH)
+        quarterly = CandleStore.from_bars(np.round(np.stack((open_p, q_high, q_low, q_close), axis=2), 2), cls.QUARTERLY_HISTORY_DEPTH)
+        for row, c in enumerate(companies):
+            c.daily_candles = CandleSeries(daily, row)
+            c.quarterly_candles = CandleSeries(quarterly, row)
+        return daily, quarterly
 
     # ------------------------------------------------------------
     #  OWNERSHIP / SHARES
@@ -203,34 +300,5 @@ class Company:
 
     def update_public_float(self):
         """Recalculates float after ownership changes."""
-        owned = self.player_shares + sum(self.ai_owners.values())
+        owned = self.player_shares + self.ai_shares
         self.public_float = max(0, self.total_shares - owned)
-
-    def buy_shares(self, amount, entity="player"):
-        """Player or AI buys shares from public float."""
-        amount = min(amount, self.public_float)
-        if amount <= 0:
-            return 0
-
-        if entity == "player":
-            self.player_shares += amount
-        else:
-            self.ai_owners[entity] = self.ai_owners.get(entity, 0) + amount
-
-        self.update_public_float()
-        return amount
-
-    def sell_shares(self, amount, entity="player"):
-        """Player or AI sells shares back into public float."""
-        if entity == "player":
-            amount = min(amount, self.player_shares)
-            self.player_shares -= amount
-        else:
-            owned = self.ai_owners.get(entity, 0)
-            amount = min(amount, owned)
-            self.ai_owners[entity] = owned - amount
-            if self.ai_owners[entity] <= 0:
-                del self.ai_owners[entity]
-
-        self.public_float += amount
-        return amount
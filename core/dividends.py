@@ -0,0 +1,217 @@
+"""
+Dividend Engine
+---------------
+Dividend sharing (proportional income + controlling bonus) for every
+company and holder in one array pass per tick.
+
+- DIVIDEND_LADDER is the single ladder (the AI traders price stakes
+  against the same one).
+- ladder_rates() is a searchsorted lookup over any array of holder
+  fractions.
+- AI payouts accumulate into a CashLedger: per-owner cash in one array
+  indexed by the HoldingsStore owner ids (dict-like, so ai_cash code
+  keeps working).
+- A DividendPayout keeps the tick's payouts as arrays; the per-owner /
+  per-company dicts the dashboard shows are built only when asked for.
+"""
+
+from collections import defaultdict
+from collections.abc import MutableMapping
+
+import numpy as np
+
+# (minimum stake fraction, share of company income paid to that holder)
+DIVIDEND_LADDER = [
+    (0.9, 0.32),
+    (0.8, 0.29),
+    (0.7, 0.25),
+    (0.6, 0.21),
+    (0.5, 0.18),
+    (0.4, 0.15),
+    (0.3, 0.12),
+    (0.2, 0.09),
+    (0.1, 0.06),
+    (0.0, 0.03),
+]
+
+_THRESHOLDS = np.array([th for th, _ in reversed(DIVIDEND_LADDER)])
+_RATES = np.array([rate for _, rate in reversed(DIVIDEND_LADDER)])
+
+
+def ladder_rates(frac):
+    """Rate of the highest ladder threshold <= frac, for an array of fractions."""
+    idx = np.searchsorted(_THRESHOLDS, frac, side="right") - 1
+    return np.where(idx >= 0, _RATES[np.maximum(idx, 0)], 0.0)
+
+
+# ------------------------------------------------------------
+#  PER-OWNER CASH
+# ------------------------------------------------------------
+
+class CashLedger(MutableMapping):
+    """Cash per owner name, stored in an array indexed by holdings owner id."""
+
+    def __init__(self, holdings, capacity=64):
+        self.holdings = holdings
+        self.cash = np.zeros(capacity)
+        self.present = np.zeros(capacity, dtype=bool)
+
+    def _ensure(self, size):
+        if size <= len(self.cash):
+            return
+        capacity = max(size, len(self.cash) * 2)
+        cash = np.zeros(capacity)
+        present = np.zeros(capacity, dtype=bool)
+        cash[:len(self.cash)] = self.cash
+        present[:len(self.present)] = self.present
+        self.cash, self.present = cash, present
+
+    def _oid(self, name):
+        oid = self.holdings.owner_ids.get(name)
+        if oid is None or oid >= len(self.present) or not self.present[oid]:
+            return None
+        return oid
+
+    def __getitem__(self, name):
+        oid = self._oid(name)
+        if oid is None:
+            raise KeyError(name)
+        return float(self.cash[oid])
+
+    def __setitem__(self, name, value):
+        oid = self.holdings.owner_id(name)
+        self._ensure(oid + 1)
+        self.cash[oid] = value
+        self.present[oid] = True
+
+    def __delitem__(self, name):
+        oid = self._oid(name)
+        if oid is None:
+            raise KeyError(name)
+        self.cash[oid] = 0.0
+        self.present[oid] = False
+
+    def __iter__(self):
+        names = self.holdings.owner_names
+        return iter([names[oid] for oid in np.flatnonzero(self.present)])
+
+    def __len__(self):
+        return int(self.present.sum())
+
+    def get(self, name, default=None):
+        oid = self._oid(name)
+        return default if oid is None else float(self.cash[oid])
+
+    def deposit(self, owner_ids, amounts):
+        """Add amounts[i] to owner_ids[i] (ids may repeat)."""
+        if len(owner_ids) == 0:
+            return
+        self._ensure(int(owner_ids.max()) + 1)
+        self.cash += np.bincount(owner_ids, weights=amounts, minlength=len(self.cash))
+        self.present[owner_ids] = True
+
+    def total(self):
+        return float(self.cash[self.present].sum())
+
+    def get_state(self):
+        """Arrays indexed by holdings owner id (save them with the holdings registry)."""
+        return {"cash": self.cash.copy(), "present": self.present.copy()}
+
+    def set_state(self, state):
+        self.cash = np.asarray(state["cash"], dtype=np.float64).copy()
+        self.present = np.asarray(state["present"], dtype=bool).copy()
+
+
+# ------------------------------------------------------------
+#  PAYOUTS
+# ------------------------------------------------------------
+
+class DividendPayout:
+    """One tick of dividends as arrays."""
+
+    def __init__(self, companies, owner_names, player_rows, player_amounts, ai_rows, ai_owners, ai_amounts):
+        self.companies = companies
+        self.owner_names = owner_names
+        self.player_rows = player_rows
+        self.player_amounts = player_amounts
+        self.ai_rows = ai_rows
+        self.ai_owners = ai_owners
+        self.ai_amounts = ai_amounts
+        self.player_total = float(player_amounts.sum())
+        self.total = self.player_total + float(ai_amounts.sum())
+
+    @classmethod
+    def empty(cls, companies, owner_names):
+        none_i = np.empty(0, dtype=np.int64)
+        none_f = np.empty(0)
+        return cls(companies, owner_names, none_i, none_f, none_i, none_i, none_f)
+
+    def by_owner(self):
+        """{owner: [(company name, amount), ...]} (player first)."""
+        out = defaultdict(list)
+        companies, owners = self.companies, self.owner_names
+        for row, amount in zip(self.player_rows.tolist(), self.player_amounts.tolist()):
+            out["player"].append((companies[row].name, amount))
+        for row, oid, amount in zip(self.ai_rows.tolist(), self.ai_owners.tolist(), self.ai_amounts.tolist()):
+            out[owners[oid]].append((companies[row].name, amount))
+        return out
+
+    def paid(self):
+        """{company name: total paid out}."""
+        out = defaultdict(float)
+        companies = self.companies
+        for row, amount in zip(self.player_rows.tolist(), self.player_amounts.tolist()):
+            out[companies[row].name] += amount
+        for row, amount in zip(self.ai_rows.tolist(), self.ai_amounts.tolist()):
+            out[companies[row].name] += amount
+        return out
+
+    def received(self):
+        """{owner: total received}."""
+        out = defaultdict(float)
+        if self.player_total > 0:
+            out["player"] = self.player_total
+        owners = self.owner_names
+        for oid, amount in zip(self.ai_owners.tolist(), self.ai_amounts.tolist()):
+            out[owners[oid]] += amount
+        return out
+
+
+class DividendEngine:
+    """Pays every company's income out to its holders along the ladder."""
+
+    def __init__(self, holdings, ledger):
+        self.holdings = holdings
+        self.ledger = ledger
+
+    def pay(self, income):
+        """
+        income: array (one entry per holdings row) of this tick's company
+        income. AI dividends go straight into the ledger; the caller pays
+        the player (payout.player_total).
+        """
+        h = self.holdings
+        paying = np.flatnonzero(income > 0)
+        if paying.size == 0:
+            return DividendPayout.empty(h.companies, h.owner_names)
+        inc = income[paying]
+        total = np.maximum(1, h.total_shares[paying]).astype(np.float64)
+
+        # Player stake
+        player_frac = h.player[paying] / total
+        player_div = inc * np.where(player_frac > 0, ladder_rates(player_frac), 0.0)
+        got = player_div > 0
+
+        # AI holders (packed slots of the paying rows)
+        frac = h.shares[paying] / total[:, None]
+        live = h.holders_mask()[paying] & (frac > 0)
+        ai_div = inc[:, None] * np.where(live, ladder_rates(frac), 0.0)
+        ai_rows = np.broadcast_to(paying[:, None], live.shape)[live]
+        ai_owners = h.owner[paying][live].astype(np.int64)
+        ai_amounts = ai_div[live]
+        self.ledger.deposit(ai_owners, ai_amounts)
+
+        return DividendPayout(
+            h.companies, h.owner_names,
+            paying[got], player_div[got], ai_rows, ai_owners, ai_amounts,
+        )
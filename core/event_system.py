@@ -11,6 +11,11 @@ class EventBus:
         if handler not in self._subscribers:
             self._subscribers.append(handler)
 
-    def emit(self, message, color="#cccccc"):
+    def emit(self, message, color="#cccccc", group=None):
+        """
+        Send a feed message to every handler(message, color, group).
+        `group`: summary line ("{n}" = count) for messages that may come
+        in bursts within one tick, so the feed can merge them.
+        """
         for handler in list(self._subscribers):
-            handler(message, color)
+            handler(message, color, group)
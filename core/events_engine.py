@@ -1,16 +1,37 @@
+"""
+Sector Events
+-------------
+Temporary drift / volatility modifiers for a sector (or one company).
+
+- Active events are indexed by sector and by target company.
+- Expiry is a min-heap on end day: only events that actually end are
+  touched.
+- Modifiers only change when the day changes or an event starts / ends,
+  so the (drift, vol) tables are cached per day and lookups are plain
+  dict reads. drift_array() caches the per-company drift column too.
+"""
+
+import heapq
 import random
 import time
 
+import numpy as np
+
 
 class SectorEvent:
-    def __init__(self, name, sector, drift_delta=0.0, vol_delta=0.0, duration_days=2):
+    def __init__(self, name, sector, drift_delta=0.0, vol_delta=0.0, duration_days=2, company=None):
         self.name = name
         self.sector = sector
         self.drift_delta = drift_delta
         self.vol_delta = vol_delta
         self.duration_days = duration_days
+        self.company = company  # company name for a targeted event, else None
         self.start_day = None
 
+    @property
+    def end_day(self):
+        return self.start_day + self.duration_days
+
     def is_active(self, current_day):
         if self.start_day is None:
             return False
@@ -18,22 +39,31 @@ class SectorEvent:
 
 
 class SectorEventEngine:
-    def __init__(self, sectors):
+    def __init__(self, sectors, rng=None):
         self.sectors = sectors
+        self.rng = rng if rng is not None else random
         self.active_events = []
+        self._by_sector = {}      # sector -> [events hitting the whole sector]
+        self._by_company = {}     # company name -> [targeted events]
+        self._expiry = []         # heap of (end_day, seq, event)
+        self._seq = 0
+        self._day = None          # day the caches below were built for
+        self._sector_mods = {}    # sector -> (drift, vol)
+        self._company_mods = {}   # company name -> (drift, vol), targeted only
+        self._drift_cache = None  # (day, companies list id, array)
 
     def maybe_spawn(self, current_day):
         # 10% daily chance to spawn an event
-        if random.random() > 0.10:
+        if self.rng.random() > 0.10:
             return None
-        sector = random.choice(self.sectors)
-        if random.random() < 0.5:
+        sector = self.rng.choice(self.sectors)
+        if self.rng.random() < 0.5:
             ev = SectorEvent(
                 name="Sector Tailwind",
                 sector=sector,
                 drift_delta=0.02,
                 vol_delta=-0.1,
-                duration_days=random.randint(1, 3),
+                duration_days=self.rng.randint(1, 3),
             )
         else:
             ev = SectorEvent(
@@ -41,18 +71,109 @@ class SectorEventEngine:
                 sector=sector,
                 drift_delta=-0.02,
                 vol_delta=0.15,
-                duration_days=random.randint(1, 3),
+                duration_days=self.rng.randint(1, 3),
             )
+        return self.add_event(ev, current_day)
+
+    def add_event(self, ev, current_day):
+        """Start an event (sector-wide, or company-targeted when ev.company is set)."""
         ev.start_day = current_day
+        self.advance(current_day)
         self.active_events.append(ev)
+        index = self._by_sector if ev.company is None else self._by_company
+        index.setdefault(ev.sector if ev.company is None else ev.company, []).append(ev)
+        self._seq += 1
+        heapq.heappush(self._expiry, (ev.end_day, self._seq, ev))
+        self._invalidate()
         return ev
 
+    # ------------------------------------------------------------
+    #  EXPIRY + CACHES
+    # ------------------------------------------------------------
+
+    def _invalidate(self):
+        self._day = None
+        self._drift_cache = None
+
+    def advance(self, current_day):
+        """Drop every event that has ended by current_day."""
+        expiry = self._expiry
+        if not expiry or expiry[0][0] > current_day:
+            return
+        ended = set()
+        while expiry and expiry[0][0] <= current_day:
+            ended.add(heapq.heappop(expiry)[2])
+        for ev in ended:
+            index = self._by_sector if ev.company is None else self._by_company
+            key = ev.sector if ev.company is None else ev.company
+            events = index[key]
+            events.remove(ev)
+            if not events:
+                del index[key]
+        self.active_events = [e for e in self.active_events if e not in ended]
+        self._invalidate()
+
+    @staticmethod
+    def _sum(events):
+        return (sum(e.drift_delta for e in events), sum(e.vol_delta for e in events))
+
+    def _refresh(self, current_day):
+        if self._day == current_day:
+            return
+        self.advance(current_day)
+        self._sector_mods = {s: self._sum(evs) for s, evs in self._by_sector.items()}
+        self._company_mods = {c: self._sum(evs) for c, evs in self._by_company.items()}
+        self._day = current_day
+
+    # ------------------------------------------------------------
+    #  STATE (save / load)
+    # ------------------------------------------------------------
+
+    def get_state(self):
+        return {
+            "events": [
+                [e.name, e.sector, e.drift_delta, e.vol_delta, e.duration_days, e.company, e.start_day]
+                for e in self.active_events
+            ],
+        }
+
+    def set_state(self, state):
+        self.active_events = []
+        self._by_sector = {}
+        self._by_company = {}
+        self._expiry = []
+        for name, sector, drift, vol, duration, company, start_day in state["events"]:
+            self.add_event(SectorEvent(name, sector, drift, vol, duration, company=company), start_day)
+        self._invalidate()
+
+    # ------------------------------------------------------------
+    #  LOOKUPS
+    # ------------------------------------------------------------
+
     def get_modifiers(self, sector, current_day):
-        drift = 0.0
-        vol = 0.0
-        self.active_events = [e for e in self.active_events if e.is_active(current_day)]
-        for e in self.active_events:
-            if e.sector == sector:
-                drift += e.drift_delta
-                vol += e.vol_delta
+        """(drift, vol) from the events active in a sector."""
+        self._refresh(current_day)
+        return self._sector_mods.get(sector, (0.0, 0.0))
+
+    def company_modifiers(self, company, current_day):
+        """(drift, vol) for one company: its sector's events plus any targeted at it."""
+        self._refresh(current_day)
+        drift, vol = self._sector_mods.get(getattr(company, "sector", ""), (0.0, 0.0))
+        extra = self._company_mods.get(company.name)
+        if extra:
+            drift += extra[0]
+            vol += extra[1]
         return drift, vol
+
+    def drift_array(self, companies, current_day):
+        """Per-company drift (sector + targeted) as an array, cached until the next change."""
+        self._refresh(current_day)
+        cached = self._drift_cache
+        if cached is not None and cached[0] == current_day and cached[1] == id(companies):
+            return cached[2]
+        drift = np.fromiter(
+            (self.company_modifiers(c, current_day)[0] for c in companies),
+            dtype=np.float64, count=len(companies),
+        )
+        self._drift_cache = (current_day, id(companies), drift)
+        return drift
@@ -0,0 +1,226 @@
+"""
+History Archive
+---------------
+On-disk, np.memmap-backed price history for every company, for
+sessions longer than the in-memory candle rings hold.
+
+- ticks.f32:  one row per tick,  (ticks, companies) closing prices
+- daily.f32:  one row per day,   (days, companies, 4) OHLC
+- meta.json:  company names, first tick / day, row counts
+
+Rows are time-major, so a tick (or a day close) is one contiguous write.
+Files grow in chunks and are re-mapped as they fill; the OS pages
+history in and out, so resident memory stays flat however long the
+session runs. Reads are zero-copy slices of the mapping.
+
+Rows are addressed by absolute tick / day: recording a tick that was
+already recorded (a game loaded from an older save) rewinds the archive
+to it.
+
+The simulation thread writes; the dashboard reads through an
+ArchiveReader (reader()), its own read-only mapping of the daily file,
+bounded by the day count published in each snapshot.
+"""
+
+import json
+import os
+
+import numpy as np
+
+from core.candle_store import OPEN, HIGH, LOW, CLOSE
+
+ARCHIVE_VERSION = 1
+
+
+class _GrowingMemmap:
+    """float32 memmap of (rows, *row_shape) that grows `chunk` rows at a time."""
+
+    def __init__(self, path, row_shape, chunk):
+        self.path = path
+        self.row_shape = tuple(row_shape)
+        self.chunk = int(chunk)
+        self.row_bytes = int(np.prod(self.row_shape)) * 4
+        if not os.path.exists(path):
+            with open(path, "wb") as fh:
+                fh.truncate(self.chunk * self.row_bytes)
+        self.array = None
+        self._map()
+
+    def _map(self):
+        rows = os.path.getsize(self.path) // self.row_bytes
+        self.array = np.memmap(self.path, dtype=np.float32, mode="r+", shape=(rows,) + self.row_shape)
+
+    @property
+    def capacity(self):
+        return self.array.shape[0]
+
+    def ensure(self, rows):
+        if rows <= self.capacity:
+            return
+        self.array.flush()
+        new_rows = max(rows, self.capacity + self.chunk)
+        with open(self.path, "r+b") as fh:
+            fh.truncate(new_rows * self.row_bytes)
+        self._map()
+
+    def flush(self):
+        self.array.flush()
+
+
+class HistoryArchive:
+    """
+    Append-only per-tick prices + daily OHLC for a fixed list of
+    companies (rows match market slots). Use attach() to open or create.
+    """
+
+    TICK_CHUNK = 4096
+    DAY_CHUNK = 256
+
+    def __init__(self, path, names, start_tick, start_day, ticks=0, days=0):
+        self.path = os.fspath(path)
+        os.makedirs(self.path, exist_ok=True)
+        self.names = list(names)
+        self.rows = {name: i for i, name in enumerate(self.names)}
+        self.start_tick = int(start_tick)
+        self.start_day = int(start_day)
+        n = len(self.names)
+        self._ticks = _GrowingMemmap(os.path.join(self.path, "ticks.f32"), (n,), self.TICK_CHUNK)
+        self._daily = _GrowingMemmap(os.path.join(self.path, "daily.f32"), (n, 4), self.DAY_CHUNK)
+        self.tick_count = int(ticks)
+        self.day_count = int(days)
+        self._day = None
+        self._write_meta()
+
+    @classmethod
+    def attach(cls, market, path):
+        """
+        Open the archive at `path` if it was recorded for the same
+        companies and starts at or before the market's tick, else start
+        a new one there.
+        """
+        path = os.fspath(path)
+        names = [c.name for c in market.companies]
+        meta_path = os.path.join(path, "meta.json")
+        archive = None
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding="utf-8") as fh:
+                meta = json.load(fh)
+            if (meta.get("version") == ARCHIVE_VERSION and meta["companies"] == names
+                    and meta["start_tick"] <= market.global_tick):
+                # Resume; drop anything recorded past the market's clock
+                days = min(meta["days"], market.global_day - meta["start_day"])
+                archive = cls(path, names, meta["start_tick"], meta["start_day"], meta["ticks"], days)
+            else:
+                for name in ("ticks.f32", "daily.f32", "meta.json"):
+                    os.remove(os.path.join(path, name))
+        if archive is None:
+            archive = cls(path, names, market.global_tick, market.global_day)
+        archive.record(market)  # row for the current tick (truncates a resumed archive)
+        return archive
+
+    def _write_meta(self):
+        meta = {
+            "version": ARCHIVE_VERSION,
+            "companies": self.names,
+            "start_tick": self.start_tick,
+            "start_day": self.start_day,
+            "ticks": self.tick_count,
+            "days": self.day_count,
+        }
+        tmp = os.path.join(self.path, "meta.json.tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(meta, fh)
+        os.replace(tmp, os.path.join(self.path, "meta.json"))
+
+    # ------------------------------------------------------------
+    #  RECORDING
+    # ------------------------------------------------------------
+
+    def record(self, market):
+        """Store this tick's prices, plus the daily bar that just closed (if any)."""
+        row = market.global_tick - self.start_tick
+        if row < 0:
+            return
+        self._ticks.ensure(row + 1)
+        if row > self.tick_count:
+            # Ticks skipped with the market closed (MarketSimulation.skip): prices stood still
+            self._ticks.array[self.tick_count:row] = market.price
+        self._ticks.array[row] = market.price
+        self.tick_count = row + 1
+
+        day = market.global_day
+        if self._day is not None and day != self._day:
+            # Bars of the days closed since the last record, newest last in the daily store
+            daily = market.daily
+            closed = day - 1 - self.start_day
+            first = max(0, self._day - self.start_day, closed + 1 - daily.capacity)
+            if closed >= first:
+                self._daily.ensure(closed + 1)
+                for d in range(first, closed + 1):
+                    bars = self._daily.array[d]
+                    for field in (OPEN, HIGH, LOW, CLOSE):
+                        bars[:, field] = daily.last(field, back=closed - d)
+                self.day_count = closed + 1
+                self.flush()
+        self._day = day
+
+    def flush(self):
+        self._ticks.flush()
+        self._daily.flush()
+        self._write_meta()
+
+    def reader(self):
+        """Read-only ArchiveReader of the daily bars, for another thread."""
+        return ArchiveReader(self._daily.path, self.names)
+
+    def close(self):
+        self.flush()
+        self._ticks.array = self._daily.array = None
+
+    # ------------------------------------------------------------
+    #  READS (zero-copy views of the mapping)
+    # ------------------------------------------------------------
+
+    def tick_prices(self, row=None, start=None, stop=None):
+        """Prices for ticks [start, stop) (absolute), one company row or all, as a view."""
+        lo, hi = self._span(start, stop, self.start_tick, self.tick_count)
+        view = self._ticks.array[lo:hi]
+        return view if row is None else view[:, row]
+
+    def daily(self, row=None, start=None, stop=None):
+        """Daily OHLC for days [start, stop) (absolute): (days, 4) for one row, else (days, n, 4)."""
+        lo, hi = self._span(start, stop, self.start_day, self.day_count)
+        view = self._daily.array[lo:hi]
+        return view if row is None else view[:, row]
+
+    @staticmethod
+    def _span(start, stop, origin, count):
+        lo = 0 if start is None else min(max(0, start - origin), count)
+        hi = count if stop is None else min(max(lo, stop - origin), count)
+        return lo, hi
+
+
+class ArchiveReader:
+    """
+    Read-only mapping of an archive's daily bars. Holds no reference to
+    the HistoryArchive: callers pass the day count they may read (rows
+    below it are final), and the file is re-mapped once it outgrows the
+    mapping.
+    """
+
+    def __init__(self, path, names):
+        self.path = path
+        self.rows = {name: i for i, name in enumerate(names)}
+        self.row_bytes = len(self.rows) * 4 * 4
+        self.array = None
+        self._map()
+
+    def _map(self):
+        days = os.path.getsize(self.path) // self.row_bytes
+        self.array = np.memmap(self.path, dtype=np.float32, mode="r", shape=(days, len(self.rows), 4))
+
+    def daily(self, row, days):
+        """Daily OHLC (days, 4) of one company row for the first `days` archived days, as a view."""
+        if days > self.array.shape[0]:
+            self._map()
+        return self.array[:days, row]
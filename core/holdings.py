@@ -0,0 +1,287 @@
+"""
+Holdings Store
+--------------
+Central share registry for every company: player stake, public float
+and all AI holders, in arrays instead of per-company dicts.
+
+- Owners (AI names, company names, "CEO") get integer ids in a shared
+  registry.
+- Each company row keeps its holders packed in slot arrays
+  (owner[row, k], shares[row, k]) in insertion order, so a row reads
+  like the old dict. Rows widen automatically when a company gains
+  more holders than there are slots.
+- Row totals (ai_total) are maintained on every write: float and
+  "shares held" lookups are O(1), never a sum() over a dict.
+- Column / bulk queries are vectorized: holdings_of(owner),
+  top_holders(row), owned(); add_many() applies a batch of changes
+  in one pass.
+
+Companies are bound to a row: company.player_shares / public_float read
+the arrays and company.ai_owners becomes a dict-like HoldingsView.
+"""
+
+from collections.abc import MutableMapping
+
+import numpy as np
+
+
+class HoldingsStore:
+    """Holdings of `len(companies)` companies."""
+
+    def __init__(self, companies, slots=8):
+        self.companies = list(companies)
+        self.rows = {c: i for i, c in enumerate(self.companies)}
+        n = len(self.companies)
+
+        self.owner_ids = {}       # name -> id
+        self.owner_names = []     # id -> name
+
+        self.owner = np.full((n, slots), -1, dtype=np.int32)
+        self.shares = np.zeros((n, slots), dtype=np.int64)
+        self.count = np.zeros(n, dtype=np.int64)      # used slots per row
+        self.ai_total = np.zeros(n, dtype=np.int64)   # cached row sums
+        self.player = np.zeros(n, dtype=np.int64)
+        self.public_float = np.zeros(n, dtype=np.int64)
+        self.total_shares = np.array([c.total_shares for c in self.companies], dtype=np.int64)
+
+        for i, c in enumerate(self.companies):
+            c.bind_holdings(self, i)
+
+    # ------------------------------------------------------------
+    #  OWNER REGISTRY
+    # ------------------------------------------------------------
+
+    def owner_id(self, name):
+        """Id for `name`, registering it on first use."""
+        oid = self.owner_ids.get(name)
+        if oid is None:
+            oid = len(self.owner_names)
+            self.owner_ids[name] = oid
+            self.owner_names.append(name)
+        return oid
+
+    def _grow(self):
+        n, slots = self.owner.shape
+        owner = np.full((n, slots * 2), -1, dtype=np.int32)
+        shares = np.zeros((n, slots * 2), dtype=np.int64)
+        owner[:, :slots] = self.owner
+        shares[:, :slots] = self.shares
+        self.owner, self.shares = owner, shares
+
+    # ------------------------------------------------------------
+    #  ROW ACCESS
+    # ------------------------------------------------------------
+
+    def _find(self, row, oid):
+        cnt = int(self.count[row])
+        try:
+            return self.owner[row, :cnt].tolist().index(oid)
+        except ValueError:
+            return -1
+
+    def get(self, row, name, default=0):
+        oid = self.owner_ids.get(name)
+        if oid is None:
+            return default
+        k = self._find(row, oid)
+        return int(self.shares[row, k]) if k >= 0 else default
+
+    def contains(self, row, name):
+        oid = self.owner_ids.get(name)
+        return oid is not None and self._find(row, oid) >= 0
+
+    def set(self, row, name, shares):
+        oid = self.owner_id(name)
+        shares = int(shares)
+        k = self._find(row, oid)
+        if k < 0:
+            k = int(self.count[row])
+            if k == self.owner.shape[1]:
+                self._grow()
+            self.owner[row, k] = oid
+            self.count[row] = k + 1
+        else:
+            self.ai_total[row] -= self.shares[row, k]
+        self.shares[row, k] = shares
+        self.ai_total[row] += shares
+
+    def add(self, row, name, delta):
+        """Change a holding by delta; drops the holder when it reaches <= 0."""
+        left = self.get(row, name) + int(delta)
+        if left > 0:
+            self.set(row, name, left)
+        elif self.contains(row, name):
+            self.remove(row, name)
+
+    def remove(self, row, name):
+        """Delete a holder (KeyError if absent), keeping insertion order."""
+        oid = self.owner_ids.get(name)
+        k = -1 if oid is None else self._find(row, oid)
+        if k < 0:
+            raise KeyError(name)
+        cnt = int(self.count[row])
+        value = int(self.shares[row, k])
+        self.owner[row, k:cnt - 1] = self.owner[row, k + 1:cnt]
+        self.shares[row, k:cnt - 1] = self.shares[row, k + 1:cnt]
+        self.owner[row, cnt - 1] = -1
+        self.shares[row, cnt - 1] = 0
+        self.count[row] = cnt - 1
+        self.ai_total[row] -= value
+        return value
+
+    def clear_row(self, row):
+        cnt = int(self.count[row])
+        self.owner[row, :cnt] = -1
+        self.shares[row, :cnt] = 0
+        self.count[row] = 0
+        self.ai_total[row] = 0
+
+    def names(self, row):
+        names = self.owner_names
+        return [names[o] for o in self.owner[row, :int(self.count[row])].tolist()]
+
+    def items(self, row):
+        cnt = int(self.count[row])
+        names = self.owner_names
+        return [(names[o], s) for o, s in zip(self.owner[row, :cnt].tolist(), self.shares[row, :cnt].tolist())]
+
+    def _compact_row(self, row):
+        """Drop the row's holders left at <= 0 shares, keeping insertion order."""
+        cnt = int(self.count[row])
+        keep = self.shares[row, :cnt] > 0
+        left = int(keep.sum())
+        self.owner[row, :left] = self.owner[row, :cnt][keep]
+        self.shares[row, :left] = self.shares[row, :cnt][keep]
+        self.owner[row, left:cnt] = -1
+        self.shares[row, left:cnt] = 0
+        self.count[row] = left
+        self.ai_total[row] = self.shares[row, :left].sum()
+
+    # ------------------------------------------------------------
+    #  BULK UPDATES
+    # ------------------------------------------------------------
+
+    def add_many(self, rows, slots, deltas):
+        """
+        add() for many existing holders at once, addressed by (row, slot)
+        pairs (distinct). Holders left at <= 0 are dropped as in add().
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        slots = np.asarray(slots, dtype=np.int64)
+        deltas = np.asarray(deltas, dtype=np.int64)
+        self.shares[rows, slots] += deltas
+        np.add.at(self.ai_total, rows, deltas)
+        emptied = rows[self.shares[rows, slots] <= 0]
+        for row in np.unique(emptied).tolist():
+            self._compact_row(row)
+
+    # ------------------------------------------------------------
+    #  BULK QUERIES
+    # ------------------------------------------------------------
+
+    def holders_mask(self):
+        """(rows, slots) bool: slot in use."""
+        return np.arange(self.owner.shape[1])[None, :] < self.count[:, None]
+
+    def owned(self):
+        """Shares held by the player and AIs per company (everything but the float)."""
+        return self.player + self.ai_total
+
+    def holdings_of(self, name):
+        """Everything `name` holds: (company rows, shares) arrays."""
+        oid = self.owner_ids.get(name)
+        if oid is None:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        rows, slots = np.nonzero(self.owner == oid)
+        return rows, self.shares[rows, slots]
+
+    def top_holders(self, row, k=5):
+        """Largest AI holders of one company: [(name, shares), ...]."""
+        cnt = int(self.count[row])
+        order = np.argsort(-self.shares[row, :cnt], kind="stable")[:k]
+        names = self.owner_names
+        return [(names[self.owner[row, j]], int(self.shares[row, j])) for j in order]
+
+    # ------------------------------------------------------------
+    #  STATE (save / load)
+    # ------------------------------------------------------------
+
+    def get_state(self):
+        slots = max(1, int(self.count.max()) if len(self.count) else 1)
+        return {
+            "owner_names": list(self.owner_names),
+            "owner": self.owner[:, :slots].copy(),
+            "shares": self.shares[:, :slots].copy(),
+            "count": self.count.copy(),
+            "player": self.player.copy(),
+            "public_float": self.public_float.copy(),
+            "total_shares": self.total_shares.copy(),
+        }
+
+    def set_state(self, state):
+        """Restore get_state() for the same company rows."""
+        self.owner_names = list(state["owner_names"])
+        self.owner_ids = {name: i for i, name in enumerate(self.owner_names)}
+        owner = np.asarray(state["owner"], dtype=np.int32)
+        shares = np.asarray(state["shares"], dtype=np.int64)
+        slots = max(owner.shape[1], self.owner.shape[1])
+        self.owner = np.full((len(owner), slots), -1, dtype=np.int32)
+        self.shares = np.zeros((len(owner), slots), dtype=np.int64)
+        self.owner[:, :owner.shape[1]] = owner
+        self.shares[:, :shares.shape[1]] = shares
+        self.count = np.asarray(state["count"], dtype=np.int64).copy()
+        self.ai_total = self.shares.sum(axis=1)
+        self.player = np.asarray(state["player"], dtype=np.int64).copy()
+        self.public_float = np.asarray(state["public_float"], dtype=np.int64).copy()
+        self.total_shares = np.asarray(state["total_shares"], dtype=np.int64).copy()
+
+
+class HoldingsView(MutableMapping):
+    """company.ai_owners once bound: a dict-like window on one store row."""
+
+    __slots__ = ("store", "row")
+
+    def __init__(self, store, row):
+        self.store = store
+        self.row = row
+
+    def __getitem__(self, name):
+        oid = self.store.owner_ids.get(name)
+        k = -1 if oid is None else self.store._find(self.row, oid)
+        if k < 0:
+            raise KeyError(name)
+        return int(self.store.shares[self.row, k])
+
+    def __setitem__(self, name, shares):
+        self.store.set(self.row, name, shares)
+
+    def __delitem__(self, name):
+        self.store.remove(self.row, name)
+
+    def __contains__(self, name):
+        return self.store.contains(self.row, name)
+
+    def __iter__(self):
+        return iter(self.store.names(self.row))
+
+    def __len__(self):
+        return int(self.store.count[self.row])
+
+    def get(self, name, default=None):
+        return self.store.get(self.row, name, default)
+
+    def items(self):
+        return self.store.items(self.row)
+
+    def values(self):
+        return self.store.shares[self.row, :int(self.store.count[self.row])].tolist()
+
+    def clear(self):
+        self.store.clear_row(self.row)
+
+    def total(self):
+        """Sum of all AI holdings (cached)."""
+        return int(self.store.ai_total[self.row])
+
+    def __repr__(self):
+        return f"HoldingsView({dict(self.items())!r})"
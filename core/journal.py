@@ -0,0 +1,221 @@
+"""
+Command Journal
+---------------
+Append-only record of a session, and a headless replayer for it.
+
+The simulation is deterministic given its starting state (RNG seed
+included) and the player commands fed to it between ticks, so that is
+all a journal stores:
+
+- a header: seed, starting tick, and how to rebuild the start (new_game
+  parameters, or a save written next to the journal)
+- one line per player command (MarketSimulation methods marked
+  @journaled) with the tick it was issued at; companies are stored by
+  row index
+- a state digest every `check_every` ticks and on close, so a replay
+  can prove it reached the identical state
+
+Lines are JSON, written through a large buffer (flushed at checkpoints).
+
+Usage:
+    python -m core.journal saves/session.smjournal
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+
+from core.company_model import Company
+from core.persistence import SAVE_SUFFIX, load_game, save_game
+from core.simulation import MarketSimulation
+
+JOURNAL_VERSION = 1
+JOURNAL_SUFFIX = ".smjournal"
+
+
+def state_digest(sim):
+    """Short hash of the state a replay must reproduce (prices, books, holdings, cash)."""
+    h = hashlib.blake2b(digest_size=12)
+    h.update(sim.market.global_tick.to_bytes(8, "little"))
+    for array in (sim.market.price, sim.holdings.player, sim.holdings.public_float,
+                  sim.holdings.ai_total, sim.ai_cash.cash):
+        h.update(array.tobytes())
+    h.update(repr((sim.player.cash, sim.disruption_engine.value, sim.asset_manager.n)).encode())
+    return h.hexdigest()
+
+
+# ------------------------------------------------------------
+#  RECORDING
+# ------------------------------------------------------------
+
+class CommandJournal:
+    """Attach to a simulation with CommandJournal.start(); close() when done."""
+
+    def __init__(self, path, check_every=120, buffer_size=1 << 16):
+        self.path = os.fspath(path)
+        self.check_every = int(check_every)
+        self._fh = open(self.path, "a", encoding="utf-8", buffering=buffer_size)
+        self.commands = 0
+
+    @classmethod
+    def start(cls, sim, path, new_game=None, **kwargs):
+        """
+        Open a journal for `sim` and attach it. new_game: the new_game()
+        keyword arguments when sim is a fresh seeded game; otherwise the
+        current state is saved next to the journal as the start point.
+        """
+        journal = cls(path, **kwargs)
+        header = {
+            "journal": JOURNAL_VERSION,
+            "seed": sim.rng.seed,
+            "tick": sim.market.global_tick,
+            "created": time.time(),
+        }
+        if new_game is not None:
+            header["new_game"] = dict(new_game, seed=sim.rng.seed)
+        else:
+            start = os.path.splitext(journal.path)[0] + ".start" + SAVE_SUFFIX
+            save_game(sim, start)
+            header["snapshot"] = os.path.basename(start)
+        journal._write(header)
+        journal._fh.flush()
+        sim.journal = journal
+        return journal
+
+    def _write(self, record):
+        self._fh.write(json.dumps(record, separators=(",", ":")))
+        self._fh.write("\n")
+
+    @staticmethod
+    def _encode(sim, value):
+        if isinstance(value, Company):
+            return {"company": sim.market.slots[value]}
+        return value
+
+    def command(self, sim, name, args, kwargs):
+        """Called by @journaled methods before they run."""
+        self._write({
+            "t": sim.market.global_tick,
+            "cmd": name,
+            "args": [self._encode(sim, a) for a in args],
+            "kwargs": {k: self._encode(sim, v) for k, v in kwargs.items()},
+        })
+        self.commands += 1
+
+    def tick(self, sim):
+        """Called after every simulation tick."""
+        if sim.market.global_tick % self.check_every == 0:
+            self.checkpoint(sim)
+
+    def checkpoint(self, sim):
+        self._write({"t": sim.market.global_tick, "check": state_digest(sim)})
+        self._fh.flush()
+
+    def close(self, sim=None):
+        """Write the final state digest and detach."""
+        if self._fh.closed:
+            return
+        if sim is not None:
+            self._write({"t": sim.market.global_tick, "end": state_digest(sim)})
+            if sim.journal is self:
+                sim.journal = None
+        self._fh.close()
+
+
+# ------------------------------------------------------------
+#  REPLAY
+# ------------------------------------------------------------
+
+class ReplayMismatch(Exception):
+    """A replay reached a checkpoint with a different state digest."""
+
+
+def read_journal(path):
+    """(header, [records]) from a journal file (a torn last line is ignored)."""
+    with open(path, encoding="utf-8") as fh:
+        lines = fh.read().splitlines()
+    records = []
+    for line in lines:
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError:
+            break
+    if not records or "journal" not in records[0]:
+        raise ValueError(f"{path} is not a command journal")
+    return records[0], records[1:]
+
+
+def _start_sim(path, header):
+    if "new_game" in header:
+        return MarketSimulation.new_game(**header["new_game"])
+    return load_game(os.path.join(os.path.dirname(os.fspath(path)), header["snapshot"]))
+
+
+def replay(path, verify=True, until=None, listener=None):
+    """
+    Re-run a journal headlessly at full speed. Returns (sim, report);
+    raises ReplayMismatch on a digest mismatch when verify is set.
+    until: stop at this tick (default: the last tick recorded).
+    """
+    header, records = read_journal(path)
+    sim = _start_sim(path, header)
+    companies = sim.market.companies
+
+    def decode(value):
+        if isinstance(value, dict) and "company" in value:
+            return companies[value["company"]]
+        return value
+
+    def run_to(tick):
+        if tick > sim.market.global_tick:
+            sim.step(tick - sim.market.global_tick, listener)
+
+    started = time.perf_counter()
+    start_tick = sim.market.global_tick
+    commands = checks = 0
+    for record in records:
+        if until is not None and record["t"] > until:
+            break
+        run_to(record["t"])
+        if "cmd" in record:
+            args = [decode(a) for a in record["args"]]
+            kwargs = {k: decode(v) for k, v in record.get("kwargs", {}).items()}
+            getattr(sim, record["cmd"])(*args, **kwargs)
+            commands += 1
+        else:
+            digest = record.get("check") or record.get("end")
+            if verify and digest != state_digest(sim):
+                raise ReplayMismatch(f"state differs from the journal at tick {record['t']}")
+            checks += 1
+    if until is not None:
+        run_to(until)
+    elapsed = time.perf_counter() - started
+    ticks = sim.market.global_tick - start_tick
+    return sim, {
+        "ticks": ticks,
+        "commands": commands,
+        "checks": checks,
+        "seconds": elapsed,
+        "ticks_per_sec": ticks / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a command journal headlessly.")
+    parser.add_argument("journal")
+    parser.add_argument("--until", type=int, default=None, help="stop at this tick")
+    parser.add_argument("--no-verify", action="store_true", help="skip checkpoint digests")
+    args = parser.parse_args()
+
+    sim, report = replay(args.journal, verify=not args.no_verify, until=args.until)
+    print(
+        f"{report['ticks']} ticks, {report['commands']} commands, {report['checks']} checkpoints ok "
+        f"in {report['seconds']:.2f}s ({report['ticks_per_sec']:.0f} ticks/s)"
+    )
+    print(f"final tick {sim.market.global_tick}  cash ${sim.player.cash:,.2f}  digest {state_digest(sim)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""
+Market Price Engine
+-------------------
+Struct-of-arrays price engine that advances EVERY company in one
+batched NumPy call per tick.
+
+Per-company inputs (volatility, boosts, rating, panic, demand) and the
+forming candle live in arrays indexed by company slot. Companies are
+bound to their slot, so company.price / current_* read the arrays.
+
+Movement model: bounded random walk plus demand bias, mean reversion
+toward the last daily close, panic pressure, disruption friction and
+ownership volatility, with a single shared clock for the whole market.
+Candles for every resolution (tick, hour, day, quarter) are rolled up
+incrementally by a CandleAggregator.
+"""
+
+import numpy as np
+
+from core.candle_aggregator import CandleAggregator
+
+
+def format_clock(ticks_today, ticks_per_day, global_day, global_quarter):
+    """("11:00PM UTC", "Q3 Day 12") for a point in the day."""
+    day_fraction = ticks_today / ticks_per_day
+    total_minutes = int(day_fraction * 24 * 60)
+
+    hour = (total_minutes // 60) % 24
+    minute = total_minutes % 60
+
+    ampm = "AM" if hour < 12 else "PM"
+    hour12 = hour if hour % 12 != 0 else 12
+
+    time_str = f"{hour12}:{minute:02d}{ampm} UTC"
+    quarter_str = f"Q{global_quarter} Day {global_day}"
+
+    return time_str, quarter_str
+
+
+class MarketPriceEngine:
+    """
+    Price movement system for ALL companies.
+
+    Companies must provide:
+        price, volatility
+        daily_candles, quarterly_candles (CandleSeries)
+        bind_market(market, slot)
+    """
+
+    TICKS_PER_DAY_NORMAL = 64   # ~22.5-minute ticks
+    TICKS_PER_DAY_FAST = 32     # ~45-minute ticks
+    DAYS_PER_QUARTER = 90
+    # Panic pressure below this is dropped instead of decaying forever
+    PANIC_FLOOR = 1e-6
+
+    def __init__(self, companies, rng=None, candle_depths=None):
+        self.companies = list(companies)
+        self.slots = {c: i for i, c in enumerate(self.companies)}
+        self.rng = rng if rng is not None else np.random.default_rng()
+        n = len(self.companies)
+
+        # Global simulation time (one clock for the whole market)
+        self.global_tick = 0
+        self.global_day = 1
+        self.global_quarter = 1
+        self.ticks_today = 0
+
+        self.fast_mode = False
+        self.market_disruption_factor = 0.0  # 0.0 -> 1.0 scale
+
+        # Per-company model inputs
+        self.volatility = np.array([c.volatility for c in self.companies], dtype=np.float64)
+        self.panic_pressure = np.zeros(n)
+        self.rating_factor = np.zeros(n)  # -0.5 .. +0.5
+        self.asset_boost = np.zeros(n)
+        self.sector_boost = np.zeros(n)
+        self.ownership_vol_boost = np.zeros(n)
+        self.demand_bias = np.zeros(n)
+
+        # Price + candles at every resolution; the forming daily bar rows
+        # double as company.current_open/high/low/close once bound
+        self.price = np.array([c.price for c in self.companies], dtype=np.float64)
+        self.candles = CandleAggregator(self.companies, self.price, candle_depths)
+        self.open, self.high, self.low, self.close = self.candles.forming["day"]
+        self.daily = self.candles.stores["day"]
+        self.quarterly = self.candles.stores["quarter"]
+        # Mean-reversion anchor: last finalized daily close
+        self.anchor = np.zeros(n)
+
+        for i, c in enumerate(self.companies):
+            c.ticks_today = 0
+            c.bind_market(self, i)
+        self.ticks_today = 0
+        for c in self.companies:
+            self.resync(c)
+
+    # ------------------------------------------------------------
+    # TICK ADVANCEMENT
+    # ------------------------------------------------------------
+
+    @property
+    def ticks_per_day(self):
+        return self.TICKS_PER_DAY_FAST if self.fast_mode else self.TICKS_PER_DAY_NORMAL
+
+    def tick(self):
+        """
+        One simulation tick for every company:
+            - Price moves
+            - Forming candles update
+            - Day / quarter rollover
+        """
+        prev_prices = self.price.copy()
+        self._apply_price_movement()
+
+        # Update forming candles at every resolution
+        self.candles.update(prev_prices, self.price)
+
+        self.global_tick += 1
+        self.ticks_today += 1
+        self.candles.advance_clock(self.ticks_today, self.ticks_per_day, self.price)
+
+        if self.ticks_today >= self.ticks_per_day:
+            self._close_day()
+            # Quarter rollover (trigger once at the end of each quarter)
+            if (self.global_day - 1) % self.DAYS_PER_QUARTER == 0:
+                self._close_quarter()
+
+    def advance_closed(self, n_ticks):
+        """
+        Move the clock n_ticks ahead with the market closed: prices stay
+        put and no tick bars are written; hours, days and quarters that
+        end in the span close as usual (flat bars after the first).
+        Returns the number of days closed.
+        """
+        days = 0
+        for _ in range(int(n_ticks)):
+            self.global_tick += 1
+            self.ticks_today += 1
+            self.candles.advance_clock(self.ticks_today, self.ticks_per_day, self.price)
+            if self.ticks_today >= self.ticks_per_day:
+                self._close_day()
+                days += 1
+                if (self.global_day - 1) % self.DAYS_PER_QUARTER == 0:
+                    self._close_quarter()
+        return days
+
+    # ------------------------------------------------------------
+    # PRICE MOVEMENT MODEL
+    # ------------------------------------------------------------
+
+    def _apply_price_movement(self):
+        """Volatility, drift, panic impact, disruption impact — all companies at once."""
+        n = len(self.companies)
+        rng = self.rng
+        price = self.price
+        rating = self.rating_factor
+
+        # Apply sector volatility boost
+        base_vol = self.volatility * (1.0 + self.sector_boost)
+
+        # Random walk, demand bias nudges delta
+        delta = rng.uniform(-1.0, 1.0, n) * base_vol
+        delta += base_vol * self.demand_bias * 0.5
+        # Ensure some motion even when everything is flat
+        flat = delta == 0
+        if flat.any():
+            delta[flat] = rng.uniform(-0.1, 0.1, int(flat.sum())) * base_vol[flat]
+
+        # Mean reversion drift towards recent daily close, influenced by boosts
+        drift_strength = 0.015 + (self.asset_boost + self.sector_boost) * 0.01 + rating * 0.02
+        drift = (self.anchor - price) * drift_strength
+        # CEO rating influence (positive rating accelerates drift/move, negative dampens)
+        rating_mult = 1.0 + rating * 0.4
+        delta *= rating_mult
+        drift *= rating_mult
+
+        # Panic pressure decays each tick
+        panicking = self.panic_pressure > 0
+        if panicking.any():
+            delta[panicking] -= self.panic_pressure[panicking]
+            self.panic_pressure[panicking] *= 0.90  # slow decay
+            # Snap spent pressure to zero so the mask empties again
+            self.panic_pressure[self.panic_pressure < self.PANIC_FLOOR] = 0.0
+
+        # Disruption friction (makes price movement harder)
+        if self.market_disruption_factor > 0:
+            delta *= max(0.05, 1.0 - (self.market_disruption_factor * 1.2))
+        # Ownership-driven volatility boost
+        delta *= 1.0 + self.ownership_vol_boost
+
+        new_price = price + delta + drift
+        # Ensure a visible cent-level move
+        still = np.abs(new_price - price) < 0.01
+        if still.any():
+            new_price[still] += np.where(rng.random(int(still.sum())) > 0.5, 0.02, -0.02)
+
+        # Hard floor
+        np.round(np.maximum(0.01, new_price), 2, out=price)
+
+    # ------------------------------------------------------------
+    # DAY / QUARTER CLOSE
+    # ------------------------------------------------------------
+
+    def _close_day(self):
+        """Close every forming daily candle and start new ones."""
+        self.candles.close("day", self.price)
+        np.copyto(self.anchor, self.price)
+        self.global_day += 1
+        self.ticks_today = 0
+
+        # Reset daily disruption friction
+        self.market_disruption_factor = 0.0
+
+    def _close_quarter(self):
+        """Quarterly candles come from the real prices seen during the quarter."""
+        self.candles.close("quarter", self.price)
+        self.global_quarter += 1
+
+    def resync(self, company):
+        """Re-read candle state after a company's history was rebuilt (e.g. respawn)."""
+        i = self.slots[company]
+        self.anchor[i] = company.daily_candles[-1].close if company.daily_candles else company.price
+        self.panic_pressure[i] = 0.0
+        self.candles.reset_row(i, self.price[i])
+
+    # ------------------------------------------------------------
+    # STATE (save / load)
+    # ------------------------------------------------------------
+
+    # Per-company arrays saved as-is
+    STATE_ARRAYS = (
+        "price", "anchor", "volatility", "panic_pressure", "rating_factor",
+        "asset_boost", "sector_boost", "ownership_vol_boost", "demand_bias",
+    )
+
+    def get_state(self):
+        """Clock, per-company inputs and every candle resolution (rng is saved by its RngService)."""
+        return {
+            "global_tick": self.global_tick,
+            "global_day": self.global_day,
+            "global_quarter": self.global_quarter,
+            "ticks_today": self.ticks_today,
+            "fast_mode": self.fast_mode,
+            "market_disruption_factor": self.market_disruption_factor,
+            "arrays": {name: getattr(self, name).copy() for name in self.STATE_ARRAYS},
+            "candles": self.candles.get_state(),
+        }
+
+    def set_state(self, state):
+        """Restore get_state() into this engine (same companies, same slots)."""
+        self.global_tick = int(state["global_tick"])
+        self.global_day = int(state["global_day"])
+        self.global_quarter = int(state["global_quarter"])
+        self.ticks_today = int(state["ticks_today"])
+        self.fast_mode = bool(state["fast_mode"])
+        self.market_disruption_factor = float(state["market_disruption_factor"])
+        # In place: companies and the aggregator hold these arrays
+        for name, values in state["arrays"].items():
+            np.copyto(getattr(self, name), values)
+        self.candles.set_state(state["candles"])
+
+    # ------------------------------------------------------------
+    # PANIC IMPACT
+    # ------------------------------------------------------------
+
+    def apply_panic_impact(self, company, dumped_shares, total_shares):
+        """Immediate crash + multi-tick pressure for one company."""
+        if total_shares <= 0:
+            return 0.0
+        i = self.slots[company]
+        crash_strength = dumped_shares / total_shares * 0.30
+        self.price[i] = max(0.01, self.price[i] * (1 - crash_strength))
+        self.panic_pressure[i] += crash_strength * 0.5
+        return crash_strength
+
+    # ------------------------------------------------------------
+    # CLOCK / SPEED / INPUTS
+    # ------------------------------------------------------------
+
+    def get_clock_display(self):
+        return format_clock(self.ticks_today, self.ticks_per_day, self.global_day, self.global_quarter)
+
+    def set_fast_mode(self, enabled: bool):
+        self.fast_mode = enabled
+
+    def apply_disruption_friction(self, disruption_pct):
+        """disruption_pct is 0.0 -> 1.0 (0% -> 100%), market-wide."""
+        self.market_disruption_factor = disruption_pct
+
+    def set_ratings(self, ratings):
+        """ratings 0-100 per company -> factor -0.5..+0.5."""
+        np.clip((np.asarray(ratings, dtype=np.float64) - 50.0) / 100.0, -0.5, 0.5, out=self.rating_factor)
+
+    def set_asset_boosts(self, boosts):
+        self.asset_boost[:] = boosts
+
+    def set_sector_boosts(self, boosts):
+        self.sector_boost[:] = boosts
+
+    def set_ownership_vol_boosts(self, boosts):
+        self.ownership_vol_boost[:] = boosts
+
+    def set_demand_biases(self, biases):
+        # bias expected small: positive = demand, negative = supply
+        np.clip(biases, -1.0, 1.0, out=self.demand_bias)
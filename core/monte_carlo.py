@@ -0,0 +1,178 @@
+"""
+Monte Carlo Runner
+------------------
+Runs many seeded, headless market simulations across a process pool and
+aggregates the results, for balance work without the Qt window.
+
+Each run is one MarketSimulation.new_game() (generate_companies, the
+batched price engine, AITraderLogic, AssetManager...) stepped for a
+fixed number of ticks. Workers send back a compact RunSummary; results
+are streamed as runs finish and folded into a BatchReport.
+
+Usage:
+    python -m core.monte_carlo --runs 1000 --ticks 1920 --companies 20
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass
+class RunSummary:
+    """Outcome of one seeded run (small enough to pickle cheaply)."""
+    seed: int
+    ticks: int
+    days: int
+    companies: list                 # company names, row order of the arrays below
+    start_prices: np.ndarray        # (n,)
+    final_prices: np.ndarray        # (n,)
+    price_paths: np.ndarray         # (n, days) daily closes, float32
+    bankruptcies: int
+    takeovers: int
+    dividends_total: float          # paid by all companies to all holders
+    player_cash: float
+    ai_treasury: float
+    elapsed: float
+
+
+@dataclass
+class BatchReport:
+    """Aggregate statistics over many RunSummary objects."""
+    runs: int = 0
+    bankruptcies: list = field(default_factory=list)
+    takeovers: list = field(default_factory=list)
+    dividends: list = field(default_factory=list)
+    ai_treasury: list = field(default_factory=list)
+    returns: list = field(default_factory=list)       # per run: mean final/start price
+    elapsed: float = 0.0
+
+    def add(self, summary):
+        self.runs += 1
+        self.bankruptcies.append(summary.bankruptcies)
+        self.takeovers.append(summary.takeovers)
+        self.dividends.append(summary.dividends_total)
+        self.ai_treasury.append(summary.ai_treasury)
+        self.returns.append(float(np.mean(summary.final_prices / summary.start_prices)))
+        self.elapsed += summary.elapsed
+
+    @staticmethod
+    def _describe(values):
+        a = np.asarray(values, dtype=np.float64)
+        if a.size == 0:
+            return {"mean": 0.0, "std": 0.0, "p5": 0.0, "p50": 0.0, "p95": 0.0}
+        p5, p50, p95 = np.percentile(a, [5, 50, 95])
+        return {"mean": float(a.mean()), "std": float(a.std()),
+                "p5": float(p5), "p50": float(p50), "p95": float(p95)}
+
+    def stats(self):
+        return {
+            "bankruptcies": self._describe(self.bankruptcies),
+            "takeovers": self._describe(self.takeovers),
+            "dividends": self._describe(self.dividends),
+            "ai_treasury": self._describe(self.ai_treasury),
+            "price_return": self._describe(self.returns),
+        }
+
+    def format(self):
+        lines = [f"{self.runs} runs, {self.elapsed:.1f}s CPU"]
+        for name, s in self.stats().items():
+            lines.append(
+                f"  {name:<13} mean {s['mean']:>12.2f}  std {s['std']:>11.2f}  "
+                f"p5 {s['p5']:>11.2f}  p50 {s['p50']:>11.2f}  p95 {s['p95']:>11.2f}"
+            )
+        return "\n".join(lines)
+
+
+# ------------------------------------------------------------
+#  SINGLE RUN (executes inside a worker process)
+# ------------------------------------------------------------
+
+def run_scenario(seed, ticks, company_count=10, difficulty="Medium"):
+    """Play one headless game for `ticks` ticks and summarize it."""
+    # Imported here so the pool pickles only the function reference
+    from core.simulation import MarketSimulation
+
+    started = time.perf_counter()
+    # Every subsystem draws from its own stream of the run's RngService
+    sim = MarketSimulation.new_game(
+        company_count, difficulty, "Player", "Player Corp", with_logos=False, seed=seed
+    )
+    start_prices = sim.market.price.copy()
+    sim.step(ticks)
+
+    days = sim.market.global_day - 1
+    history = sim.market.daily.window_all(days)
+    return RunSummary(
+        seed=seed,
+        ticks=ticks,
+        days=days,
+        companies=[c.name for c in sim.companies],
+        start_prices=start_prices,
+        final_prices=sim.market.price.copy(),
+        price_paths=history[:, :, 3].astype(np.float32),
+        bankruptcies=sim.bankruptcies,
+        takeovers=sim.takeovers,
+        dividends_total=round(sim.dividends_total, 2),
+        player_cash=round(sim.player.cash, 2),
+        ai_treasury=round(sim.ai_cash.total(), 2),
+        elapsed=time.perf_counter() - started,
+    )
+
+
+# ------------------------------------------------------------
+#  BATCH
+# ------------------------------------------------------------
+
+def iter_runs(runs, ticks, company_count=10, difficulty="Medium", base_seed=0, workers=None):
+    """Yield RunSummary objects as runs finish (completion order, not seed order)."""
+    seeds = range(base_seed, base_seed + runs)
+    if workers == 1:
+        for seed in seeds:
+            yield run_scenario(seed, ticks, company_count, difficulty)
+        return
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = [pool.submit(run_scenario, seed, ticks, company_count, difficulty) for seed in seeds]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_batch(runs, ticks, company_count=10, difficulty="Medium", base_seed=0, workers=None, on_result=None):
+    """Run a full batch and return the aggregated BatchReport."""
+    report = BatchReport()
+    for summary in iter_runs(runs, ticks, company_count, difficulty, base_seed, workers):
+        report.add(summary)
+        if on_result:
+            on_result(summary, report)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run seeded headless market simulations in parallel.")
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--ticks", type=int, default=1920, help="ticks per run (1920 = 30 days at normal speed)")
+    parser.add_argument("--companies", type=int, default=10)
+    parser.add_argument("--difficulty", default="Medium", choices=("Easy", "Medium", "Hard"))
+    parser.add_argument("--seed", type=int, default=0, help="first seed; run i uses seed + i")
+    parser.add_argument("--workers", type=int, default=None, help="process count (default: all cores)")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    def progress(summary, report):
+        if not args.quiet:
+            print(f"[{report.runs}/{args.runs}] seed {summary.seed}: "
+                  f"{summary.bankruptcies} bankruptcies, {summary.takeovers} takeovers, "
+                  f"${summary.dividends_total:,.2f} dividends")
+
+    wall = time.perf_counter()
+    report = run_batch(args.runs, args.ticks, args.companies, args.difficulty, args.seed, args.workers, progress)
+    print(report.format())
+    print(f"wall time {time.perf_counter() - wall:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""
+Order Book
+----------
+Price-time priority limit order book for one company, plus the market
+maker that quotes the public float into it.
+
+- Prices are integer cents inside the book (no float keys).
+- Bids and asks are binary heaps keyed by (price, order id); ids grow
+  monotonically, so equal prices fill oldest first.
+- Insert is O(log n). Cancel is O(1): the order leaves the live table
+  and its heap entry is skipped when it reaches the top (heaps are
+  rebuilt once dead entries outnumber live ones).
+- submit() matches against the opposite side at the resting price.
+  Limit orders rest with whatever is left; market orders (limit=None)
+  never rest.
+"""
+
+import heapq
+from typing import NamedTuple
+
+BUY = "buy"
+SELL = "sell"
+
+
+class Fill(NamedTuple):
+    buyer: str
+    seller: str
+    price: float
+    qty: int
+    buy_id: int
+    sell_id: int
+
+
+class Order:
+    __slots__ = ("id", "owner", "side", "price", "qty")
+
+    def __init__(self, order_id, owner, side, price, qty):
+        self.id = order_id
+        self.owner = owner
+        self.side = side
+        self.price = price  # cents
+        self.qty = qty      # remaining
+
+    @property
+    def limit(self):
+        return self.price / 100.0
+
+
+class OrderBook:
+    """Bids/asks for one company."""
+
+    def __init__(self):
+        self._bids = []     # (-price, id)
+        self._asks = []     # (price, id)
+        self._orders = {}   # id -> live Order
+        self._dead = 0
+        self._next_id = 1
+        self.last_price = None
+        self.volume = 0
+
+    def __len__(self):
+        return len(self._orders)
+
+    # ------------------------------------------------------------
+    #  ORDER ENTRY
+    # ------------------------------------------------------------
+
+    def submit(self, owner, side, qty, limit=None):
+        """
+        Match an order, rest the remainder if it is a limit order.
+        Returns (resting Order or None, [Fill, ...]).
+        """
+        qty = int(qty)
+        if qty <= 0:
+            return None, []
+        cents = None if limit is None else max(1, int(round(limit * 100)))
+        order_id = self._next_id
+        self._next_id += 1
+
+        buying = side == BUY
+        opposite = self._asks if buying else self._bids
+        fills = []
+        while qty and opposite:
+            key, rid = opposite[0]
+            resting = self._orders.get(rid)
+            if resting is None:
+                heapq.heappop(opposite)
+                self._dead -= 1
+                continue
+            price = key if buying else -key
+            if cents is not None and (price > cents if buying else price < cents):
+                break
+            q = min(qty, resting.qty)
+            if buying:
+                fills.append(Fill(owner, resting.owner, price / 100.0, q, order_id, rid))
+            else:
+                fills.append(Fill(resting.owner, owner, price / 100.0, q, rid, order_id))
+            qty -= q
+            resting.qty -= q
+            if resting.qty == 0:
+                heapq.heappop(opposite)
+                del self._orders[rid]
+
+        if fills:
+            self.last_price = fills[-1].price
+            self.volume += sum(f.qty for f in fills)
+
+        if qty and cents is not None:
+            order = Order(order_id, owner, side, cents, qty)
+            self._orders[order_id] = order
+            if buying:
+                heapq.heappush(self._bids, (-cents, order_id))
+            else:
+                heapq.heappush(self._asks, (cents, order_id))
+            return order, fills
+        return None, fills
+
+    def cancel(self, order_id):
+        """Remove a resting order; returns it (with its unfilled qty) or None."""
+        order = self._orders.pop(order_id, None)
+        if order is not None:
+            self._dead += 1
+            if self._dead > 64 and self._dead > len(self._orders):
+                self._compact()
+        return order
+
+    def get(self, order_id):
+        return self._orders.get(order_id)
+
+    def clear(self):
+        """Drop every resting order; returns them."""
+        orders = list(self._orders.values())
+        self._bids.clear()
+        self._asks.clear()
+        self._orders.clear()
+        self._dead = 0
+        self.last_price = None
+        return orders
+
+    def _compact(self):
+        live = self._orders
+        self._bids = [e for e in self._bids if e[1] in live]
+        self._asks = [e for e in self._asks if e[1] in live]
+        heapq.heapify(self._bids)
+        heapq.heapify(self._asks)
+        self._dead = 0
+
+    # ------------------------------------------------------------
+    #  STATE (save / load)
+    # ------------------------------------------------------------
+
+    def get_state(self):
+        """Live orders (id order) and counters; heaps are rebuilt on load."""
+        orders = sorted(self._orders.values(), key=lambda o: o.id)
+        return {
+            "orders": [[o.id, o.owner, o.side, o.price, o.qty] for o in orders],
+            "next_id": self._next_id,
+            "last_price": self.last_price,
+            "volume": self.volume,
+        }
+
+    def set_state(self, state):
+        self._orders = {}
+        self._bids = []
+        self._asks = []
+        for order_id, owner, side, price, qty in state["orders"]:
+            order = Order(order_id, owner, side, price, qty)
+            self._orders[order_id] = order
+            if side == BUY:
+                self._bids.append((-price, order_id))
+            else:
+                self._asks.append((price, order_id))
+        heapq.heapify(self._bids)
+        heapq.heapify(self._asks)
+        self._dead = 0
+        self._next_id = state["next_id"]
+        self.last_price = state["last_price"]
+        self.volume = state["volume"]
+
+    # ------------------------------------------------------------
+    #  READS
+    # ------------------------------------------------------------
+
+    def _top(self, heap):
+        while heap and heap[0][1] not in self._orders:
+            heapq.heappop(heap)
+            self._dead -= 1
+        return heap[0] if heap else None
+
+    def best_bid(self):
+        top = self._top(self._bids)
+        return -top[0] / 100.0 if top else None
+
+    def best_ask(self):
+        top = self._top(self._asks)
+        return top[0] / 100.0 if top else None
+
+    def _side_orders(self, side):
+        """Live orders of one side in matching order (best price, then oldest)."""
+        heap = self._bids if side == BUY else self._asks
+        return [self._orders[rid] for _, rid in sorted(heap) if rid in self._orders]
+
+    def depth(self, side, levels=10):
+        """[(price, qty), ...] aggregated per price level, best first."""
+        out = []
+        for order in self._side_orders(side):
+            price = order.price / 100.0
+            if out and out[-1][0] == price:
+                out[-1] = (price, out[-1][1] + order.qty)
+            elif len(out) == levels:
+                break
+            else:
+                out.append((price, order.qty))
+        return out
+
+    def quote_cost(self, side, qty):
+        """
+        What a market order of `qty` on `side` would get right now:
+        (fillable qty, notional). Does not touch the book.
+        """
+        remaining = int(qty)
+        notional = 0.0
+        for order in self._side_orders(SELL if side == BUY else BUY):
+            if remaining <= 0:
+                break
+            q = min(remaining, order.qty)
+            notional += q * order.price / 100.0
+            remaining -= q
+        return int(qty) - remaining, notional
+
+
+class MarketMaker:
+    """
+    Quotes the public float into a book.
+
+    Posts `levels` asks above and bids below the reference price, `step`
+    apart. Each level holds step / impact of total shares, so sweeping a
+    fraction f of all shares moves the price by about impact * f. Asks
+    never exceed the float.
+    """
+
+    OWNER = "public"
+
+    def __init__(self, levels=16, step=0.0025, impact=0.2):
+        self.levels = levels
+        self.step = step
+        self.impact = impact
+        self._quotes = {}  # book -> [order ids]
+
+    def requote(self, book, price, total_shares, float_shares):
+        """Replace this book's quotes around `price`; returns fills against resting orders."""
+        for order_id in self._quotes.pop(book, ()):
+            book.cancel(order_id)
+        size = max(1, int(total_shares * self.step / self.impact))
+        ref = max(1, int(round(price * 100)))
+        ids = []
+        fills = []
+
+        budget = int(float_shares)
+        prev = ref
+        for k in range(1, self.levels + 1):
+            if budget <= 0:
+                break
+            cents = max(prev + 1, int(round(ref * (1 + self.step * k))))
+            qty = min(size, budget)
+            order, got = book.submit(self.OWNER, SELL, qty, cents / 100.0)
+            budget -= qty
+            fills.extend(got)
+            if order is not None:
+                ids.append(order.id)
+            prev = cents
+
+        prev = ref
+        for k in range(1, self.levels + 1):
+            cents = min(prev - 1, int(round(ref * (1 - self.step * k))))
+            if cents < 1:
+                break
+            order, got = book.submit(self.OWNER, BUY, size, cents / 100.0)
+            fills.extend(got)
+            if order is not None:
+                ids.append(order.id)
+            prev = cents
+
+        self._quotes[book] = ids
+        return fills
+
+    def forget(self, book):
+        self._quotes.pop(book, None)
+
+    def quotes(self, book):
+        """Order ids of this book's live quotes."""
+        return list(self._quotes.get(book, ()))
+
+    def restore_quotes(self, book, order_ids):
+        self._quotes[book] = list(order_ids)
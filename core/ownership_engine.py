@@ -1,11 +1,12 @@
 """
 Ownership Engine
 ----------------
-Handles:
-- Player purchases / sells / dumps
-- AI ownership changes
-- Public float updates
-- Disruption contribution from trades
+Handles private share deals outside the order book:
+- Player offers to buy an AI holder's shares at a premium
+- Disruption contribution from those deals
+
+Market trades (player, autobot and AI) all go through the order books
+in core.order_book and settle in MarketSimulation.
 """
 
 import random
@@ -23,112 +24,9 @@ class OwnershipEngine:
         price
     """
 
-    def __init__(self, company):
+    def __init__(self, company, rng=None):
         self.company = company
-
-    # ------------------------------------------------------------
-    # PLAYER BUY LOGIC
-    # ------------------------------------------------------------
-
-    def buy_player(self, shares, disruption_engine):
-        """
-        Player buys X shares from the public float.
-        Returns (success, disruption_gain).
-        """
-        c = self.company
-
-        if shares <= 0 or shares > c.public_float:
-            return False, 0.0
-
-        c.public_float -= shares
-        c.player_shares += shares
-
-        disruption_gain = (shares / c.total_shares) * 3.5
-        disruption_engine.apply_trade_disruption(disruption_gain)
-
-        return True, disruption_gain
-
-    # ------------------------------------------------------------
-    # PLAYER SELL LOGIC (normal sell)
-    # ------------------------------------------------------------
-
-    def sell_player(self, shares, disruption_engine):
-        """
-        Player sells shares in an orderly way.
-        Returns (success, disruption_gain, panic_chance).
-        """
-        c = self.company
-
-        if shares <= 0 or shares > c.player_shares:
-            return False, 0.0, 0.0
-
-        c.player_shares -= shares
-        c.public_float += shares
-
-        disruption_gain = (shares / c.total_shares) * 2.5
-        panic_chance = (shares / c.total_shares) * 0.35
-
-        disruption_engine.apply_trade_disruption(disruption_gain)
-
-        return True, disruption_gain, panic_chance
-
-    # ------------------------------------------------------------
-    # PLAYER DUMP LOGIC (panic)
-    # ------------------------------------------------------------
-
-    def dump_player(self, shares, disruption_engine, price_engine):
-        """
-        Player dumps shares onto the open market instantly.
-        Returns (success, disruption_gain, panic_chance).
-        """
-        c = self.company
-
-        if shares <= 0 or shares > c.player_shares:
-            return False, 0.0, 0.0
-
-        c.player_shares -= shares
-        c.public_float += shares
-
-        disruption_gain = (shares / c.total_shares) * 6.0
-        panic_chance = (shares / c.total_shares) * 0.7
-
-        disruption_engine.apply_trade_disruption(disruption_gain)
-        price_engine.apply_panic_impact(
-            dumped_shares=shares,
-            total_shares=c.total_shares,
-        )
-
-        return True, disruption_gain, panic_chance
-
-    # ------------------------------------------------------------
-    # AI LOGIC
-    # ------------------------------------------------------------
-
-    def ai_buy(self, ai_name, shares):
-        """AI buys shares from public float."""
-        c = self.company
-        if shares <= 0 or shares > c.public_float:
-            return False
-
-        c.public_float -= shares
-        c.ai_owners[ai_name] = c.ai_owners.get(ai_name, 0) + shares
-        return True
-
-    def ai_sell(self, ai_name, shares):
-        """AI sells shares back to float."""
-        c = self.company
-        owned = c.ai_owners.get(ai_name, 0)
-        if shares <= 0 or shares > owned:
-            return False
-
-        new_amt = owned - shares
-        if new_amt > 0:
-            c.ai_owners[ai_name] = new_amt
-        else:
-            c.ai_owners.pop(ai_name, None)
-
-        c.public_float += shares
-        return True
+        self.rng = rng if rng is not None else random
 
     # ------------------------------------------------------------
     # OFFER TO AI FOR THEIR SHARES
@@ -153,7 +51,7 @@ class OwnershipEngine:
         accept_chance += premium_pct * 0.6     # premium helps
         accept_chance = max(0.02, min(0.6, accept_chance))
 
-        accepted = random.random() < accept_chance
+        accepted = self.rng.random() < accept_chance
         if not accepted:
             return False, 0
 
@@ -161,8 +59,8 @@ class OwnershipEngine:
         if c.ai_owners[ai_name] <= 0:
             del c.ai_owners[ai_name]
 
+        # Holder to holder: the public float does not change
         c.player_shares += shares
-        c.update_public_float()
 
         disrupt_gain = (shares / c.total_shares) * 5.0
         disruption_engine.apply_trade_disruption(disrupt_gain)
@@ -174,7 +72,7 @@ class OwnershipEngine:
     # ------------------------------------------------------------
 
     def total_ai_shares(self):
-        return sum(self.company.ai_owners.values())
+        return self.company.ai_shares
 
     def debug_state(self):
         c = self.company
@@ -0,0 +1,175 @@
+"""
+Persistence
+-----------
+Binary save / load of a whole MarketSimulation.
+
+File format: one numpy .npz archive.
+- Every numpy array in sim.get_state() (prices, candle rings, holdings,
+  asset ledger columns, RNG words...) is stored as its own raw entry,
+  keyed by its path in the state ("market.candles.stores.day.data").
+- Everything else (names, order books, queues, counters) goes into one
+  JSON document stored as the uint8 entry "meta".
+
+Loading is a handful of array reads plus one json.loads, so it takes
+milliseconds. Saving is split so the game never waits on the disk:
+- capture(sim):                 copies the state (main thread, fast)
+- write_snapshot(snapshot, p):  writes it (any thread, atomic replace)
+- BackgroundSaver:              does the write on a worker thread
+"""
+
+import json
+import os
+import threading
+import time
+
+import numpy as np
+
+from core.simulation import MarketSimulation
+
+SAVE_VERSION = 1
+SAVE_SUFFIX = ".smsave"
+META_KEY = "meta"
+SEP = "."
+
+
+# ------------------------------------------------------------
+#  STATE <-> (arrays, meta)
+# ------------------------------------------------------------
+
+def _split(state, arrays, prefix=""):
+    """Move every ndarray out of nested dicts into arrays{path: array}; return the rest."""
+    meta = {}
+    for key, value in state.items():
+        path = prefix + key
+        if isinstance(value, np.ndarray):
+            arrays[path] = value
+        elif isinstance(value, dict):
+            meta[key] = _split(value, arrays, path + SEP)
+        else:
+            meta[key] = value
+    return meta
+
+
+def _merge(meta, arrays):
+    """Inverse of _split(): put arrays back at their paths."""
+    state = meta
+    for path, array in arrays.items():
+        *parents, leaf = path.split(SEP)
+        node = state
+        for key in parents:
+            node = node.setdefault(key, {})
+        node[leaf] = array
+    return state
+
+
+def _json_default(value):
+    # numpy scalars that slipped into plain-data state
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"cannot save {type(value).__name__}")
+
+
+# ------------------------------------------------------------
+#  SAVE
+# ------------------------------------------------------------
+
+def capture(sim):
+    """
+    Copy the simulation's state into a snapshot ready for writing.
+    Run on the thread that steps the simulation; the write can then
+    happen anywhere.
+    """
+    arrays = {}
+    meta = _split(sim.get_state(), arrays)
+    meta["version"] = SAVE_VERSION
+    meta["saved_at"] = time.time()
+    encoded = json.dumps(meta, separators=(",", ":"), default=_json_default).encode("utf-8")
+    arrays[META_KEY] = np.frombuffer(encoded, dtype=np.uint8)
+    return arrays
+
+
+def write_snapshot(snapshot, path):
+    """Write a capture() snapshot; the file is replaced atomically."""
+    path = os.fspath(path)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as fh:
+        np.savez(fh, **snapshot)
+    os.replace(tmp, path)
+    return path
+
+
+def save_game(sim, path):
+    """Capture + write in one go (blocking)."""
+    return write_snapshot(capture(sim), path)
+
+
+# ------------------------------------------------------------
+#  LOAD
+# ------------------------------------------------------------
+
+def read_state(path):
+    """The state dict stored in a save file."""
+    with np.load(os.fspath(path), allow_pickle=False) as archive:
+        arrays = {key: archive[key] for key in archive.files}
+    meta = json.loads(arrays.pop(META_KEY).tobytes().decode("utf-8"))
+    version = meta.pop("version", None)
+    if version != SAVE_VERSION:
+        raise ValueError(f"unsupported save version {version!r} (expected {SAVE_VERSION})")
+    meta.pop("saved_at", None)
+    return _merge(meta, arrays)
+
+
+def load_game(path, with_logos=False):
+    """Rebuild the MarketSimulation stored in a save file."""
+    return MarketSimulation.from_state(read_state(path), with_logos=with_logos)
+
+
+# ------------------------------------------------------------
+#  BACKGROUND SAVES
+# ------------------------------------------------------------
+
+class BackgroundSaver:
+    """
+    Writes snapshots on a worker thread. submit() only captures (copies)
+    the state; if saves pile up, the newest snapshot wins and older
+    pending ones are dropped.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._pending = None        # (snapshot, path)
+        self._busy = False
+        self.last_path = None
+        self.last_error = None
+        self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, sim, path):
+        snapshot = capture(sim)
+        with self._cond:
+            self._pending = (snapshot, path)
+            self._cond.notify()
+
+    def wait(self, timeout=None):
+        """Block until every submitted snapshot is on disk. Returns False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._pending is None and not self._busy, timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending is not None)
+                snapshot, path = self._pending
+                self._pending = None
+                self._busy = True
+            try:
+                self.last_path = write_snapshot(snapshot, path)
+                self.last_error = None
+            except Exception as exc:  # keep the worker alive; the caller reads last_error
+                self.last_error = exc
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
@@ -0,0 +1,198 @@
+"""
+Tick Profiler
+-------------
+Low-overhead per-phase timing of the simulation tick (and of the UI
+calls that render it), kept as rolling latency histograms.
+
+- Code under test calls lap("phase") after each phase: the time since
+  the previous lap (or begin()) is charged to that phase. One
+  perf_counter_ns() call and a histogram bump per phase; a disabled
+  profiler returns straight away.
+- Histograms are HDR-style: log-linear buckets (16 per power of two,
+  ~4% relative error) from 1 us to minutes, in a fixed int64 array.
+- Each phase keeps `slots` histograms covering `window` seconds in
+  total; the oldest slot is dropped as time moves on, so percentiles
+  describe the last `window` seconds, not the whole session.
+
+Toggle at runtime with `enabled`; report() / format() / dump() for a
+debug panel or a file. The simulation worker and the dashboard each
+keep their own profiler; format_report() lays their merged reports out
+as one table. Laps are tracked per thread and the histograms sit behind
+a lock (held per record() and once per report()), so a report can be
+read from another thread.
+"""
+
+import json
+import threading
+import time
+
+import numpy as np
+
+SUB_BUCKETS = 16           # per power of two
+MIN_NS = 1 << 10           # ~1 us: everything faster lands in bucket 0
+OCTAVES = 32               # up to ~1 us * 2**32 (over an hour)
+BUCKETS = OCTAVES * SUB_BUCKETS
+_MIN_BITS = MIN_NS.bit_length() - 1
+
+
+def bucket_of(ns):
+    """Histogram bucket for a duration in nanoseconds."""
+    if ns < MIN_NS:
+        return 0
+    bits = ns.bit_length() - 1                 # floor(log2(ns))
+    octave = bits - _MIN_BITS
+    sub = (ns >> (bits - 4)) & (SUB_BUCKETS - 1)  # next 4 bits below the leading one
+    return min(BUCKETS - 1, octave * SUB_BUCKETS + sub)
+
+
+def _bucket_upper_ns():
+    """Upper edge (ns) of every bucket, for percentile reads."""
+    octave = np.arange(BUCKETS) // SUB_BUCKETS
+    sub = np.arange(BUCKETS) % SUB_BUCKETS
+    return (MIN_NS << octave) * (1.0 + (sub + 1) / SUB_BUCKETS)
+
+
+BUCKET_UPPER_NS = _bucket_upper_ns()
+
+
+def format_report(report, window):
+    """Fixed-width table of a report() (or several merged), slowest phases (by time spent) first."""
+    rows = [(phase, s) for phase, s in report.items() if s["count"]]
+    rows.sort(key=lambda r: r[1]["total_ms"], reverse=True)
+    lines = [f"{'phase':<22}{'count':>8}{'mean':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}  (ms, last {window:.0f}s)"]
+    for phase, s in rows:
+        lines.append(
+            f"{phase:<22}{s['count']:>8}{s['mean_ms']:>10.3f}{s['p50_ms']:>10.3f}"
+            f"{s['p90_ms']:>10.3f}{s['p99_ms']:>10.3f}{s['max_ms']:>10.3f}"
+        )
+    return "\n".join(lines)
+
+
+class RollingHistogram:
+    """Latency histogram over the last `window` seconds, in `slots` rotating parts."""
+
+    def __init__(self, window=30.0, slots=6, clock=time.monotonic):
+        self.slot_span = window / slots
+        self.clock = clock
+        self.counts = np.zeros((slots, BUCKETS), dtype=np.int64)
+        self.max_ns = np.zeros(slots, dtype=np.int64)
+        self.total_ns = np.zeros(slots, dtype=np.int64)
+        self._slot = 0
+        self._slot_end = clock() + self.slot_span
+
+    def _rotate(self, now):
+        slots = len(self.counts)
+        while now >= self._slot_end:
+            self._slot = (self._slot + 1) % slots
+            self.counts[self._slot] = 0
+            self.max_ns[self._slot] = 0
+            self.total_ns[self._slot] = 0
+            self._slot_end += self.slot_span
+            if now - self._slot_end > self.slot_span * slots:
+                # Idle for longer than the window: everything has expired
+                self.counts[:] = 0
+                self.max_ns[:] = 0
+                self.total_ns[:] = 0
+                self._slot_end = now + self.slot_span
+
+    def record(self, ns, now):
+        if now >= self._slot_end:
+            self._rotate(now)
+        slot = self._slot
+        self.counts[slot, bucket_of(ns)] += 1
+        self.total_ns[slot] += ns
+        if ns > self.max_ns[slot]:
+            self.max_ns[slot] = ns
+
+    def summary(self, percentiles=(50, 90, 99)):
+        """{count, mean_ms, max_ms, p50_ms, ...} over the window."""
+        self._rotate(self.clock())
+        counts = self.counts.sum(axis=0)
+        n = int(counts.sum())
+        out = {"count": n}
+        if not n:
+            return out
+        cumulative = np.cumsum(counts)
+        out["mean_ms"] = float(self.total_ns.sum()) / n / 1e6
+        out["max_ms"] = float(self.max_ns.max()) / 1e6
+        for p in percentiles:
+            idx = int(np.searchsorted(cumulative, n * p / 100.0))
+            out[f"p{p}_ms"] = min(BUCKET_UPPER_NS[idx], self.max_ns.max()) / 1e6
+        out["total_ms"] = float(self.total_ns.sum()) / 1e6
+        return out
+
+
+class TickProfiler:
+    """Per-phase rolling histograms. begin() then lap(phase) after each phase."""
+
+    def __init__(self, enabled=False, window=30.0, slots=6):
+        self.enabled = enabled
+        self.window = window
+        self.slots = slots
+        self.histograms = {}       # phase -> RollingHistogram (insertion = first-seen order)
+        self._local = threading.local()  # .last: previous lap, per thread
+        self._lock = threading.Lock()    # guards histograms (recording thread vs report())
+
+    def set_enabled(self, enabled):
+        self.enabled = bool(enabled)
+        self._local.last = time.perf_counter_ns()
+
+    def reset(self):
+        with self._lock:
+            self.histograms = {}
+
+    def begin(self):
+        """Start timing a sequence of phases."""
+        if self.enabled:
+            self._local.last = time.perf_counter_ns()
+
+    def lap(self, phase):
+        """Charge the time since the previous lap / begin() to `phase`."""
+        if not self.enabled:
+            return
+        now_ns = time.perf_counter_ns()
+        local = self._local
+        self.record(phase, now_ns - getattr(local, "last", now_ns))
+        local.last = time.perf_counter_ns()  # the bookkeeping above is not charged to the next phase
+
+    def record(self, phase, ns):
+        now = time.monotonic()
+        with self._lock:
+            hist = self.histograms.get(phase)
+            if hist is None:
+                hist = self.histograms[phase] = RollingHistogram(self.window, self.slots)
+            hist.record(ns, now)
+
+    def timed(self, phase, fn, *args, **kwargs):
+        """Call fn and record its duration under `phase` (for one-off calls)."""
+        if not self.enabled:
+            return fn(*args, **kwargs)
+        start = time.perf_counter_ns()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.record(phase, time.perf_counter_ns() - start)
+
+    # ------------------------------------------------------------
+    #  REPORTS
+    # ------------------------------------------------------------
+
+    def report(self):
+        """{phase: summary} for every phase seen (rolling window), read under the lock."""
+        with self._lock:
+            return {phase: hist.summary() for phase, hist in self.histograms.items()}
+
+    def format(self):
+        """Fixed-width table, slowest phases (by time spent) first."""
+        return format_report(self.report(), self.window)
+
+    def dump(self, path, report=None):
+        """Write `report` (default: this profiler's) as JSON (path ending in .json) or as the text table."""
+        if report is None:
+            report = self.report()
+        with open(path, "w", encoding="utf-8") as fh:
+            if str(path).endswith(".json"):
+                json.dump({"window_s": self.window, "phases": report}, fh, indent=1)
+            else:
+                fh.write(format_report(report, self.window) + "\n")
+        return path
@@ -0,0 +1,182 @@
+"""
+RNG Service
+-----------
+Deterministic, independent random streams per subsystem (and per company).
+
+- stream(name):        random.Random (same API as the `random` module,
+                       so engines can take `rng=` and default to `random`)
+- np_stream(name):     numpy Generator for vectorized code
+- company_stream(...): stream(f"company/<name>/<purpose>")
+- uniforms(name, n):   batched draw, one array instead of n calls
+- UniformBuffer:       pre-drawn uniforms served one at a time
+
+Every stream is derived from (seed, name) only, so adding a new
+subsystem or drawing more from one stream never shifts another.
+Same seed -> same game.
+"""
+
+import hashlib
+import random
+
+import numpy as np
+
+
+def _name_key(name):
+    """Stable (process-independent) spawn key for a stream name."""
+    digest = hashlib.blake2b(name.encode("utf-8"), digest_size=8).digest()
+    return tuple(int.from_bytes(digest[i:i + 4], "little") for i in (0, 4))
+
+
+class UniformBuffer:
+    """
+    Hands out floats in [0, 1) from blocks drawn in one numpy call.
+    Drop-in for rng.random() inside hot per-entity loops.
+    """
+
+    def __init__(self, generator, block=1024):
+        self.generator = generator
+        self.block = int(block)
+        self._values = np.empty(0)
+        self._pos = 0
+
+    def random(self):
+        if self._pos >= len(self._values):
+            self._values = self.generator.random(self.block)
+            self._pos = 0
+        value = self._values[self._pos]
+        self._pos += 1
+        return float(value)
+
+    def take(self, n):
+        """Next n uniforms as an array."""
+        out = np.empty(n)
+        filled = 0
+        while filled < n:
+            if self._pos >= len(self._values):
+                self._values = self.generator.random(max(self.block, n - filled))
+                self._pos = 0
+            k = min(n - filled, len(self._values) - self._pos)
+            out[filled:filled + k] = self._values[self._pos:self._pos + k]
+            self._pos += k
+            filled += k
+        return out
+
+
+class RngService:
+    """
+    One per simulation. Streams are created lazily and cached by name.
+    seed=None draws fresh OS entropy (recorded in self.seed for replays).
+    """
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = int(np.random.SeedSequence().entropy)
+        self.seed = int(seed)
+        self._py = {}
+        self._np = {}
+        self._buffers = {}
+
+    def _seed_sequence(self, name):
+        return np.random.SeedSequence(self.seed, spawn_key=_name_key(name))
+
+    # ------------------------------------------------------------
+    #  STREAMS
+    # ------------------------------------------------------------
+
+    def stream(self, name):
+        """random.Random for `name` (scalar draws, choice, sample, shuffle...)."""
+        rng = self._py.get(name)
+        if rng is None:
+            rng = random.Random(self._py_seed(name))
+            self._py[name] = rng
+        return rng
+
+    def _py_seed(self, name):
+        state = self._seed_sequence("py/" + name).generate_state(4)
+        return int.from_bytes(state.tobytes(), "little")
+
+    def np_stream(self, name):
+        """numpy Generator for `name` (array draws)."""
+        gen = self._np.get(name)
+        if gen is None:
+            gen = np.random.default_rng(self._seed_sequence("np/" + name))
+            self._np[name] = gen
+        return gen
+
+    def company_stream(self, company_name, purpose="main"):
+        return self.stream(f"company/{company_name}/{purpose}")
+
+    # ------------------------------------------------------------
+    #  BATCHED DRAWS
+    # ------------------------------------------------------------
+
+    def uniforms(self, name, n):
+        """n uniforms in [0, 1) from the numpy stream `name`."""
+        return self.np_stream(name).random(n)
+
+    def buffer(self, name, block=1024):
+        """Shared UniformBuffer over the numpy stream `name`."""
+        buf = self._buffers.get(name)
+        if buf is None:
+            buf = UniformBuffer(self.np_stream(name), block)
+            self._buffers[name] = buf
+        return buf
+
+    # ------------------------------------------------------------
+    #  STATE (save / replay)
+    # ------------------------------------------------------------
+
+    def get_state(self):
+        """Plain-data snapshot of every stream created so far."""
+        names = sorted(self._py)
+        py_states = [self._py[name].getstate() for name in names]
+        return {
+            "seed": self.seed,
+            # Mersenne Twister words stacked into one (streams, 625) array
+            "py": {
+                "names": names,
+                "words": (
+                    np.array([st[1] for st in py_states], dtype=np.uint32)
+                    if py_states else np.zeros((0, 625), np.uint32)
+                ),
+                "gauss": [st[2] for st in py_states],
+            },
+            "np": {name: gen.bit_generator.state for name, gen in self._np.items()},
+            "buffers": {name: (buf._values.tolist(), buf._pos) for name, buf in self._buffers.items()},
+        }
+
+    def set_state(self, state):
+        """
+        Restore a get_state() snapshot (streams not in it restart from the
+        seed). Streams are restored in place, so engines holding one keep
+        drawing from the restored sequence.
+        """
+        self.seed = int(state["seed"])
+        py = state.get("py") or {"names": [], "words": [], "gauss": []}
+        # One tolist() for all streams; per-word int() calls dominate big loads
+        words = np.asarray(py["words"], dtype=np.uint32).tolist()
+        py_states = {name: (tuple(w), gauss) for name, w, gauss in zip(py["names"], words, py["gauss"])}
+        np_states = state.get("np", {})
+        buffers = state.get("buffers", {})
+        for name, rng in self._py.items():
+            if name not in py_states:
+                rng.setstate(random.Random(self._py_seed(name)).getstate())
+        for name, gen in self._np.items():
+            if name not in np_states:
+                gen.bit_generator.state = np.random.default_rng(self._seed_sequence("np/" + name)).bit_generator.state
+        for name, buf in self._buffers.items():
+            if name not in buffers:
+                buf._values = np.empty(0)
+                buf._pos = 0
+        for name, (internal, gauss) in py_states.items():
+            rng = self._py.get(name)
+            if rng is None:
+                # No need to seed a stream that is overwritten right away
+                rng = self._py[name] = random.Random(0)
+            rng.setstate((3, internal, gauss))
+        for name, st in np_states.items():
+            self.np_stream(name).bit_generator.state = st
+        for name, (values, pos) in buffers.items():
+            buf = self.buffer(name)
+            buf._values = np.asarray(values, dtype=np.float64)
+            buf._pos = pos
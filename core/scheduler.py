@@ -0,0 +1,139 @@
+"""
+Scheduler
+---------
+Tick-indexed timing wheel for delayed and expiring simulation effects.
+
+Subsystems schedule an entry for a future tick instead of polling their
+state every tick; advance(tick) hands back only the entries that are due.
+
+- Entries are plain data, (kind, args): the owner dispatches on kind.
+  That keeps the wheel picklable / saveable (no bound methods inside).
+- `size` slots cover the near future (one list per tick modulo size);
+  entries further out wait in a heap and move into the wheel as their
+  tick comes within range.
+- Cost per tick is the number of entries due (plus migrations), not the
+  number of entries alive.
+"""
+
+import heapq
+
+
+class Timer:
+    """Handle for one scheduled entry."""
+
+    __slots__ = ("due", "seq", "kind", "args", "cancelled")
+
+    def __init__(self, due, seq, kind, args):
+        self.due = due
+        self.seq = seq
+        self.kind = kind
+        self.args = args
+        self.cancelled = False
+
+    def __lt__(self, other):
+        return (self.due, self.seq) < (other.due, other.seq)
+
+
+class TimingWheel:
+    """Single-level hashed timing wheel with an overflow heap."""
+
+    def __init__(self, size=256, now=0):
+        self.size = int(size)
+        self.now = int(now)           # last tick advanced to
+        self._slots = [[] for _ in range(self.size)]
+        self._overflow = []           # heap of Timers due >= now + size
+        self._seq = 0
+        self._live = 0
+
+    def __len__(self):
+        return self._live
+
+    # ------------------------------------------------------------
+    #  SCHEDULING
+    # ------------------------------------------------------------
+
+    def schedule_at(self, tick, kind, *args):
+        """Run (kind, args) at `tick` (at the next advance if that is already past)."""
+        due = max(int(tick), self.now + 1)
+        self._seq += 1
+        timer = Timer(due, self._seq, kind, args)
+        if due - self.now < self.size:
+            self._slots[due % self.size].append(timer)
+        else:
+            heapq.heappush(self._overflow, timer)
+        self._live += 1
+        return timer
+
+    def schedule(self, delay, kind, *args):
+        """Run (kind, args) `delay` ticks from now (minimum 1)."""
+        return self.schedule_at(self.now + max(1, int(delay)), kind, *args)
+
+    def cancel(self, timer):
+        """Cancel an entry; it is dropped lazily when its tick comes round."""
+        if timer is not None and not timer.cancelled:
+            timer.cancelled = True
+            self._live -= 1
+
+    # ------------------------------------------------------------
+    #  ADVANCING
+    # ------------------------------------------------------------
+
+    def advance(self, tick):
+        """
+        Move the wheel to `tick` and return the due entries as
+        [(kind, args), ...] in due order, then scheduling order.
+        """
+        tick = int(tick)
+        due = []
+        while self.now < tick:
+            if not self._live:
+                # Nothing pending (cancelled leftovers are skipped anyway)
+                self.now = tick
+                break
+            self.now += 1
+            horizon = self.now + self.size
+            overflow = self._overflow
+            while overflow and overflow[0].due < horizon:
+                timer = heapq.heappop(overflow)
+                self._slots[timer.due % self.size].append(timer)
+            slot = self._slots[self.now % self.size]
+            if not slot:
+                continue
+            self._slots[self.now % self.size] = []
+            for timer in slot:
+                if not timer.cancelled:
+                    timer.cancelled = True  # spent: a late cancel() is a no-op
+                    self._live -= 1
+                    due.append((timer.kind, timer.args))
+        return due
+
+    def pending(self):
+        """Every live entry as [(due, kind, args), ...] sorted by due tick (for saving)."""
+        timers = [t for slot in self._slots for t in slot if not t.cancelled]
+        timers.extend(t for t in self._overflow if not t.cancelled)
+        timers.sort()
+        return [(t.due, t.kind, t.args) for t in timers]
+
+    # ------------------------------------------------------------
+    #  STATE (save / load)
+    # ------------------------------------------------------------
+
+    def get_state(self, encode=None):
+        """
+        Plain-data snapshot. encode(kind, args) -> list turns args that hold
+        live objects into saveable data.
+        """
+        pending = []
+        for due, kind, args in self.pending():
+            pending.append([due, kind, encode(kind, args) if encode else list(args)])
+        return {"now": self.now, "pending": pending}
+
+    def set_state(self, state, decode=None):
+        """Replace every entry with a get_state() snapshot; decode(kind, data) -> args."""
+        self._slots = [[] for _ in range(self.size)]
+        self._overflow = []
+        self._live = 0
+        self.now = int(state["now"])
+        for due, kind, data in state["pending"]:
+            args = decode(kind, data) if decode else data
+            self.schedule_at(due, kind, *args)
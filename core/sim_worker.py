@@ -0,0 +1,345 @@
+"""
+Simulation Worker
+-----------------
+Runs a MarketSimulation on its own thread so a slow tick never blocks
+the UI.
+
+- The worker owns the simulation: only its thread steps it or calls
+  into it. Player actions go through a thread-safe command queue and
+  are applied at the next tick boundary (submit() returns a Future).
+- After every tick, and after every batch of commands, the worker
+  builds an immutable SimSnapshot off to the side and publishes it by
+  swapping a single reference (back buffer -> front buffer), so a
+  reader never sees a half-built frame.
+- TickResults and event-bus messages are queued for the UI, which
+  drains them together with the newest snapshot at its own frame rate
+  (take()); nothing is lost when frames are slower than ticks. Messages
+  are coalesced per tick (MessageBurst) and the queue keeps at most
+  FEED_CAPACITY lines, as many as the feed shows.
+
+Qt-free: a UI polls take() from a timer. Headless code can skip the
+thread and call run_once().
+"""
+
+import copy
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+
+import numpy as np
+
+from core.activity_feed import FEED_CAPACITY, MessageBurst
+
+_STOP = object()
+
+
+# ------------------------------------------------------------
+#  SNAPSHOTS
+# ------------------------------------------------------------
+
+class CandleWindow:
+    """Read-only stand-in for a CandleSeries: window(n) and len() over copied bars."""
+
+    __slots__ = ("bars",)
+
+    def __init__(self, bars):
+        self.bars = bars
+
+    def window(self, n=None):
+        if n is None or n >= len(self.bars):
+            return self.bars
+        return self.bars[len(self.bars) - max(0, int(n)):]
+
+    def __len__(self):
+        return len(self.bars)
+
+
+@dataclass(frozen=True)
+class CompanyQuote:
+    """Per-tick numbers of one company."""
+    name: str
+    price: float
+    public_float: int
+    player_shares: int
+
+
+@dataclass(frozen=True)
+class CompanyDetail(CompanyQuote):
+    """
+    The watched company in full: reads like a Company (ai_owners,
+    *_candles.window(), forming_candle()) but is a frozen copy.
+    """
+    sector: str
+    ai_owners: MappingProxyType
+    daily_candles: CandleWindow
+    quarterly_candles: CandleWindow
+    hourly_candles: CandleWindow
+    forming: MappingProxyType  # resolution -> (o, h, l, c)
+
+    def forming_candle(self, resolution="day"):
+        return self.forming[resolution]
+
+
+@dataclass(frozen=True)
+class SimSnapshot:
+    """Everything the dashboard draws for one frame, copied out of the simulation."""
+    seq: int
+    tick: int
+    clock: tuple
+    cash: float
+    portfolio_value: float
+    names: tuple
+    prices: np.ndarray         # market slot order, read-only
+    public_float: np.ndarray
+    player_shares: np.ndarray
+    autobot: dict
+    disruption: tuple          # (value, display text, color)
+    modifiers: tuple           # modifiers_for(watched company)
+    selected_index: int
+    selected: CompanyDetail
+    assets: MappingProxyType   # owner -> (summary, total value, income/day), player first
+    ceo_rating: int
+    history_days: int          # archived days the dashboard may read (0 without an archive)
+
+    def quote(self, index):
+        """CompanyQuote of company `index` (the CompanyDetail for the watched one)."""
+        if index == self.selected_index:
+            return self.selected
+        return CompanyQuote(self.names[index], float(self.prices[index]),
+                            int(self.public_float[index]), int(self.player_shares[index]))
+
+
+def _frozen(array):
+    array = np.array(array)
+    array.setflags(write=False)
+    return array
+
+
+def _window(series, n):
+    if series is None:
+        return CandleWindow(_frozen(np.empty((0, 4))))
+    return CandleWindow(_frozen(series.window(n)))
+
+
+def build_snapshot(sim, seq, watch=0, chart_window=30):
+    """SimSnapshot of `sim` with company `watch` (index) in full detail."""
+    market = sim.market
+    holdings = sim.holdings
+    c = sim.companies[watch]
+    selected = CompanyDetail(
+        name=c.name,
+        price=c.price,
+        public_float=c.public_float,
+        player_shares=c.player_shares,
+        sector=c.sector,
+        ai_owners=MappingProxyType(dict(c.ai_owners.items())),
+        daily_candles=_window(c.daily_candles, chart_window),
+        quarterly_candles=_window(c.quarterly_candles, chart_window),
+        hourly_candles=_window(c.hourly_candles, chart_window),
+        forming=MappingProxyType({res: c.forming_candle(res) for res in ("hour", "day")}),
+    )
+
+    am = sim.asset_manager
+    assets = {}
+    for owner in ["player"] + [o for o in am.owners() if o != "player"]:
+        buckets = am.summary(owner)
+        assets[owner] = (buckets, am.total_value(owner), am.income_per_day(owner)) if buckets else ({}, 0, 0)
+
+    cash = sim.player.cash
+    portfolio_value = sim.portfolio_value()
+    disruption = sim.disruption_engine
+    return SimSnapshot(
+        seq=seq,
+        tick=market.global_tick,
+        clock=market.get_clock_display(),
+        cash=cash,
+        portfolio_value=portfolio_value,
+        names=tuple(co.name for co in sim.companies),
+        prices=_frozen(market.price),
+        public_float=_frozen(holdings.public_float),
+        player_shares=_frozen(holdings.player),
+        autobot=copy.deepcopy(sim.autobot),
+        disruption=(disruption.value, disruption.get_display_text(), disruption.get_color_for_disruption()),
+        modifiers=sim.modifiers_for(c),
+        selected_index=watch,
+        selected=selected,
+        assets=MappingProxyType(assets),
+        ceo_rating=am.ceo_rating(cash, portfolio_value),
+        history_days=sim.history.day_count if sim.history is not None else 0,
+    )
+
+
+# ------------------------------------------------------------
+#  WORKER
+# ------------------------------------------------------------
+
+class SimulationWorker:
+    """
+    Owns `sim` and steps it every `interval` seconds on a background
+    thread (start() / stop()). Set `running` False to pause ticking;
+    commands are still applied.
+    """
+
+    def __init__(self, sim, interval=1.0, chart_window=30):
+        self.sim = sim
+        self.interval = interval
+        self.chart_window = chart_window
+        self.running = True
+        self.error = None           # exception that stopped the worker, if any
+
+        self._commands = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._front = None          # published SimSnapshot
+        self._fresh = False         # published since the last take()
+        self._results = []          # TickResults not yet taken
+        self._feed = deque(maxlen=FEED_CAPACITY)  # (text, color) not yet taken
+        self._burst = MessageBurst()  # messages of the tick in progress (worker thread only)
+        self._seq = 0
+        self._watch = 0
+        self._thread = None
+        self._stopping = False
+
+        sim.event_bus.subscribe(self._on_message)
+        self.publish()
+
+    # ------------------------------------------------------------
+    #  UI SIDE (any thread)
+    # ------------------------------------------------------------
+
+    def submit(self, method, *args, **kwargs):
+        """Queue sim.<method>(*args, **kwargs) for the next tick boundary. Returns a Future."""
+        return self._put(getattr(type(self.sim), method), args, kwargs)
+
+    def call(self, fn, *args, **kwargs):
+        """Queue fn(sim, *args, **kwargs) for the next tick boundary. Returns a Future."""
+        return self._put(fn, args, kwargs)
+
+    def watch(self, company):
+        """Show `company` in full detail in the following snapshots."""
+        index = self.sim.companies.index(company)
+        return self.call(lambda sim: setattr(self, "_watch", index))
+
+    def take(self):
+        """(snapshot, results, feed) if anything was published since the last take(), else None."""
+        with self._lock:
+            if not self._fresh:
+                return None
+            self._fresh = False
+            taken = (self._front, self._results, list(self._feed))
+            self._results = []
+            self._feed.clear()
+        return taken
+
+    def latest(self):
+        """Newest published snapshot."""
+        return self._front
+
+    def _put(self, fn, args, kwargs):
+        future = Future()
+        self._commands.put((fn, args, kwargs, future))
+        return future
+
+    # ------------------------------------------------------------
+    #  THREAD
+    # ------------------------------------------------------------
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Finish the current tick and queued commands, then end the thread."""
+        if self._thread is None:
+            return
+        self._stopping = True
+        self._commands.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self):
+        next_tick = time.monotonic() + self.interval
+        while not self._stopping:
+            timeout = max(0.0, next_tick - time.monotonic()) if self.running else None
+            try:
+                item = self._commands.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if item is not None:
+                self._apply(item)
+                self._apply_pending()
+                self.publish()
+                continue
+            if not self.running:
+                continue
+            self._tick()
+            now = time.monotonic()
+            # A tick slower than the interval starts the next one right away, no backlog
+            next_tick = max(next_tick + self.interval, now)
+
+    def run_once(self):
+        """Apply queued commands and advance one tick on the calling thread (no worker thread)."""
+        self._apply_pending()
+        return self._tick()
+
+    # ------------------------------------------------------------
+    #  TICK BOUNDARY
+    # ------------------------------------------------------------
+
+    def _apply_pending(self):
+        while True:
+            try:
+                item = self._commands.get_nowait()
+            except queue.Empty:
+                return
+            self._apply(item)
+
+    def _apply(self, item):
+        if item is _STOP:
+            self._stopping = True
+            return
+        fn, args, kwargs, future = item
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(self.sim, *args, **kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+
+    def _tick(self):
+        try:
+            result = self.sim.step(1)
+        except Exception as exc:
+            self.error = exc
+            self._stopping = True
+            self._on_message(f"Simulation stopped: {exc!r}", "#ff8b8b")
+            self.publish()
+            return None
+        # Copy what the simulation keeps mutating after the tick; the
+        # autobot panel reads the snapshot's copy
+        result = replace(result, ai_ratings=dict(result.ai_ratings), autobot=None)
+        with self._lock:
+            self._results.append(result)
+        self.publish()
+        return result
+
+    def publish(self):
+        """Build a snapshot (back buffer) and swap it in as the front buffer, with the coalesced feed."""
+        self._seq += 1
+        snapshot = self.sim.profiler.timed(
+            "sim.publish", build_snapshot, self.sim, self._seq, self._watch, self.chart_window,
+        )
+        lines = self._burst.flush()
+        with self._lock:
+            self._front = snapshot
+            self._fresh = True
+            self._feed.extend(lines)
+
+    def _on_message(self, text, color="#cccccc", group=None):
+        self._burst.add(text, color, group)
@@ -0,0 +1,1242 @@
+"""
+Simulation Kernel
+-----------------
+Headless (Qt-free) market simulation.
+
+Owns:
+- Companies and their per-company engines
+- Global systems (disruption, AI traders, assets, sector events)
+- Order books (one per company, public float quoted by a market maker),
+  working player orders, AI treasuries, autobot state
+- Dividends, takeovers and bankruptcy respawns
+
+Call step(n_ticks) to advance the market. Each tick produces a compact
+TickResult that a UI (or a test / batch runner) can consume.
+"""
+
+import copy
+from dataclasses import dataclass, field
+from functools import cached_property, wraps
+
+import numpy as np
+
+from core.company_generator import (
+    CLASSIC_MAX_COMPANIES, generate_companies, generate_placeholder_logo, generate_world,
+)
+from core.company_model import Company
+from core.market_engine import MarketPriceEngine
+from core.ownership_engine import OwnershipEngine
+from core.disruption_engine import DisruptionEngine
+from core.ai_traders import AITraderLogic
+from core.event_system import EventBus
+from core.player import Player
+from core.assets_engine import AssetManager
+from core.events_engine import SectorEventEngine
+from core.rng import RngService
+from core.order_book import BUY, SELL, MarketMaker, OrderBook
+from core.holdings import HoldingsStore
+from core.dividends import CashLedger, DividendEngine, DividendPayout
+from core.scheduler import TimingWheel
+from core.profiler import TickProfiler
+
+# Book owner of the pooled AI orders of one tick (see _route_ai_orders)
+AI_BATCH = "AI batch"
+
+
+# ------------------------------------------------------------
+#  TICK RESULT
+# ------------------------------------------------------------
+
+@dataclass
+class TickResult:
+    """Compact summary of one simulation tick (what the dashboard consumes)."""
+    tick: int
+    clock: tuple
+    cash: float
+    portfolio_value: float
+    ai_treasury: float
+    income: dict
+    external_income: float
+    payout: DividendPayout  # this tick's dividends as arrays
+    player_rating: int
+    ai_ratings: dict
+    active_events: list
+    trades: list = field(default_factory=list)  # (company name, delta shares, actor)
+    autobot: dict = None  # set when the bot traded this tick
+
+    # Dict views of the payout, built only when a consumer reads them
+    @cached_property
+    def dividends(self):
+        """{owner: [(company name, amount), ...]}"""
+        return self.payout.by_owner()
+
+    @cached_property
+    def dividends_paid(self):
+        return self.payout.paid()
+
+    @cached_property
+    def dividends_received(self):
+        return self.payout.received()
+
+
+# ------------------------------------------------------------
+#  COMMAND JOURNAL HOOK
+# ------------------------------------------------------------
+
+def journaled(method):
+    """Player action: recorded to sim.journal (if any) before it runs, for replays."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.journal is not None:
+            self.journal.command(self, method.__name__, args, kwargs)
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+# ------------------------------------------------------------
+#  SIMULATION
+# ------------------------------------------------------------
+
+class MarketSimulation:
+    """
+    The whole market, steppable without a QApplication.
+
+    Player actions are plain methods (buy, sell, dump, ...); feedback
+    messages go out through event_bus so any front-end can subscribe.
+    """
+
+    def __init__(self, companies, player_name="Player", seed=None, rng=None, seed_holders=True, seed_assets=True):
+        self.companies = companies
+        # Independent random streams per subsystem (same seed -> same game)
+        self.rng = rng if rng is not None else RngService(seed)
+
+        # Engines: one batched price engine, per-company ownership
+        self.market = MarketPriceEngine(self.companies, rng=self.rng.np_stream("market"))
+        # Share registry (rows match market slots)
+        self.holdings = HoldingsStore(self.companies)
+        # Built on first use (offer()); a save load never touches most of them
+        self.ownership_engines = {}
+
+        # Global systems
+        self.disruption_engine = DisruptionEngine()
+        self.ai_logic = AITraderLogic(rng=self.rng.stream("ai_traders"), rolls=self.rng.buffer("ai_rolls"))
+        self.event_bus = EventBus()
+        self.player = Player(name=player_name)
+        self.asset_manager = AssetManager(rng=self.rng.stream("assets"))
+        # Simple automation bot state
+        self.autobot = {
+            "active": False,
+            "level": 0,
+            "speed": 1,
+            "accuracy": 0.52,
+            "size": 1.0,
+            "total_pnl": 0.0,
+            "history": [],
+        }
+        # AI cash per owner (array-backed, indexed like the holdings registry)
+        self.ai_cash = CashLedger(self.holdings)
+        for c in self.companies:
+            if not getattr(c, "is_player", False):
+                self.ai_cash[c.name] = 120000
+        self.dividend_engine = DividendEngine(self.holdings, self.ai_cash)
+        self._prev_prices = {c: c.price for c in self.companies}
+        self.prev_ratings = {}
+        self.player_rating = 50
+        self.ai_ratings = {}
+        # Sorted: set order varies between processes and would break seeding
+        self.sector_events = SectorEventEngine(
+            sectors=sorted({c.sector for c in self.companies}), rng=self.rng.stream("events")
+        )
+        self.last_player_external_income = 0.0
+        # Large worlds (generate_world) and loaded saves arrive with their holders set
+        if seed_holders:
+            self._seed_intercompany_ai_holders()
+        # Order books: every trade (player, bot, AI) matches here and the
+        # fill price becomes company.price
+        self.order_books = {c: OrderBook() for c in self.companies}
+        self.market_maker = MarketMaker()
+        self._quoted_tick = {}    # company -> tick of the maker's last requote
+        self._resting = {}        # (company, order id) -> client order record
+        # Player sells/dumps worked out in chunks over several ticks
+        self.working_orders = {c: [] for c in self.companies}
+        # Delayed effects (next sell lot, bot exit expiry) fire from the
+        # wheel when due instead of being rescanned every tick
+        self.scheduler = TimingWheel(now=self.market.global_tick)
+        self._timer_handlers = {
+            "sell_lot": self._work_sell_lot,
+            "bot_exit": self._expire_bot_exit,
+        }
+        # Seed initial AI assets
+        for c in self.companies:
+            if not seed_assets or getattr(c, "is_player", False):
+                continue
+            owner_id = c.name
+            budget = self.ai_cash.get(owner_id, 0)
+            for _ in range(2):
+                pick = self.asset_manager.random_ai_pick(owner_id, budget * 0.3)
+                if pick:
+                    cost = self.asset_manager.ASSET_TYPES[pick]["cost"]
+                    if budget >= cost:
+                        self.asset_manager.purchase(pick, owner=owner_id)
+                        budget -= cost
+            self.ai_cash[owner_id] = budget
+        # Demand tracker per company
+        self.demand_scores = {c: 0.0 for c in self.companies}
+        self.sentiment = {c: 0.0 for c in self.companies}
+
+        self.last_global_day = self.market.global_day
+        self.fast_mode = False
+        self._trades = []
+        self._bot_traded = False
+        # Lifetime counters (batch runs / reports)
+        self.bankruptcies = 0
+        self.takeovers = 0
+        self.dividends_total = 0.0
+        # Optional CommandJournal (core.journal) recording player actions
+        self.journal = None
+        # Optional HistoryArchive (core.history_archive): full price history on disk
+        self.history = None
+        # Per-phase tick timing (off until profiler.set_enabled(True))
+        self.profiler = TickProfiler()
+
+    @classmethod
+    def new_game(cls, company_count, difficulty, player_name, player_company_name, with_logos=False, seed=None):
+        """Generate a fresh world and wrap it in a simulation."""
+        rng = RngService(seed)
+        companies = generate_companies(company_count, difficulty, player_company_name, with_logos=with_logos, rng=rng)
+        return cls(companies, player_name=player_name, rng=rng,
+                   seed_holders=company_count <= CLASSIC_MAX_COMPANIES)
+
+    @classmethod
+    def new_world(cls, company_count, difficulty, player_name, player_company_name, owners=None, holders=5,
+                  with_logos=False, seed=None):
+        """Large world: thousands of companies held by an owner universe of `owners` funds."""
+        rng = RngService(seed)
+        companies = generate_world(company_count, difficulty, player_company_name, owners=owners,
+                                   holders=holders, with_logos=with_logos, rng=rng)
+        return cls(companies, player_name=player_name, rng=rng, seed_holders=False)
+
+    # ============================================================
+    # PLAYER ACTIONS
+    # ============================================================
+
+    @journaled
+    def buy(self, company, shares):
+        """Market buy through the book. Returns the shares filled now (0 if none)."""
+        book = self._book(company)
+        fillable, cost = book.quote_cost(BUY, shares)
+
+        # Nothing offered: rest a limit bid (cash held until it fills)
+        if fillable <= 0:
+            limit = round(company.price * 1.02, 2)
+            escrow = limit * shares
+            if escrow > self.player.cash:
+                self.event_bus.emit(f"Insufficient funds: need ${escrow:,.2f}", "#ff8b8b")
+                return 0
+            self.player.spend(escrow)
+            order, fills = book.submit("player", BUY, shares, limit)
+            record = {"kind": "player_bid", "limit": limit}
+            self._settle(company, fills, taker=record)
+            if order is not None:
+                self._resting[(company, order.id)] = record
+            self.event_bus.emit(
+                f"No float available. Queued buy order for {shares} shares of {company.name} (limit ${limit:.2f}).",
+                "#7fd8ff",
+            )
+            return 0
+
+        if cost > self.player.cash:
+            self.event_bus.emit(f"Insufficient funds: need ${cost:,.2f}", "#ff8b8b")
+            return 0
+
+        filled, notional = self._trade(company, "player", BUY, shares)
+        if filled:
+            self.player.spend(notional)
+            self.disruption_engine.apply_trade_disruption(filled / company.total_shares * 3.5)
+            self.demand_scores[company] += filled
+            partial = f" ({shares - filled} unfilled)" if filled < shares else ""
+            self.event_bus.emit(
+                f"You bought {filled} shares of {company.name} at avg ${notional / filled:.2f}{partial}",
+                "#a8ffb0",
+            )
+        return filled
+
+    @journaled
+    def sell(self, company, shares):
+        if shares <= 0 or company.player_shares < shares:
+            self.event_bus.emit("Not enough shares to sell.", "#ff8b8b")
+            return False
+        # Reserve shares and work them into the book over time
+        company.player_shares -= shares
+        chunk = max(1, shares // 8)
+        self._queue_sell(company, {
+            "owner": "player",
+            "remaining": shares,
+            "chunk": chunk,
+            "penalty": 1.0,  # full value
+        })
+        self.event_bus.emit(f"Queued sell of {shares} shares of {company.name}", "#99d8ff")
+        return True
+
+    @journaled
+    def dump(self, company, shares):
+        if shares <= 0 or company.player_shares < shares:
+            self.event_bus.emit("Not enough shares to dump.", "#ff8b8b")
+            return False
+        # Reserve shares and schedule fast dump with worse price
+        company.player_shares -= shares
+        chunk = max(1, shares // 4)
+        self._queue_sell(company, {
+            "owner": "player",
+            "remaining": shares,
+            "chunk": chunk,
+            "penalty": 0.9,  # worse price
+        })
+        self.disruption_engine.apply_trade_disruption(10)
+        self.event_bus.emit(f"Dumped {shares} shares of {company.name} (queued, discount payout)", "#ff7b7b")
+        return True
+
+    @journaled
+    def offer(self, company, target_ai, shares, premium_pct):
+        own_eng = self._ownership_engine(company)
+        cost = company.price * shares * (1 + premium_pct / 100)
+        if cost > self.player.cash:
+            self.event_bus.emit(f"Offer failed: need ${cost:,.2f} cash", "#ff8b8b")
+            return False
+
+        accepted, transferred = own_eng.offer_purchase_from_ai(
+            target_ai, shares, self.disruption_engine, premium_pct=premium_pct / 100, accept_bias=-0.05
+        )
+
+        if accepted and transferred > 0:
+            self.player.spend(cost)
+            self.event_bus.emit(
+                f"{target_ai} accepted offer for {transferred} shares of {company.name}",
+                "#c2a8ff",
+            )
+            return True
+        self.event_bus.emit(
+            f"{target_ai} declined your offer for {shares} shares of {company.name}",
+            "#ffaa7f",
+        )
+        return False
+
+    @journaled
+    def buy_asset(self, asset_type):
+        cfg = self.asset_manager.ASSET_TYPES.get(asset_type)
+        if not cfg:
+            return False
+        cost = cfg["cost"]
+        if cost > self.player.cash:
+            self.event_bus.emit(f"Not enough cash for {asset_type} (${cost:,.0f})", "#ff8b8b")
+            return False
+
+        purchased, spent, broken = self.asset_manager.purchase(asset_type)
+        if purchased:
+            self.player.spend(cost)
+            self.event_bus.emit(
+                f"Purchased {asset_type} for ${cost:,.0f}" + (" (broken)" if broken else ""),
+                "#ff9b8f" if broken else "#9fe6ff",
+            )
+        return purchased
+
+    @journaled
+    def pr_campaign(self):
+        cost = 5000
+        if self.player.cash < cost:
+            self.event_bus.emit("Not enough cash for PR ($5,000)", "#ff8b8b")
+            return False
+        self.player.spend(cost)
+        self.disruption_engine.value = max(0, self.disruption_engine.value - 10)
+        self.prev_ratings["player"] = self.prev_ratings.get("player", 50) + 2
+        self.event_bus.emit("PR campaign lowered disruption by 10% and lifted CEO rating", "#9fe6ff")
+        return True
+
+    @journaled
+    def rd_sprint(self):
+        cost = 7000
+        if self.player.cash < cost:
+            self.event_bus.emit("Not enough cash for R&D ($7,000)", "#ff8b8b")
+            return False
+        self.player.spend(cost)
+        if self.rng.stream("actions").random() < 0.65:
+            delta = 4
+            self.event_bus.emit("R&D sprint succeeded: CEO rating +4", "#c2a8ff")
+        else:
+            delta = -3
+            self.disruption_engine.apply_trade_disruption(5)
+            self.event_bus.emit("R&D failed: CEO rating -3, disruption +5", "#ff9b8f")
+        self.prev_ratings["player"] = self.prev_ratings.get("player", 50) + delta
+        return True
+
+    @journaled
+    def sabotage(self, target_company):
+        if not target_company or target_company.is_player:
+            return False
+        cost = 4000
+        if self.player.cash < cost:
+            self.event_bus.emit("Not enough cash to sabotage ($4,000)", "#ff8b8b")
+            return False
+        self.player.spend(cost)
+        # reduce public float slightly and add disruption
+        target_company.public_float = max(0, target_company.public_float - 5)
+        self._quoted_tick.pop(target_company, None)
+        self.disruption_engine.apply_trade_disruption(12)
+        self.prev_ratings["player"] = self.prev_ratings.get("player", 50) - 5
+        self.event_bus.emit(f"Sabotaged {target_company.name} (float -5, rating hit)", "#ff7b7b")
+        return True
+
+    @journaled
+    def fortify(self, target_company=None):
+        cost = 6000
+        if self.player.cash < cost:
+            self.event_bus.emit("Not enough cash to fortify ($6,000)", "#ff8b8b")
+            return False
+        self.player.spend(cost)
+        self.event_bus.emit("Fortified operations: +3 CEO rating, -5 disruption", "#9fe6ff")
+        self.disruption_engine.value = max(0, self.disruption_engine.value - 5)
+        self.prev_ratings["player"] = self.prev_ratings.get("player", 50) + 3
+        return True
+
+    # ============================================================
+    # AUTOMATION BOT
+    # ============================================================
+
+    @journaled
+    def buy_bot(self):
+        if self.autobot["active"]:
+            self.event_bus.emit("Automation bot already active.", "#9fe6ff")
+            return False
+        cost = 15000
+        if self.player.cash < cost:
+            self.event_bus.emit(f"Need ${cost:,.0f} to activate bot.", "#ff8b8b")
+            return False
+        self.player.spend(cost)
+        self.autobot.update({"active": True, "level": 1, "speed": 1, "accuracy": 0.55, "size": 0.5})
+        self.event_bus.emit("Automation bot online (Level 1).", "#9fe6ff")
+        return True
+
+    @journaled
+    def upgrade_bot(self, aspect):
+        if not self.autobot["active"]:
+            self.event_bus.emit("Activate the bot first.", "#ff8b8b")
+            return False
+        upgrade_cost = 8000 + self.autobot["level"] * 4000
+        if self.player.cash < upgrade_cost:
+            self.event_bus.emit(f"Need ${upgrade_cost:,.0f} for upgrade.", "#ff8b8b")
+            return False
+        self.player.spend(upgrade_cost)
+        self.autobot["level"] += 1
+        if aspect == "speed":
+            self.autobot["speed"] = min(5, self.autobot["speed"] + 1)
+        elif aspect == "accuracy":
+            self.autobot["accuracy"] = min(0.9, self.autobot["accuracy"] + 0.05)
+        elif aspect == "size":
+            self.autobot["size"] = min(3.0, self.autobot["size"] + 0.25)
+        self.event_bus.emit(f"Automation upgrade applied ({aspect}).", "#9fe6ff")
+        return True
+
+    def _tick_bot(self):
+        if not self.autobot["active"]:
+            return
+        # Faster cadence; speed scales chance
+        act_chance = 0.12 * self.autobot["speed"]
+        rng = self.rng.stream("bot")
+        if rng.random() > act_chance:
+            return
+        target = rng.choice(self.companies)
+        if target.public_float <= 0:
+            return
+        base_shares = max(1, int(target.total_shares * 0.006 * self.autobot["size"]))
+        shares = min(base_shares, target.public_float)
+        fillable, cost = self._book(target).quote_cost(BUY, shares)
+        if fillable <= 0 or self.player.cash < cost:
+            return
+        win = rng.random() < self.autobot["accuracy"]
+        exit_mult = 1.012 + rng.uniform(0, 0.012) if win else 1 - (0.008 + rng.uniform(0, 0.01))
+        # Entry: market buy; exit: limit sell at the rolled target (take
+        # profit rests until the market gets there, stop-loss fills now)
+        filled, notional = self._trade(target, "autobot", BUY, shares)
+        if not filled:
+            return
+        self.player.spend(notional)
+        buy_price = notional / filled
+        exit_order = {
+            "kind": "bot_exit",
+            "name": target.name,
+            "shares": filled,
+            "buy": buy_price,
+            "filled": 0,
+            "proceeds": 0.0,
+            "placed": self.market.global_tick,
+        }
+        order, fills = self._book(target).submit("autobot", SELL, filled, round(buy_price * exit_mult, 2))
+        self._settle(target, fills, taker=exit_order)
+        if order is not None:
+            self._resting[(target, order.id)] = exit_order
+            self.scheduler.schedule(self.ticks_per_day, "bot_exit", target, order.id)
+        # Demand signal for downstream AI
+        self.demand_scores[target] = self.demand_scores.get(target, 0.0) + (shares if win else -shares * 0.5)
+
+    def _bot_exit_fill(self, exit_order, price, qty):
+        self.player.earn(price * qty)
+        exit_order["filled"] += qty
+        exit_order["proceeds"] += price * qty
+        if exit_order["filled"] < exit_order["shares"]:
+            return
+        shares = exit_order["shares"]
+        sell_price = exit_order["proceeds"] / shares
+        pnl = exit_order["proceeds"] - exit_order["buy"] * shares
+        self.autobot["total_pnl"] += pnl
+        record = {
+            "result": "WIN" if pnl > 0 else "LOSS",
+            "shares": shares,
+            "name": exit_order["name"],
+            "buy": exit_order["buy"],
+            "sell": sell_price,
+            "pnl": pnl,
+        }
+        self.autobot["history"] = (self.autobot["history"] + [record])[-20:]
+        self._bot_traded = True
+
+    def _expire_bot_exit(self, company, order_id):
+        """Scheduled a day after placing: an exit still open is sold at market."""
+        exit_order = self._resting.pop((company, order_id), None)
+        if exit_order is None:
+            return
+        order = self.order_books[company].cancel(order_id)
+        if order is not None:
+            self._trade(company, "autobot", SELL, order.qty, taker=exit_order)
+
+    # ============================================================
+    # SAVE / LOAD
+    # ============================================================
+
+    def get_state(self):
+        """
+        Full game state as plain data + numpy arrays (see core.persistence).
+        Companies are referenced by index; arrays are copies, so the result
+        can be written out while the simulation keeps running.
+        """
+        companies = self.companies
+        index = {c: i for i, c in enumerate(companies)}
+
+        def per_company(values):
+            return np.fromiter((values.get(c, 0.0) for c in companies), dtype=np.float64, count=len(companies))
+
+        def encode_timer(kind, args):
+            if kind == "sell_lot":
+                c, order = args
+                return [index[c], self.working_orders[c].index(order)]
+            company, order_id = args
+            return [index[company], order_id]
+
+        return {
+            "companies": [
+                {
+                    "name": c.name,
+                    "sector": c.sector,
+                    "volatility": c.volatility,
+                    "is_player": bool(getattr(c, "is_player", False)),
+                    "taken_over": bool(getattr(c, "taken_over", False)),
+                    "total_shares": c.total_shares,
+                }
+                for c in companies
+            ],
+            "player": {"name": self.player.name, "cash": self.player.cash},
+            "autobot": copy.deepcopy(self.autobot),
+            "disruption": self.disruption_engine.value,
+            "rng": self.rng.get_state(),
+            "market": self.market.get_state(),
+            "holdings": self.holdings.get_state(),
+            "ai_cash": self.ai_cash.get_state(),
+            "assets": self.asset_manager.get_state(),
+            "sector_events": self.sector_events.get_state(),
+            "ai_logic": self.ai_logic.get_state(),
+            "order_books": [self.order_books[c].get_state() for c in companies],
+            "maker_quotes": [self.market_maker.quotes(self.order_books[c]) for c in companies],
+            "quoted_tick": [[index[c], tick] for c, tick in self._quoted_tick.items()],
+            "resting": [[index[c], order_id, dict(record)] for (c, order_id), record in self._resting.items()],
+            "working_orders": [copy.deepcopy(self.working_orders[c]) for c in companies],
+            "scheduler": self.scheduler.get_state(encode_timer),
+            "prev_prices": per_company(self._prev_prices),
+            "demand_scores": per_company(self.demand_scores),
+            "sentiment": per_company(self.sentiment),
+            "prev_ratings": dict(self.prev_ratings),
+            "player_rating": self.player_rating,
+            "ai_ratings": dict(self.ai_ratings),
+            "last_player_external_income": self.last_player_external_income,
+            "last_global_day": self.last_global_day,
+            "fast_mode": self.fast_mode,
+            "bankruptcies": self.bankruptcies,
+            "takeovers": self.takeovers,
+            "dividends_total": self.dividends_total,
+        }
+
+    def set_state(self, state):
+        """Restore get_state() onto a simulation built over the same companies (see from_state)."""
+        companies = self.companies
+        for c, info in zip(companies, state["companies"]):
+            c.volatility = info["volatility"]
+            c.total_shares = info["total_shares"]
+            c.taken_over = info["taken_over"]
+        self.player.name = state["player"]["name"]
+        self.player.cash = float(state["player"]["cash"])
+        self.autobot = copy.deepcopy(state["autobot"])
+        self.disruption_engine.value = float(state["disruption"])
+
+        self.rng.set_state(state["rng"])
+        self.market.set_state(state["market"])
+        self.holdings.set_state(state["holdings"])
+        self.ai_cash.set_state(state["ai_cash"])
+        self.asset_manager.set_state(state["assets"])
+        self.sector_events.set_state(state["sector_events"])
+        self.ai_logic.set_state(state["ai_logic"])
+
+        # Order books + client orders
+        self._resting = {}
+        self._quoted_tick = {companies[i]: tick for i, tick in state["quoted_tick"]}
+        for c, book_state, quotes in zip(companies, state["order_books"], state["maker_quotes"]):
+            book = self.order_books[c]
+            book.set_state(book_state)
+            self.market_maker.restore_quotes(book, quotes)
+        for i, order_id, record in state["resting"]:
+            self._resting[(companies[i], order_id)] = dict(record)
+        self.working_orders = {c: copy.deepcopy(orders) for c, orders in zip(companies, state["working_orders"])}
+
+        def decode_timer(kind, data):
+            c = companies[data[0]]
+            if kind == "sell_lot":
+                return (c, self.working_orders[c][data[1]])
+            return (c, data[1])
+
+        self.scheduler.set_state(state["scheduler"], decode_timer)
+
+        self._prev_prices = dict(zip(companies, state["prev_prices"].tolist()))
+        self.demand_scores = dict(zip(companies, state["demand_scores"].tolist()))
+        self.sentiment = dict(zip(companies, state["sentiment"].tolist()))
+        self.prev_ratings = dict(state["prev_ratings"])
+        self.player_rating = state["player_rating"]
+        self.ai_ratings = dict(state["ai_ratings"])
+        self.last_player_external_income = state["last_player_external_income"]
+        self.last_global_day = state["last_global_day"]
+        self.fast_mode = state["fast_mode"]
+        self.bankruptcies = state["bankruptcies"]
+        self.takeovers = state["takeovers"]
+        self.dividends_total = state["dividends_total"]
+
+    @classmethod
+    def from_state(cls, state, with_logos=False):
+        """Rebuild a simulation from get_state() (companies skip their warm-up)."""
+        rng = RngService(state["rng"]["seed"])
+        prices = state["market"]["arrays"]["price"]
+        companies = []
+        for i, info in enumerate(state["companies"]):
+            companies.append(Company(
+                name=info["name"],
+                base_price=float(prices[i]),
+                volatility=info["volatility"],
+                sector=info["sector"],
+                logo=generate_placeholder_logo() if with_logos else None,
+                is_player=info["is_player"],
+                warm_up=False,
+            ))
+        # Holders, AI assets and streams all come from the state
+        sim = cls(companies, player_name=state["player"]["name"], rng=rng, seed_holders=False, seed_assets=False)
+        sim.set_state(state)
+        return sim
+
+    # ============================================================
+    # SPEED CONTROL
+    # ============================================================
+
+    @journaled
+    def set_fast_mode(self, fast: bool):
+        self.fast_mode = fast
+        self.market.set_fast_mode(fast)
+
+    @property
+    def ticks_per_day(self):
+        return self.market.ticks_per_day
+
+    # ============================================================
+    # MAIN TICK LOOP
+    # ============================================================
+
+    def step(self, n_ticks=1, listener=None):
+        """
+        Advance the market n_ticks times.
+        listener(result) is called after every tick; the last TickResult is returned.
+        """
+        result = None
+        for _ in range(n_ticks):
+            result = self.profiler.timed("sim.tick", self._tick)
+            if listener:
+                listener(result)
+            if self.journal is not None:
+                self.journal.tick(self)
+        return result
+
+    @journaled
+    def skip(self, n_ticks):
+        """
+        Jump n_ticks ahead with the market closed ("skip a quarter"):
+        no trading and no price moves. Assets earn and decay over the
+        span in closed form (AssetManager.fast_forward); their income
+        reaches the player, the AI treasuries and the dividend holders
+        as the ticks would have paid it. Orders due meanwhile run when
+        the market reopens. Returns the player's asset income.
+        """
+        n_ticks = int(n_ticks)
+        if n_ticks <= 0:
+            return 0.0
+        income, _, _ = self.asset_manager.fast_forward(n_ticks, self.ticks_per_day)
+        player_income = income.get("player", 0.0)
+        if player_income:
+            self.player.earn(player_income)
+        for c in self.companies:
+            if not getattr(c, "is_player", False):
+                self.ai_cash[c.name] = self.ai_cash.get(c.name, 0.0) + income.get(c.name, 0.0)
+        # Holdings do not change while closed, so one payout on the total is exact
+        self._pay_dividends(income)
+
+        days = self.market.advance_closed(n_ticks)
+        for _ in range(days):
+            self.disruption_engine.decay_daily()
+        self.last_global_day = self.market.global_day
+        if self.history is not None:
+            self.history.record(self.market)
+        self.event_bus.emit(
+            f"Market closed for {n_ticks} ticks ({days}d): assets earned ${player_income:,.0f}", "#9fe6ff",
+        )
+        return player_income
+
+    def _tick(self):
+        self._trades = []
+        self._bot_traded = False
+        trend_changes = []
+        clock = self.market
+        prof = self.profiler
+        prof.begin()
+        # Assets tick (income + decay) — do early so AI can reason about yield
+        income, _, asset_events = self.asset_manager.tick(self.ticks_per_day)
+        player_income = income.get("player", 0.0)
+        if player_income:
+            self.player.earn(player_income)
+        for owner, msg in asset_events:
+            color = "#ff9b8f" if owner == "player" else "#ffcc88"
+            self.event_bus.emit(f"{owner}: {msg}", color)
+        prof.lap("sim.assets")
+
+        # Feed disruption friction into price movement, then move every company at once
+        self.market.apply_disruption_friction(self.disruption_engine.value / 100.0)
+        self.market.tick()
+        prof.lap("sim.price")
+
+        # Client orders resting in a book see this tick's quotes
+        for company, _ in list(self._resting):
+            self._book(company)
+        prof.lap("sim.resting_orders")
+
+        # AI behavior: every holder of every company decided in one batch,
+        # then routed through the order books
+        batch = self.ai_logic.decide_batch(self.market, self.disruption_engine, income, holdings=self.holdings)
+        prof.lap("sim.ai_decide")
+        if batch is not None:
+            self._route_ai_orders(batch)
+        prof.lap("sim.ai_orders")
+
+        for c in self.companies:
+            # Free-fall detection (>5% drop in one tick)
+            prev_p = self._prev_prices.get(c, c.price)
+            pct = 0.0
+            if prev_p > 0:
+                pct = (c.price - prev_p) / prev_p
+                trend_changes.append(pct)
+                if pct <= -0.05:
+                    self.event_bus.emit(
+                        f"{c.name} in free fall ({pct*100:.1f}%)",
+                        "#ff7b7b",
+                        group="{n} companies in free fall",
+                    )
+            self._prev_prices[c] = c.price
+            # Sentiment tracking as moving avg of pct change
+            self.sentiment[c] = (self.sentiment.get(c, 0.0) * 0.9) + (pct * 0.1)
+        prof.lap("sim.sentiment")
+
+        # Bot action after AI loop
+        self._tick_bot()
+        prof.lap("sim.autobot")
+
+        self._run_scheduled(clock.global_tick)
+        prof.lap("sim.queues")
+        self._tick_ai_treasuries(income)
+        prof.lap("sim.treasuries")
+        payout = self._pay_dividends(income)
+        prof.lap("sim.dividends")
+
+        # Apply disruption decay
+        self.disruption_engine.decay_tick()
+        # Soften demand scores over time
+        for c in self.demand_scores:
+            self.demand_scores[c] *= 0.98
+            if abs(self.demand_scores[c]) < 0.5:
+                self.demand_scores[c] = 0.0
+            # Queue pressure when float is zero
+            if c.public_float <= 0:
+                self.demand_scores[c] += c.total_shares * 0.01
+        prof.lap("sim.demand")
+
+        # Daily decay check (against the clock engine)
+        if clock.global_day != self.last_global_day:
+            self.disruption_engine.decay_daily()
+            self.last_global_day = clock.global_day
+            # Spawn sector events
+            ev = self.sector_events.maybe_spawn(clock.global_day)
+            if ev:
+                tone = "#9fe6ff" if ev.drift_delta > 0 else "#ffcc88"
+                self.event_bus.emit(f"{ev.name} in {ev.sector} for {ev.duration_days}d", tone)
+        prof.lap("sim.daily")
+
+        ai_treasury = self.ai_cash.total()
+        active_events = self.active_events_snapshot()
+
+        # Stock boost from assets (player company only)
+        player_company = next((c for c in self.companies if getattr(c, "is_player", False)), None)
+        if player_company:
+            boost = self.player_asset_boost()
+            if boost:
+                player_company.price = round(player_company.price * (1.0 + boost * 0.005), 2)
+        prof.lap("sim.snapshot")
+
+        self._check_takeovers()
+        prof.lap("sim.takeovers")
+        self._check_bankruptcies()
+        prof.lap("sim.bankruptcies")
+        self._update_ratings(trend_changes)
+        prof.lap("sim.ratings")
+        if self.history is not None:
+            self.history.record(self.market)
+            prof.lap("sim.history")
+
+        return TickResult(
+            tick=clock.global_tick,
+            clock=clock.get_clock_display(),
+            cash=self.player.cash,
+            portfolio_value=self.portfolio_value(),
+            ai_treasury=ai_treasury,
+            income=income,
+            external_income=self.last_player_external_income,
+            payout=payout,
+            player_rating=self.player_rating,
+            ai_ratings=self.ai_ratings,
+            active_events=active_events,
+            trades=self._trades,
+            autobot=self.autobot if self._bot_traded else None,
+        )
+
+    # ------------------------------------------------------------
+    # ORDER BOOKS
+    # ------------------------------------------------------------
+
+    def _book(self, company):
+        """The company's book, with market-maker quotes refreshed once per tick."""
+        book = self.order_books[company]
+        if self._quoted_tick.get(company) != self.market.global_tick:
+            self._quoted_tick[company] = self.market.global_tick
+            fills = self.market_maker.requote(book, company.price, company.total_shares, company.public_float)
+            self._settle(company, fills)
+        return book
+
+    def _trade(self, company, owner, side, qty, limit=None, taker=None):
+        """Send an order to the book and settle it. Returns (filled, notional)."""
+        order, fills = self._book(company).submit(owner, side, qty, limit)
+        self._settle(company, fills, taker=taker)
+        filled = sum(f.qty for f in fills)
+        return filled, sum(f.price * f.qty for f in fills)
+
+    def _settle(self, company, fills, taker=None):
+        """
+        Move shares for each fill and run client-order bookkeeping.
+        Escrowed sides (player sells, autobot) already gave their shares
+        up; player market buys are paid by the caller; AI_BATCH sides are
+        settled by _route_ai_orders.
+        """
+        if not fills:
+            return
+        holdings = self.holdings
+        row = holdings.rows[company]
+        for f in fills:
+            # Buyer side
+            if f.buyer == MarketMaker.OWNER:
+                holdings.public_float[row] += f.qty
+            elif f.buyer == "player":
+                holdings.player[row] += f.qty
+            elif f.buyer not in ("autobot", AI_BATCH):
+                holdings.add(row, f.buyer, f.qty)
+            # Seller side
+            if f.seller == MarketMaker.OWNER:
+                holdings.public_float[row] -= f.qty
+            elif f.seller not in ("player", "autobot", AI_BATCH):
+                holdings.add(row, f.seller, -f.qty)
+            # Client records: resting orders by id, the incoming order via `taker`
+            for order_id in (f.buy_id, f.sell_id):
+                record = self._resting.get((company, order_id))
+                if record is not None:
+                    self._client_fill(company, order_id, record, f)
+            if taker is not None:
+                self._client_fill(company, None, taker, f)
+        company.price = self.order_books[company].last_price
+
+    def _client_fill(self, company, order_id, record, fill):
+        if record["kind"] == "player_bid":
+            if fill.buyer != "player":
+                return
+            # Escrow was taken at the limit; refund any price improvement
+            self.player.earn((record["limit"] - fill.price) * fill.qty)
+            self.demand_scores[company] += fill.qty
+        elif record["kind"] == "bot_exit":
+            if fill.seller != "autobot":
+                return
+            self._bot_exit_fill(record, fill.price, fill.qty)
+        book = self.order_books[company]
+        if order_id is not None and book.get(order_id) is None:
+            self._resting.pop((company, order_id), None)
+
+    def _clear_book(self, company):
+        """Drop every order for a company (respawn); refund player escrow."""
+        for order in self.order_books[company].clear():
+            record = self._resting.pop((company, order.id), None)
+            if record is not None and record["kind"] == "player_bid":
+                self.player.earn(record["limit"] * order.qty)
+        self.market_maker.forget(self.order_books[company])
+        self._quoted_tick.pop(company, None)
+
+    def _run_scheduled(self, tick):
+        """Fire every scheduler entry due by `tick`."""
+        for kind, args in self.scheduler.advance(tick):
+            self._timer_handlers[kind](*args)
+
+    def _queue_sell(self, company, order):
+        self.working_orders[company].append(order)
+        self.scheduler.schedule(1, "sell_lot", company, order)
+
+    def _work_sell_lot(self, c, o):
+        """Player sells/dumps go to the book one chunk per tick."""
+        lot = min(o["chunk"], o["remaining"])
+        self._prev_prices[c] = c.price
+        filled, notional = self._trade(c, o["owner"], SELL, lot)
+        o["remaining"] -= filled
+        # Dumps pay out at a discount on top of walking the bids
+        if o["owner"] == "player":
+            self.player.earn(notional * o["penalty"])
+        self.demand_scores[c] -= filled * (1.2 if o["penalty"] < 1.0 else 0.6)
+        if o["remaining"] > 0:
+            self.scheduler.schedule(1, "sell_lot", c, o)
+        else:
+            self.working_orders[c].remove(o)
+
+    def _route_ai_orders(self, batch):
+        """
+        Send a decided AI batch through the books: per company, all AI
+        buys as one market order and all AI sells as another (the
+        heavier side last, so the closing price leans with net demand).
+        Each side's fill is shared out in holder order, as if the orders
+        had gone in one by one, and holdings move in one array update.
+        """
+        k = batch.orders()
+        if not k.size:
+            return
+        cidx = batch.cidx[k]
+        held = batch.held[k].astype(np.int64)
+        want = np.where(batch.qty[k] > 0, batch.qty[k], -np.minimum(-batch.qty[k], held))
+        buys = want > 0
+        n = len(self.market.companies)
+        buy_total = np.bincount(cidx[buys], weights=want[buys], minlength=n).astype(np.int64)
+        sell_total = np.bincount(cidx[~buys], weights=-want[~buys], minlength=n).astype(np.int64)
+
+        # One sweep per side per company
+        bought = np.zeros(n, dtype=np.int64)
+        sold = np.zeros(n, dtype=np.int64)
+        companies = self.market.companies
+        for i in np.flatnonzero(buy_total + sell_total).tolist():
+            c = companies[i]
+            sides = [(BUY, int(buy_total[i]), bought), (SELL, int(sell_total[i]), sold)]
+            if buy_total[i] > sell_total[i]:
+                sides.reverse()
+            for side, qty, got in sides:
+                if qty:
+                    got[i], _ = self._trade(c, AI_BATCH, side, qty)
+
+        # Share each side's fill out in holder order: an order gets what
+        # is left after the earlier orders of its company (orders come
+        # grouped by company)
+        first = np.flatnonzero(np.r_[True, cidx[1:] != cidx[:-1]])
+        group_len = np.diff(np.r_[first, len(k)])
+        filled = np.zeros(len(k), dtype=np.int64)
+        for qty, got in ((np.where(buys, want, 0), bought), (np.where(buys, 0, -want), sold)):
+            before = np.cumsum(qty) - qty
+            before -= np.repeat(before[first], group_len)
+            filled += np.clip(got[cidx] - before, 0, qty)
+        delta = np.where(buys, filled, -filled)
+        self.holdings.add_many(cidx, batch.slot[k], delta)
+
+        dumped = batch.dump[k] & (filled > 0) & (filled >= held)
+        for j in np.flatnonzero(dumped).tolist():
+            c = companies[cidx[j]]
+            ai_name = batch.names[k[j]]
+            self.event_bus.emit(
+                f"{ai_name} panic-dumped all shares of {c.name}", "#ff6666",
+                group=f"{{n}} holders panic-dumped all shares of {c.name}",
+            )
+        for j in np.flatnonzero(batch.reported[k] & (filled > 0)).tolist():
+            self._on_ai_trade(companies[cidx[j]], int(delta[j]), batch.names[k[j]])
+
+    # ------------------------------------------------------------
+    # AI TREASURIES + DIVIDENDS
+    # ------------------------------------------------------------
+
+    def _tick_ai_treasuries(self, income):
+        """AI income and acquisitions."""
+        rng = self.rng.stream("treasury")
+        for c in self.companies:
+            if getattr(c, "is_player", False):
+                continue
+            owner_id = c.name
+            ai_inc = income.get(owner_id, 0.0)
+            self.ai_cash[owner_id] = self.ai_cash.get(owner_id, 0.0) + ai_inc
+            # More frequent asset buying
+            if self.ai_cash[owner_id] > 6000 and rng.random() < 0.6:
+                budget_slice = self.ai_cash[owner_id] * rng.uniform(0.15, 0.35)
+                ai_pick = self.asset_manager.random_ai_pick(owner_id, budget_slice)
+                if ai_pick:
+                    cost = self.asset_manager.ASSET_TYPES[ai_pick]["cost"]
+                    if self.ai_cash[owner_id] >= cost:
+                        self.ai_cash[owner_id] -= cost
+                        purchased, _, broken = self.asset_manager.purchase(ai_pick, owner=owner_id)
+                        if purchased:
+                            note = f"{owner_id} bought asset {ai_pick}" + (" (broken)" if broken else "")
+                            self.event_bus.emit(note, "#c2a8ff", group=f"{{n}} companies bought asset {ai_pick}")
+
+    def _pay_dividends(self, income):
+        """Dividend sharing: proportional income + controlling bonus (one array pass)."""
+        income_arr = np.fromiter(
+            (income.get(c.name, 0.0) for c in self.companies), dtype=np.float64, count=len(self.companies)
+        )
+        payout = self.dividend_engine.pay(income_arr)
+        self.last_player_external_income = payout.player_total
+        if payout.player_total > 0:
+            self.player.earn(payout.player_total)
+        self.dividends_total += payout.total
+        return payout
+
+    # ------------------------------------------------------------
+    # TAKEOVERS + BANKRUPTCIES
+    # ------------------------------------------------------------
+
+    def _check_takeovers(self):
+        """Takeover check: if player owns >50% of a company (not already taken)."""
+        for c in self.companies:
+            if getattr(c, "is_player", False):
+                continue
+            if getattr(c, "taken_over", False):
+                continue
+            if c.player_shares > c.total_shares * 0.5:
+                # Transfer AI-held assets of that owner to player
+                self.asset_manager.transfer_owner(c.name, "player")
+                c.taken_over = True
+                self.takeovers += 1
+                # Bought-out AI stakes return to the float; shares escrowed
+                # in working orders and bot exits stay out of it
+                c.public_float += c.ai_shares
+                c.ai_owners.clear()
+                self._quoted_tick.pop(c, None)
+                self.event_bus.emit(f"You took over {c.name}! Assets integrated.", "#8bf0a7")
+
+    def _check_bankruptcies(self):
+        """Bankruptcy/respawn: if price too low and float full, respawn company."""
+        rng = self.rng.stream("respawn")
+        for c in self.companies:
+            if getattr(c, "is_player", False):
+                continue
+            if c.price <= 0.5 and c.public_float >= c.total_shares * 0.95:
+                c.price = round(rng.uniform(15, 60), 2)
+                c.player_shares = 0
+                c.ai_owners = {}
+                c.public_float = c.total_shares
+                self._clear_book(c)
+                c.daily_candles.clear()
+                c.quarterly_candles.clear()
+                c.generate_initial_history()
+                c.current_open = c.price
+                c.current_high = c.price
+                c.current_low = c.price
+                c.current_close = c.price
+                self.market.resync(c)
+                self.bankruptcies += 1
+                self._prev_prices[c] = c.price
+                self.event_bus.emit(f"{c.name} went bankrupt and respawned at ${c.price}", "#ffaa7f")
+            # AI profit taking: occasionally sell small lots when price rises
+            if self._prev_prices.get(c, c.price) > 0:
+                pct = (c.price - self._prev_prices[c]) / self._prev_prices[c]
+                if pct > 0.05 and c.ai_owners and rng.random() < 0.2:
+                    for ai_name, amt in list(c.ai_owners.items()):
+                        if amt <= 0:
+                            continue
+                        sell_amt = max(1, int(amt * 0.02))
+                        sell_amt = min(sell_amt, amt)
+                        sold, _ = self._trade(c, ai_name, SELL, sell_amt)
+                        if sold:
+                            self.event_bus.emit(
+                                f"{ai_name} trimmed {sold} of {c.name}", "#99d8ff",
+                                group=f"{{n}} holders trimmed {c.name}",
+                            )
+
+    # ------------------------------------------------------------
+    # CEO RATINGS
+    # ------------------------------------------------------------
+
+    def _update_ratings(self, trend_changes):
+        avg_trend = sum(trend_changes) / len(trend_changes) if trend_changes else 0.0
+        player_rating = self.asset_manager.ceo_rating(
+            self.player.cash,
+            self.portfolio_value(),
+            owner="player",
+            disruption=self.disruption_engine.value,
+            trend=avg_trend,
+        )
+        # Apply extra penalties for disruption and negative trend
+        player_rating -= int(self.disruption_engine.value * 0.2)
+        if avg_trend < 0:
+            player_rating -= int(abs(avg_trend) * 200)
+        # Bad trades: if disruption very high, penalize rating
+        if self.disruption_engine.value > 80:
+            player_rating -= 5
+        if "player" in self.prev_ratings:
+            delta = player_rating - self.prev_ratings["player"]
+            if abs(delta) >= 10:
+                note = "surged" if delta > 0 else "plummeted"
+                self.event_bus.emit(f"Your CEO rating {note} to {player_rating}", "#9fe6ff" if delta > 0 else "#ff9b8f")
+        self.prev_ratings["player"] = player_rating
+        # Compute AI ratings per company (simplified: based on their cash + assets + price trend)
+        ai_ratings = {}
+        for c in self.companies:
+            if getattr(c, "is_player", False):
+                continue
+            owner_id = c.name
+            ai_rating = self.asset_manager.ceo_rating(
+                self.ai_cash.get(owner_id, 0.0),
+                c.price * c.ai_shares,
+                owner=owner_id,
+                disruption=0.0,
+                trend=avg_trend,
+            )
+            if avg_trend < 0:
+                ai_rating -= int(abs(avg_trend) * 150)
+            ai_ratings[c.name] = ai_rating
+        self.player_rating = player_rating
+        self.ai_ratings = ai_ratings
+
+        # Feed ratings into the market engine
+        n = len(self.companies)
+        is_player = np.fromiter((getattr(c, "is_player", False) for c in self.companies), dtype=bool, count=n)
+        ratings = np.fromiter(
+            (player_rating if p else ai_ratings.get(c.name, 50) for c, p in zip(self.companies, is_player)),
+            dtype=np.float64, count=n,
+        )
+        # Asset boost: sum boost * condition for player company only
+        asset_boosts = np.where(is_player, self.player_asset_boost(), 0.0)
+        # Sector boost from events (cached until the day or an event changes)
+        day = self.market.global_day
+        sector_boosts = self.sector_events.drift_array(self.companies, day)
+        # Ownership vol: higher player+AI ownership -> more vol
+        total_shares = np.maximum(1, self.holdings.total_shares).astype(np.float64)
+        owned = self.holdings.owned()
+        demand = np.fromiter((self.demand_scores.get(c, 0.0) for c in self.companies), dtype=np.float64, count=n)
+
+        self.market.set_ratings(ratings)
+        self.market.set_asset_boosts(asset_boosts)
+        self.market.set_sector_boosts(sector_boosts)
+        self.market.set_ownership_vol_boosts(np.minimum(0.5, owned / total_shares * 0.5))
+        self.market.set_demand_biases(demand / total_shares)
+        # sentiment indirectly affects demand bias via drift strength already; keep display only
+
+    # ------------------------------------------------------------
+    # READ-ONLY VIEWS
+    # ------------------------------------------------------------
+
+    def player_asset_boost(self):
+        """Sum of boost * condition over the player's assets (cached aggregate)."""
+        return self.asset_manager.boost_sum("player")
+
+    def active_events_snapshot(self):
+        day = self.market.global_day
+        active_ev = []
+        for ev in self.sector_events.active_events:
+            if ev.is_active(day):
+                active_ev.append({
+                    "name": ev.name,
+                    "sector": ev.sector,
+                    "drift": ev.drift_delta,
+                    "vol": ev.vol_delta,
+                    "days_left": ev.start_day + ev.duration_days - day,
+                })
+        return active_ev
+
+    def modifiers_for(self, company):
+        """(rating, asset_boost, sector_boost, disruption, demand, sentiment, ext_income) for one company."""
+        is_player = getattr(company, "is_player", False)
+        rating = self.player_rating if is_player else self.ai_ratings.get(company.name, 50)
+        asset_boost = self.player_asset_boost() if is_player else 0.0
+        sector_boost, _ = self.sector_events.company_modifiers(company, self.market.global_day)
+        demand = self.demand_scores.get(company, 0.0) / max(1, company.total_shares)
+        sentiment = self.sentiment.get(company, 0.0)
+        return (rating, asset_boost, sector_boost, self.disruption_engine.value,
+                demand, sentiment, self.last_player_external_income)
+
+    def portfolio_value(self):
+        total = 0.0
+        for c in self.companies:
+            total += c.player_shares * c.price
+        return total
+
+    # ------------------------------------------------------------
+    # INTERNALS
+    # ------------------------------------------------------------
+
+    def _ownership_engine(self, company):
+        eng = self.ownership_engines.get(company)
+        if eng is None:
+            eng = OwnershipEngine(company, rng=self.rng.company_stream(company.name, "ownership"))
+            self.ownership_engines[company] = eng
+        return eng
+
+    def _on_ai_trade(self, company, delta_shares, actor="AI"):
+        # Positive delta = buy (demand), negative = supply
+        self.demand_scores[company] = self.demand_scores.get(company, 0.0) + delta_shares
+        self._trades.append((company.name, delta_shares, actor))
+
+    def _seed_intercompany_ai_holders(self):
+        """
+        Replace generic AI holders with other company names to simulate inter-company trading.
+        """
+        names = [c.name for c in self.companies]
+        rng = self.rng.stream("seed_holders")
+        for c in self.companies:
+            # Preserve CEO stake if present
+            ceo_shares = c.ai_owners.get("CEO", 0)
+            c.ai_owners = {}
+            if ceo_shares > 0:
+                c.ai_owners["CEO"] = ceo_shares
+            remaining = c.total_shares - c.player_shares - sum(c.ai_owners.values())
+            remaining = max(0, remaining)
+            others = [n for n in names if n != c.name]
+            rng.shuffle(others)
+            for name in others[: min(5, len(others))]:
+                if remaining <= 0:
+                    break
+                give = rng.randint(1, max(1, int(c.total_shares * 0.05)))
+                give = min(give, remaining)
+                c.ai_owners[name] = give
+                remaining -= give
+            c.public_float = remaining
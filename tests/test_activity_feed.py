@@ -0,0 +1,57 @@
+import pytest
+
+from core.activity_feed import FeedRing, MessageBurst
+from core.sim_worker import SimulationWorker
+from core.simulation import MarketSimulation
+
+
+def test_burst_merges_groups_and_repeats_in_first_seen_order():
+    burst = MessageBurst()
+    burst.add("A trimmed Acme", "#f00", group="{n} holders trimmed Acme")
+    burst.add("Market opens")
+    burst.add("B trimmed Acme", "#f00", group="{n} holders trimmed Acme")
+    burst.add("Market opens")
+    burst.add("Market opens", "#0f0")             # another color is another line
+    burst.add("C dumped Beta", "#f00", group="{n} holders dumped Beta")
+    assert len(burst) == 4
+    assert burst.flush() == [
+        ("2 holders trimmed Acme", "#f00"),
+        ("Market opens (x2)", "#cccccc"),
+        ("Market opens", "#0f0"),
+        ("C dumped Beta", "#f00"),                # a lone grouped message keeps its own text
+    ]
+    assert burst.flush() == []
+
+
+def test_ring_keeps_the_newest_lines():
+    ring = FeedRing(capacity=4)
+    assert ring.extend(["a", "b", "c"]) == 0
+    assert ring.overflow(2) == 1
+    assert ring.extend(["d", "e"]) == 1
+    assert list(ring) == ["b", "c", "d", "e"] and ring[-1] == "e" and ring.total == 5
+    assert ring.extend([str(i) for i in range(10)]) == 4  # only the last `capacity` are kept
+    assert list(ring) == ["6", "7", "8", "9"]
+    with pytest.raises(IndexError):
+        ring[4]
+    ring.drop(3)
+    assert list(ring) == ["9"]
+    ring.clear()
+    assert len(ring) == 0 and ring.total == 9  # lines cut before storing are not counted
+
+
+def test_worker_feed_is_coalesced_per_tick_and_bounded(monkeypatch):
+    monkeypatch.setattr("core.sim_worker.FEED_CAPACITY", 5)
+    worker = SimulationWorker(MarketSimulation.new_game(6, "Medium", "P", "PCo", seed=4))
+    worker.take()
+    bus = worker.sim.event_bus
+    for name in "ABC":
+        bus.emit(f"{name} panic-dumped all shares of X", "#ff6666", group="{n} holders panic-dumped all shares of X")
+    worker.publish()
+    _, _, feed = worker.take()
+    assert feed == [("3 holders panic-dumped all shares of X", "#ff6666")]
+
+    for i in range(8):
+        bus.emit(f"line {i}")
+        worker.publish()
+    _, _, feed = worker.take()
+    assert [text for text, _ in feed] == [f"line {i}" for i in range(3, 8)]
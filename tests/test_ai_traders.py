@@ -0,0 +1,37 @@
+import numpy as np
+
+from core.ai_traders import AITraderLogic
+from core.simulation import MarketSimulation
+
+
+def test_batch_orders_stay_within_holdings_and_float():
+    sim = MarketSimulation.new_game(10, "Medium", "P", "PCo", seed=4)
+    logic = AITraderLogic(rng=sim.rng.stream("test_ai"), rolls=sim.rng.buffer("test_rolls"))
+    decided = 0
+    for _ in range(200):
+        sim.market.tick()
+        batch = logic.decide_batch(sim.market, sim.disruption_engine, {})
+        if batch is None:
+            continue
+        k = batch.orders()
+        decided += k.size
+        # Holders come grouped by company, with the shares they hold
+        assert np.all(np.diff(batch.cidx) >= 0)
+        for j in k.tolist():
+            c = sim.companies[batch.cidx[j]]
+            assert batch.held[j] == c.ai_owners[batch.names[j]]
+            if batch.qty[j] < 0:
+                assert -batch.qty[j] <= batch.held[j]
+            else:
+                assert batch.qty[j] <= c.public_float
+        assert not np.any(batch.dump & (batch.qty > 0))
+    assert decided
+
+
+def test_no_batch_without_holders():
+    sim = MarketSimulation.new_game(4, "Medium", "P", "PCo", seed=1)
+    for c in sim.companies:
+        c.public_float += sum(c.ai_owners.values())
+        c.ai_owners.clear()
+    logic = AITraderLogic(rng=sim.rng.stream("test_ai"))
+    assert logic.decide_batch(sim.market, sim.disruption_engine, {}) is None
@@ -0,0 +1,148 @@
+import random
+
+import pytest
+
+from core.assets_engine import AssetManager
+
+OWNERS = ["player", "Acme", "Borealis", "Cygnus"]
+
+
+class _Reference:
+    """The per-owner list-of-dicts engine the ledger replaced."""
+
+    def __init__(self):
+        self.assets = {"player": []}
+
+    def add(self, owner, asset):
+        self.assets.setdefault(owner, []).append(dict(asset))
+
+    def scrap_one(self, owner, asset_type=None):
+        items = self.assets.setdefault(owner, [])
+        pool = [a for a in items if asset_type is None or a["type"] == asset_type]
+        if not pool:
+            return 0
+        items.remove(pool[0])
+        return pool[0]["value"] * 0.4
+
+    def transfer(self, src, dst):
+        moved = self.assets.get(src, [])
+        self.assets.setdefault(dst, []).extend(moved)
+        if src in self.assets:
+            self.assets[src] = []
+        return len(moved)
+
+    def tick(self, ticks_per_day):
+        income, decay_loss = {}, {}
+        for owner, items in self.assets.items():
+            keep, owner_income, owner_decay = [], 0.0, 0.0
+            for a in items:
+                cfg = AssetManager.ASSET_TYPES[a["type"]]
+                owner_income += (cfg["income_per_day"] / ticks_per_day) * a["condition"] * a["efficiency"] * a["tier_income"]
+                a["condition"] = max(0.0, a["condition"] * (1.0 - cfg["decay"] * a["tier_decay"]))
+                new_value = cfg["cost"] * a["condition"]
+                owner_decay += max(0.0, a["value"] - new_value)
+                a["value"] = new_value
+                if a["condition"] > 0.1 and a["value"] > 100:
+                    keep.append(a)
+            self.assets[owner] = keep
+            income[owner] = owner_income
+            decay_loss[owner] = owner_decay
+        return income, decay_loss
+
+
+def _assert_same(engine, reference):
+    for owner in OWNERS:
+        got = engine.snapshot(owner)
+        want = reference.assets.get(owner, [])
+        assert len(got) == len(want), owner
+        for a, b in zip(got, want):
+            assert a["type"] == b["type"] and a["tier"] == b["tier"]
+            assert a["condition"] == pytest.approx(b["condition"])
+            assert a["value"] == pytest.approx(b["value"])
+        assert engine.total_value(owner) == pytest.approx(sum(a["value"] for a in want))
+
+
+def _random_step(engine, reference, rnd, ticks_per_day=64):
+    op = rnd.random()
+    owner = rnd.choice(OWNERS)
+    if op < 0.45:
+        asset_type = rnd.choice(engine.type_names)
+        engine.purchase(asset_type, owner=owner)
+        reference.add(owner, engine.snapshot(owner)[-1])
+    elif op < 0.55:
+        asset_type = rnd.choice([None] + engine.type_names)
+        assert engine.scrap_one(owner, asset_type) == pytest.approx(reference.scrap_one(owner, asset_type))
+    elif op < 0.6:
+        dst = rnd.choice(OWNERS)
+        if dst != owner:
+            assert engine.transfer_owner(owner, dst) == reference.transfer(owner, dst)
+    else:
+        income, decay, _ = engine.tick(ticks_per_day)
+        want_income, want_decay = reference.tick(ticks_per_day)
+        for name, amount in want_income.items():
+            assert income.get(name, 0.0) == pytest.approx(amount)
+            assert decay.get(name, 0.0) == pytest.approx(want_decay[name])
+
+
+def test_ledger_matches_the_dict_engine():
+    engine, reference = AssetManager(rng=random.Random(4), capacity=4), _Reference()
+    rnd = random.Random(9)
+    for _ in range(3000):
+        _random_step(engine, reference, rnd, ticks_per_day=8)
+    _assert_same(engine, reference)
+    assert engine.n == sum(len(items) for items in reference.assets.values())
+
+
+def test_assets_wear_out_and_are_pruned():
+    engine = AssetManager(rng=random.Random(1))
+    engine.purchase("Black Market Node", owner="Acme")
+    for _ in range(2000):
+        engine.tick(1)
+    assert engine.count("Acme") == 0 and engine.n == 0
+
+
+def test_unknown_asset_type_is_refused():
+    engine = AssetManager(rng=random.Random(1))
+    assert engine.purchase("Warp Gate") == (False, 0, False)
+    assert engine.n == 0
+
+
+def _assert_aggregates(engine):
+    for owner in engine.owners():
+        assets = engine.snapshot(owner)
+        assert engine.count(owner) == len(assets)
+        assert engine.total_value(owner) == pytest.approx(sum(a["value"] for a in assets))
+        boost = sum(engine.ASSET_TYPES[a["type"]]["boost"] * a["condition"] for a in assets)
+        assert engine.boost_sum(owner) == pytest.approx(boost, abs=1e-12)
+        income = sum(
+            engine.ASSET_TYPES[a["type"]]["income_per_day"] * a["condition"] * a["efficiency"] * a["tier_income"]
+            for a in assets
+        )
+        assert engine.income_per_day(owner) == pytest.approx(income, abs=1e-9)
+        summary = engine.summary(owner)
+        assert sum(bucket["count"] for bucket in summary.values()) == len(assets)
+        for asset_type, bucket in summary.items():
+            of_type = [a for a in assets if a["type"] == asset_type]
+            assert bucket["count"] == len(of_type)
+            assert bucket["avg_cond"] == pytest.approx(sum(a["condition"] for a in of_type) / len(of_type) * 100)
+            tiers = {}
+            for a in of_type:
+                tiers[a["tier"]] = tiers.get(a["tier"], 0) + 1
+            assert bucket["tiers"] == tiers
+
+
+def test_aggregates_track_every_change():
+    engine, reference = AssetManager(rng=random.Random(5), capacity=4), _Reference()
+    rnd = random.Random(6)
+    for step in range(1500):
+        if rnd.random() < 0.02:
+            engine.fast_forward(rnd.randint(1, 400), 8)
+            reference = _Reference()
+            for owner in engine.owners():
+                for asset in engine.snapshot(owner):
+                    reference.add(owner, asset)
+        else:
+            _random_step(engine, reference, rnd, ticks_per_day=8)
+        if step % 25 == 0:
+            _assert_aggregates(engine)
+    _assert_aggregates(engine)
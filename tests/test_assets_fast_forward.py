@@ -0,0 +1,87 @@
+import copy
+import random
+
+import numpy as np
+import pytest
+
+from core.assets_engine import AssetManager
+from core.simulation import MarketSimulation
+
+
+def _ledger(zero_decay=None, seed=3):
+    am = AssetManager(rng=random.Random(seed))
+    if zero_decay:
+        am.type_decay[am.type_ids[zero_decay]] = 0.0
+    for owner in ("player", "Alpha", "Beta"):
+        for asset_type in list(am.ASSET_TYPES) * 2:
+            am.purchase(asset_type, owner=owner)
+    return am
+
+
+def _tick_many(am, n_ticks, ticks_per_day):
+    income, decay = {}, {}
+    for _ in range(n_ticks):
+        inc, dec, _ = am.tick(ticks_per_day)
+        for owner, v in inc.items():
+            income[owner] = income.get(owner, 0.0) + v
+        for owner, v in dec.items():
+            decay[owner] = decay.get(owner, 0.0) + v
+    return income, decay
+
+
+@pytest.mark.parametrize("zero_decay", [None, "Element Mine"])
+@pytest.mark.parametrize("n_ticks", [1, 250, 3000])
+def test_fast_forward_matches_repeated_ticks(zero_decay, n_ticks):
+    jumped, stepped = _ledger(zero_decay), _ledger(zero_decay)
+    income, decay, _ = jumped.fast_forward(n_ticks, 64)
+    want_income, want_decay = _tick_many(stepped, n_ticks, 64)
+
+    assert jumped.n == stepped.n
+    np.testing.assert_allclose(jumped.condition[:jumped.n], stepped.condition[:stepped.n], rtol=1e-9)
+    np.testing.assert_allclose(jumped.value[:jumped.n], stepped.value[:stepped.n], rtol=1e-9)
+    for owner in want_income:
+        assert income[owner] == pytest.approx(want_income[owner], rel=1e-9)
+        assert decay[owner] == pytest.approx(want_decay[owner], rel=1e-9, abs=1e-6)
+
+
+def test_scrap_ticks_is_the_tick_that_scraps():
+    am = _ledger()
+    scrap_at = am.scrap_ticks()
+    alive = np.ones(am.n, dtype=bool)
+    for t in range(1, int(scrap_at.max()) + 1):
+        before = am.n
+        am.tick(64)
+        # Rows are kept in order, so the survivors are the assets not due yet
+        alive[alive] = scrap_at[alive] > t
+        assert am.n == int(alive.sum()), f"tick {t}: {before} -> {am.n}"
+    assert am.n == 0
+
+
+def test_scrap_ticks_without_decay():
+    am = _ledger(zero_decay="Element Mine")
+    mines = am.type_id[:am.n] == am.type_ids["Element Mine"]
+    scrap_at = am.scrap_ticks()
+    assert (scrap_at[mines] == AssetManager.NEVER_SCRAPPED).all()
+    assert (scrap_at[~mines] < AssetManager.NEVER_SCRAPPED).all()
+
+
+def test_skip_pays_asset_income_and_moves_the_clock():
+    sim = MarketSimulation.new_game(10, "Medium", "P", "PCo", seed=5)
+    sim.buy_asset("Mining Ship")
+    sim.step(10)
+    prices = sim.market.price.copy()
+    cash = sim.player.cash
+    day = sim.market.global_day
+    ticks = sim.ticks_per_day * 5
+
+    expected = _tick_many(_copy_ledger(sim.asset_manager), ticks, sim.ticks_per_day)[0]["player"]
+    earned = sim.skip(ticks)
+
+    assert earned == pytest.approx(expected, rel=1e-9)
+    assert sim.player.cash == pytest.approx(cash + earned + sim.last_player_external_income)
+    assert sim.market.global_day == day + 5
+    np.testing.assert_array_equal(sim.market.price, prices)
+
+
+def _copy_ledger(am):
+    return copy.deepcopy(am)
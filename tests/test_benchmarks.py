@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from benchmarks import run
+from benchmarks.world import WORLD_VERSION, build_world
+
+
+def test_world_has_the_requested_load():
+    sim = build_world(30, holders=4, assets=3, seed=2)
+    assert len(sim.companies) == 30 and sim.companies[0].is_player
+    for c in sim.companies:
+        others = {name for name in c.ai_owners if name != "CEO"}
+        assert 1 <= len(others) <= 4 and c.name not in others  # repeated picks merge
+        assert ("CEO" in c.ai_owners) != c.is_player
+        assert c.public_float + c.player_shares + sum(c.ai_owners.values()) == c.total_shares
+    counts = [sim.asset_manager.owner_count[sim.asset_manager.ensure_owner(c.name)] for c in sim.companies[1:]]
+    assert counts == [3] * 29
+    again = build_world(30, holders=4, assets=3, seed=2)
+    np.testing.assert_array_equal(again.market.price, sim.market.price)
+
+
+def test_time_calls_respects_the_call_bounds():
+    calls = []
+    samples = run.time_calls(None, lambda: calls.append(1), seconds=10.0, max_calls=7, warmup=2)
+    assert len(samples) == 7 and len(calls) == 9
+    assert len(run.time_calls(None, lambda: None, seconds=0.0, min_calls=4)) == 4
+
+
+def test_every_benchmark_runs_and_compares(tmp_path, monkeypatch):
+    results = run.run_size(12, list(run.BENCHMARKS), holders=3, assets=1, seconds=0.0, log=lambda _: None)
+    assert set(results) == set(run.BENCHMARKS)
+    assert all(stats["calls"] >= 5 and stats["p99_ms"] >= stats["p50_ms"] for stats in results.values())
+
+    monkeypatch.setattr(run, "BASELINE_DIR", str(tmp_path))
+    report = {"meta": {"date": "today", "machine": "test", "world_version": WORLD_VERSION}, "results": {"12": results}}
+    run.save_baseline("t", report)
+    text = run.compare(report, run.load_baseline("t"))
+    assert text.count("+0.0% vs baseline") == len(run.BENCHMARKS)
+
+
+def test_baselines_from_another_world_are_refused():
+    run.check_comparable(run.load_baseline("baseline"))
+    with pytest.raises(ValueError, match="world version 1"):
+        run.check_comparable({"meta": {}})
@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from core.candle_aggregator import HOURS_PER_DAY, CandleAggregator
+from core.candle_store import CLOSE, HIGH, LOW, OPEN, CandleSeries
+
+
+def _aggregator(prices):
+    companies = [
+        SimpleNamespace(daily_candles=CandleSeries.standalone(8), quarterly_candles=CandleSeries.standalone(4))
+        for _ in prices
+    ]
+    return companies, CandleAggregator(companies, np.array(prices, dtype=np.float64))
+
+
+def test_tick_bars_open_at_the_previous_price():
+    companies, agg = _aggregator([10.0, 20.0])
+    prev = np.array([10.0, 20.0])
+    path = [np.array([11.0, 19.0]), np.array([10.5, 19.5])]
+    for prices in path:
+        agg.update(prev, prices)
+        prev = prices
+    bars = agg.window("tick", 0)
+    np.testing.assert_array_equal(bars, [[10.0, 11.0, 10.0, 11.0], [11.0, 11.0, 10.5, 10.5]])
+    assert len(companies[1].tick_candles) == 2
+
+
+def test_forming_bars_track_extremes_and_day_close_rolls_over():
+    companies, agg = _aggregator([10.0])
+    prev = np.array([10.0])
+    for p in (12.0, 8.0, 9.5):
+        prices = np.array([p])
+        agg.update(prev, prices)
+        prev = prices
+    assert agg.forming_bar("day", 0) == (10.0, 12.0, 8.0, 9.5)
+
+    agg.close("day", prev)
+    assert companies[0].daily_candles[-1].high == 12.0
+    assert companies[0].daily_candles[-1].low == 8.0
+    # The next bar opens flat at the closing price
+    assert agg.forming_bar("day", 0) == (9.5, 9.5, 9.5, 9.5)
+    # Other resolutions keep forming
+    assert agg.forming_bar("quarter", 0) == (10.0, 12.0, 8.0, 9.5)
+
+
+def test_hour_bars_close_on_the_intraday_clock():
+    ticks_per_day = 48
+    _, agg = _aggregator([5.0])
+    prev = np.array([5.0])
+    for t in range(1, 2 * ticks_per_day + 1):
+        prices = prev + 0.01
+        agg.update(prev, prices)
+        agg.advance_clock(t % ticks_per_day, ticks_per_day, prices)
+        prev = prices
+    assert len(agg.window("hour", 0)) == 2 * HOURS_PER_DAY
+    bars = agg.window("hour", 0)
+    # Contiguous: each hour opens where the previous closed
+    np.testing.assert_allclose(bars[1:, OPEN], bars[:-1, CLOSE])
+    assert (bars[:, HIGH] >= bars[:, LOW]).all()
+
+
+def test_reset_row_clears_only_that_company():
+    _, agg = _aggregator([1.0, 2.0])
+    agg.update(np.array([1.0, 2.0]), np.array([1.5, 2.5]))
+    agg.reset_row(0, 3.0)
+    assert len(agg.window("tick", 0)) == 0
+    assert len(agg.window("tick", 1)) == 1
+    assert agg.forming_bar("day", 0) == (3.0, 3.0, 3.0, 3.0)
+    assert agg.forming["day"][CLOSE, 1] == 2.5
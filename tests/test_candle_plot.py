@@ -0,0 +1,78 @@
+import os
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+from charts.candle_plot import MIN_BAR_PX, CandlestickItem, merge_pairs  # noqa: E402
+
+
+@pytest.fixture(scope="module", autouse=True)
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def _bars(n, start=10.0):
+    close = start + np.arange(n, dtype=float)
+    return np.stack((close - 0.5, close + 1.0, close - 1.0, close), axis=1)
+
+
+def test_finished_candles_are_redrawn_only_when_they_change():
+    item = CandlestickItem(_bars(5), forming=(15.0, 16.0, 14.0, 15.5))
+    item.level(2)
+    levels = item._levels
+    view = _bars(5)
+    assert not item.set_candles(view, forming=(15.0, 17.0, 14.0, 16.5))  # forming bar only
+    assert item._levels is levels and len(levels) == 3 and item.count == 6
+    view[0, 0] = -1.0
+    assert item.candles[0, 0] == 9.5              # the item keeps its own copy
+    assert item.set_candles(_bars(6))             # a candle closed
+    assert len(item._levels) == 1 and item.count == 6  # merged levels are dropped
+    assert item.set_candles(_bars(6, start=50.0))  # another company, same length
+
+
+def test_price_range_covers_the_forming_candle():
+    item = CandlestickItem(_bars(3))
+    assert item.price_range() == (9.0, 13.0)
+    item.set_candles(_bars(3), forming=(12.0, 20.0, 11.0, 19.0))
+    assert item.price_range() == (9.0, 20.0)
+    item.set_candles(np.empty((0, 4)))
+    assert item.price_range() is None and item.count == 0
+    assert item._forming_item.index == 0
+
+
+def test_merged_levels_keep_the_ohlc_envelope():
+    bars = np.random.default_rng(3).uniform(1, 100, (11, 4))
+    merged = merge_pairs(bars)
+    assert merged.shape == (6, 4)
+    np.testing.assert_array_equal(merged[2], [bars[4, 0], bars[4:6, 1].max(), bars[4:6, 2].min(), bars[5, 3]])
+    np.testing.assert_array_equal(merged[-1], bars[-1])  # odd tail carried over
+
+    item = CandlestickItem(bars)
+    top = item.level(4)
+    assert len(top) == 1
+    assert top[0, 1] == bars[:, 1].max() and top[0, 2] == bars[:, 2].min()
+    assert top[0, 0] == bars[0, 0] and top[0, 3] == bars[-1, 3]
+
+
+def test_level_of_detail_choice():
+    item = CandlestickItem(_bars(5000))
+    assert item._level_for_px(MIN_BAR_PX) == 0
+    assert item._level_for_px(MIN_BAR_PX / 4) == 2
+    assert item._level_for_px(1e-9) == (5000 - 1).bit_length()  # capped at one bar
+    bars, lo, hi = item._visible(2, 100, 200)
+    assert lo == 24 and hi == 52 and bars is item.level(2)
+
+
+def test_price_range_over_a_span():
+    bars = _bars(4000)
+    item = CandlestickItem(bars)
+    low, high = item.price_range(1000, 1100)
+    assert low <= bars[1000:1100, 2].min() and high >= bars[1000:1100, 1].max()
+    assert high - low < 200                        # only a few merged neighbours at the edges
+    assert item.price_range(5000, 6000) is None
+    item.set_candles(bars, forming=(1.0, 9000.0, 0.5, 2.0))
+    assert item.price_range(3990, 4010) == (0.5, 9000.0)
+    assert item.price_range(0, 10)[1] < 9000.0
@@ -0,0 +1,76 @@
+import numpy as np
+
+from core.candle_store import CLOSE, Candle, CandleSeries, CandleStore
+
+
+def _bar(i):
+    return (i, i + 0.5, i - 0.5, i + 0.25)
+
+
+def test_window_is_the_newest_bars_oldest_first_across_wraps():
+    store = CandleStore(1, 4)
+    reference = []
+    for i in range(11):
+        store.append(0, *_bar(i))
+        reference = (reference + [_bar(i)])[-4:]
+        np.testing.assert_array_equal(store.window(0), np.array(reference))
+        np.testing.assert_array_equal(store.window(0, 2), np.array(reference[-2:]))
+    assert store.count[0] == 4
+
+
+def test_window_is_a_view_into_the_mirrored_rows():
+    store = CandleStore(2, 5)
+    for i in range(7):
+        store.append(1, *_bar(i))
+    view = store.window(1)
+    assert view.base is store.data or np.shares_memory(view, store.data)
+    # Both copies of every slot hold the same bar
+    np.testing.assert_array_equal(store.data[:, :5], store.data[:, 5:])
+
+
+def test_append_all_matches_per_row_appends():
+    bulk, single = CandleStore(3, 4), CandleStore(3, 4)
+    rng = np.random.default_rng(1)
+    for _ in range(9):
+        o, h, l, c = rng.random((4, 3))
+        bulk.append_all(o, h, l, c)
+        for row in range(3):
+            single.append(row, o[row], h[row], l[row], c[row])
+    for row in range(3):
+        np.testing.assert_array_equal(bulk.window(row), single.window(row))
+    np.testing.assert_array_equal(bulk.last(CLOSE), [single.window(r)[-1, CLOSE] for r in range(3)])
+    np.testing.assert_array_equal(bulk.window_all(3), np.stack([single.window(r, 3) for r in range(3)]))
+
+
+def test_window_all_with_rows_at_different_positions():
+    store = CandleStore(2, 4)
+    for i in range(6):
+        store.append(0, *_bar(i))
+    for i in range(3):
+        store.append(1, *_bar(10 + i))
+    np.testing.assert_array_equal(store.window_all(2), np.stack([store.window(0, 2), store.window(1, 2)]))
+
+
+def test_series_reads_like_a_list():
+    series = CandleSeries.standalone(3)
+    assert not series and len(series) == 0
+    for i in range(5):
+        series.append(Candle(*_bar(i)))
+    assert len(series) == 3
+    assert series[-1] == Candle(*map(float, _bar(4)))
+    assert [c.open for c in series] == [2.0, 3.0, 4.0]
+    assert [c.close for c in series[:2]] == [2.25, 3.25]
+    series.clear()
+    assert len(series) == 0
+
+
+def test_pack_rebinds_series_to_one_store():
+    a, b = CandleSeries.standalone(4), CandleSeries.standalone(2)
+    for i in range(3):
+        a.append(Candle(*_bar(i)))
+        b.append(Candle(*_bar(10 + i)))
+    before = (a.window().copy(), b.window().copy())
+    store = CandleStore.pack([a, b])
+    assert a.store is store and b.store is store and store.capacity == 4
+    np.testing.assert_array_equal(a.window(), before[0])
+    np.testing.assert_array_equal(b.window(), before[1])
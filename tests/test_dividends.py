@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from core.dividends import DIVIDEND_LADDER, ladder_rates
+from core.simulation import MarketSimulation
+
+
+def _reference_rate(frac):
+    for threshold, rate in DIVIDEND_LADDER:
+        if frac >= threshold:
+            return rate
+    return 0.0
+
+
+def test_ladder_rates_match_the_ladder():
+    fracs = np.array([0.0, 0.05, 0.1, 0.1999, 0.2, 0.55, 0.9, 1.0])
+    np.testing.assert_allclose(ladder_rates(fracs), [_reference_rate(f) for f in fracs])
+
+
+def test_cash_ledger_reads_like_a_dict():
+    sim = MarketSimulation.new_game(4, "Medium", "P", "PCo", seed=2)
+    ledger = sim.ai_cash
+    ledger["Newcomer"] = 5.0
+    assert ledger["Newcomer"] == 5.0 and "Newcomer" in ledger
+    ids = np.array([sim.holdings.owner_id("Newcomer")] * 3)
+    ledger.deposit(ids, np.array([1.0, 2.0, 3.0]))
+    assert ledger.get("Newcomer") == 11.0
+    del ledger["Newcomer"]
+    assert ledger.get("Newcomer") is None
+    with pytest.raises(KeyError):
+        ledger["Newcomer"]
+    assert ledger.total() == pytest.approx(sum(dict(ledger).values()))
+
+
+def test_engine_pays_what_a_per_holder_loop_would():
+    sim = MarketSimulation.new_game(12, "Medium", "P", "PCo", seed=8)
+    sim.step(200)
+    companies = sim.companies
+    income = np.linspace(0.0, 5_000.0, len(companies))
+    expected_player = 0.0
+    expected_ai = {}
+    for c, inc in zip(companies, income):
+        if inc <= 0:
+            continue
+        total = max(1, c.total_shares)
+        if c.player_shares > 0:
+            expected_player += inc * _reference_rate(c.player_shares / total)
+        for name, shares in c.ai_owners.items():
+            expected_ai[name] = expected_ai.get(name, 0.0) + inc * _reference_rate(shares / total)
+
+    cash_before = dict(sim.ai_cash)
+    payout = sim.dividend_engine.pay(income)
+    assert payout.player_total == pytest.approx(expected_player)
+    for name, amount in expected_ai.items():
+        assert sim.ai_cash[name] - cash_before.get(name, 0.0) == pytest.approx(amount)
+
+    received = payout.received()
+    assert sum(received.values()) == pytest.approx(payout.total)
+    assert sum(payout.paid().values()) == pytest.approx(payout.total)
+    assert sum(a for rows in payout.by_owner().values() for _, a in rows) == pytest.approx(payout.total)
+    assert companies[0].name not in payout.paid()  # no income, no payout
@@ -0,0 +1,56 @@
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from core.events_engine import SectorEvent, SectorEventEngine
+
+
+def _engine():
+    return SectorEventEngine(["Mining", "Energy"], rng=random.Random(0))
+
+
+def test_events_expire_on_their_end_day():
+    engine = _engine()
+    engine.add_event(SectorEvent("Boom", "Mining", drift_delta=0.02, duration_days=2), current_day=5)
+    engine.add_event(SectorEvent("Bust", "Mining", drift_delta=-0.01, duration_days=4), current_day=5)
+    assert engine.get_modifiers("Mining", 6) == pytest.approx((0.01, 0.0))
+    assert engine.get_modifiers("Mining", 7) == pytest.approx((-0.01, 0.0))
+    assert [e.name for e in engine.active_events] == ["Bust"]
+    assert engine.get_modifiers("Mining", 9) == (0.0, 0.0)
+    assert engine.active_events == [] and not engine._by_sector and not engine._expiry
+
+
+def test_modifiers_are_cached_per_day():
+    engine = _engine()
+    engine.add_event(SectorEvent("Boom", "Energy", drift_delta=0.02, vol_delta=0.1, duration_days=3), current_day=1)
+    assert engine.get_modifiers("Energy", 1) == (0.02, 0.1)
+    tables = engine._sector_mods
+    engine.get_modifiers("Energy", 1)
+    assert engine._sector_mods is tables            # same day: no rebuild
+    engine.get_modifiers("Energy", 2)
+    assert engine._sector_mods is not tables        # new day: rebuilt
+    engine.add_event(SectorEvent("Shock", "Energy", drift_delta=-0.05, duration_days=1), current_day=2)
+    assert engine.get_modifiers("Energy", 2) == pytest.approx((-0.03, 0.1))  # a new event invalidates
+
+
+def test_targeted_events_and_the_drift_column():
+    engine = _engine()
+    companies = [SimpleNamespace(name="A", sector="Mining"), SimpleNamespace(name="B", sector="Energy")]
+    engine.add_event(SectorEvent("Boom", "Mining", drift_delta=0.02, duration_days=5), current_day=1)
+    engine.add_event(SectorEvent("Probe", "Energy", drift_delta=0.5, duration_days=2, company="B"), current_day=1)
+    assert engine.get_modifiers("Energy", 1) == (0.0, 0.0)  # targeted events stay out of the sector
+    first = engine.drift_array(companies, 1)
+    np.testing.assert_allclose(first, [0.02, 0.5])
+    assert engine.drift_array(companies, 1) is first
+    np.testing.assert_allclose(engine.drift_array(companies, 3), [0.02, 0.0])
+
+
+def test_spawned_events_match_their_kind():
+    engine = _engine()
+    spawned = [ev for day in range(400) if (ev := engine.maybe_spawn(day))]
+    assert spawned
+    for ev in spawned:
+        assert ev.sector in ("Mining", "Energy") and 1 <= ev.duration_days <= 3
+        assert (ev.name == "Sector Tailwind") == (ev.drift_delta > 0)
@@ -0,0 +1,64 @@
+import numpy as np
+
+from core.candle_store import CLOSE, OPEN
+from core.history_archive import HistoryArchive
+from core.simulation import MarketSimulation
+
+
+def _sim():
+    return MarketSimulation.new_game(8, "Medium", "P", "PCo", seed=5)
+
+
+def test_archive_keeps_every_tick_and_day(tmp_path):
+    sim = _sim()
+    sim.history = archive = HistoryArchive.attach(sim.market, tmp_path / "hist")
+    start = sim.market.global_tick
+    prices = [sim.market.price.copy()]
+    for _ in range(3 * sim.ticks_per_day + 5):
+        sim.step(1)
+        prices.append(sim.market.price.copy())
+    np.testing.assert_allclose(archive.tick_prices(), np.array(prices, dtype=np.float32))
+    window = archive.tick_prices(row=2, start=start + 10, stop=start + 12)
+    np.testing.assert_allclose(window, [p[2] for p in prices[10:12]], rtol=1e-6)
+    days = archive.day_count
+    assert days == 3
+    daily = sim.market.daily
+    for back in range(days):
+        bars = archive.daily()[days - 1 - back]
+        np.testing.assert_allclose(bars[:, CLOSE], daily.last(CLOSE, back=back), rtol=1e-6)
+        assert archive.daily(row=1)[days - 1 - back, OPEN] == np.float32(daily.last(OPEN, back=back)[1])
+
+
+def test_skip_fills_the_closed_ticks_and_days(tmp_path):
+    sim = _sim()
+    sim.history = archive = HistoryArchive.attach(sim.market, tmp_path / "hist")
+    sim.step(10)
+    ticks_before = archive.tick_count
+    price = sim.market.price.copy()
+    sim.skip(2 * sim.ticks_per_day + 7)
+    assert archive.tick_count == ticks_before + 2 * sim.ticks_per_day + 7
+    closed = archive.tick_prices()[ticks_before:]
+    np.testing.assert_allclose(closed, np.broadcast_to(price, closed.shape), rtol=1e-6)
+    assert archive.day_count == sim.market.global_day - archive.start_day
+    for back in range(archive.day_count):
+        bars = archive.daily()[archive.day_count - 1 - back]
+        np.testing.assert_allclose(bars[:, CLOSE], sim.market.daily.last(CLOSE, back=back), rtol=1e-6)
+
+
+def test_attach_resumes_and_rewinds(tmp_path):
+    sim = _sim()
+    sim.history = HistoryArchive.attach(sim.market, tmp_path / "hist")
+    sim.step(sim.ticks_per_day + 3)
+    tick = sim.market.global_tick
+    sim.history.close()
+
+    resumed = HistoryArchive.attach(sim.market, tmp_path / "hist")
+    assert resumed.tick_count == tick - resumed.start_tick + 1
+
+    fresh = _sim()  # same world at an earlier tick: the archive rewinds to it
+    rewound = HistoryArchive.attach(fresh.market, tmp_path / "hist")
+    assert rewound.tick_count == 1 and rewound.day_count == 0
+
+    other = MarketSimulation.new_game(8, "Medium", "P", "PCo", seed=6)
+    restarted = HistoryArchive.attach(other.market, tmp_path / "hist")
+    assert restarted.names == [c.name for c in other.companies] and restarted.tick_count == 1
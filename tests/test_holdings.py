@@ -0,0 +1,113 @@
+import random
+import numpy as np
+
+from core.holdings import HoldingsStore
+
+
+class _Company:
+    total_shares = 10_000
+    player_shares = 0
+    public_float = 10_000
+
+    def bind_holdings(self, store, row):
+        store.player[row] = self.player_shares
+        store.public_float[row] = self.public_float
+
+
+def _store(rows, slots=2):
+    companies = [_Company() for _ in range(rows)]
+    return HoldingsStore(companies, slots=slots)
+
+
+def _assert_matches(store, reference):
+    for row, owners in enumerate(reference):
+        assert store.items(row) == list(owners.items())
+        assert store.ai_total[row] == sum(owners.values())
+        assert store.count[row] == len(owners)
+        # Unused slots are blank
+        assert (store.owner[row, store.count[row]:] == -1).all()
+        assert (store.shares[row, store.count[row]:] == 0).all()
+
+
+def _random_ops(store, reference, rnd, names, steps=400):
+    for _ in range(steps):
+        row = rnd.randrange(len(reference))
+        name = rnd.choice(names)
+        delta = rnd.randint(-60, 80)
+        store.add(row, name, delta)
+        left = reference[row].get(name, 0) + delta
+        if left > 0:
+            reference[row][name] = left
+        else:
+            reference[row].pop(name, None)
+
+
+def test_single_adds_match_a_dict_reference_and_rows_widen():
+    store, reference = _store(4), [{} for _ in range(4)]
+    rnd = random.Random(1)
+    _random_ops(store, reference, rnd, [f"AI {i}" for i in range(12)])
+    _assert_matches(store, reference)
+    assert store.owner.shape[1] >= max(len(r) for r in reference)
+
+
+def test_add_many_matches_sequential_adds():
+    store, reference = _store(5), [{} for _ in range(5)]
+    rnd = random.Random(2)
+    names = [f"AI {i}" for i in range(10)]
+    _random_ops(store, reference, rnd, names)
+    for _ in range(30):
+        rows, slots, deltas = [], [], []
+        for row in range(5):
+            for slot, (name, held) in enumerate(list(reference[row].items())):
+                if rnd.random() < 0.5:
+                    delta = rnd.choice([-held, rnd.randint(-held, 50)])
+                    rows.append(row)
+                    slots.append(slot)
+                    deltas.append(delta)
+                    reference[row][name] = held + delta
+        for row in range(5):
+            reference[row] = {n: s for n, s in reference[row].items() if s > 0}
+        store.add_many(rows, slots, deltas)
+        _assert_matches(store, reference)
+
+
+def test_compact_row_drops_empty_holders_in_order():
+    store = _store(1, slots=8)
+    for name, shares in [("a", 5), ("b", 7), ("c", 1), ("d", 4)]:
+        store.set(0, name, shares)
+    store.shares[0, 1] = 0
+    store.shares[0, 2] = -3
+    store._compact_row(0)
+    assert store.items(0) == [("a", 5), ("d", 4)]
+    assert store.ai_total[0] == 9 and store.count[0] == 2
+
+
+def test_column_queries_match_the_reference():
+    store, reference = _store(6), [{} for _ in range(6)]
+    rnd = random.Random(3)
+    names = [f"AI {i}" for i in range(8)]
+    _random_ops(store, reference, rnd, names, steps=600)
+    for name in names + ["nobody"]:
+        rows, shares = store.holdings_of(name)
+        expected = {row: owners[name] for row, owners in enumerate(reference) if name in owners}
+        assert dict(zip(rows.tolist(), shares.tolist())) == expected
+    for row, owners in enumerate(reference):
+        top = store.top_holders(row, k=3)
+        expected = sorted(owners.items(), key=lambda kv: -kv[1])[:3]
+        assert [s for _, s in top] == [s for _, s in expected]
+        assert all(owners[n] == s for n, s in top)
+    np.testing.assert_array_equal(store.owned(), [sum(o.values()) for o in reference])
+
+
+def test_view_reads_and_writes_like_a_dict():
+    from core.holdings import HoldingsView
+
+    store = _store(2)
+    view = HoldingsView(store, 1)
+    view["x"] = 10
+    view["y"] = 3
+    assert dict(view) == {"x": 10, "y": 3} and view.total() == 13
+    del view["x"]
+    assert "x" not in view and view.get("x", 0) == 0 and len(view) == 1
+    view.clear()
+    assert view.total() == 0 and store.items(1) == [] and store.items(0) == []
@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from core.journal import CommandJournal, ReplayMismatch, replay, state_digest
+from core.simulation import MarketSimulation
+
+PARAMS = dict(company_count=12, difficulty="Medium", player_name="P", player_company_name="PCo")
+
+
+def _play(sim, ticks=600):
+    companies = sim.companies
+    for t in range(ticks):
+        if t % 37 == 0:
+            sim.buy(companies[t % len(companies)], 50)
+        if t % 91 == 0:
+            sim.sell(companies[0], 20)
+        if t % 151 == 0:
+            sim.dump(companies[0], 10)
+        if t == 200:
+            sim.buy_bot()
+            sim.upgrade_bot("speed")
+        if t == 350:
+            sim.set_fast_mode(True)
+            sim.pr_campaign()
+            sim.sabotage(companies[3])
+            sim.fortify()
+        if t == 450:
+            sim.skip(100)
+        sim.step(1)
+
+
+@pytest.mark.parametrize("from_snapshot", [False, True])
+def test_replay_reaches_the_recorded_digests(tmp_path, from_snapshot):
+    sim = MarketSimulation.new_game(**PARAMS, seed=31)
+    if from_snapshot:
+        sim.step(150)
+    path = tmp_path / "run.smjournal"
+    journal = CommandJournal.start(sim, path, new_game=None if from_snapshot else PARAMS, check_every=60)
+    _play(sim)
+    journal.close(sim)
+
+    replayed, report = replay(path)  # raises ReplayMismatch on any checkpoint digest
+    assert state_digest(replayed) == state_digest(sim)
+    assert report["checks"] >= 5 and report["commands"] >= 20
+
+
+def test_replay_detects_a_diverging_state(tmp_path):
+    sim = MarketSimulation.new_game(**PARAMS, seed=31)
+    path = tmp_path / "run.smjournal"
+    journal = CommandJournal.start(sim, path, new_game=PARAMS, check_every=60)
+    _play(sim, ticks=200)
+    journal.close(sim)
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    for i, line in enumerate(lines):
+        record = json.loads(line)
+        if record.get("cmd") == "buy":
+            record["args"][1] += 1   # tamper with one recorded command
+            lines[i] = json.dumps(record)
+            break
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    with pytest.raises(ReplayMismatch):
+        replay(path)
@@ -0,0 +1,42 @@
+import numpy as np
+
+from core.company_generator import generate_companies
+from core.market_engine import MarketPriceEngine
+
+
+def _market(n=6, seed=0):
+    companies = generate_companies(n, "Medium", "PCo", with_logos=False)
+    return companies, MarketPriceEngine(companies, rng=np.random.default_rng(seed))
+
+
+def test_companies_read_and_write_their_slot():
+    companies, market = _market()
+    for i, c in enumerate(companies):
+        assert c.price == market.price[i]
+    companies[2].price = 12.5
+    assert market.price[2] == 12.5
+    market.tick()
+    assert [c.price for c in companies] == market.price.tolist()
+
+
+def test_one_tick_moves_every_price_within_the_floor():
+    companies, market = _market()
+    before = market.price.copy()
+    market.tick()
+    assert np.all(market.price != before)
+    assert np.all(market.price >= 0.01)
+    np.testing.assert_array_equal(market.close, market.price)
+    assert np.all(market.high >= market.price) and np.all(market.low <= market.price)
+
+
+def test_day_and_quarter_roll_over_once():
+    companies, market = _market()
+    for _ in range(market.ticks_per_day):
+        market.tick()
+    assert market.global_day == 2 and market.ticks_today == 0
+    # The day's close is the new anchor and the last daily candle
+    assert [c.daily_candles[-1].close for c in companies] == market.anchor.tolist()
+    for _ in range(market.ticks_per_day * (market.DAYS_PER_QUARTER - 1)):
+        market.tick()
+    assert market.global_day == 1 + market.DAYS_PER_QUARTER
+    assert market.global_quarter == 2
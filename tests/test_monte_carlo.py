@@ -0,0 +1,40 @@
+import numpy as np
+
+from core.monte_carlo import BatchReport, RunSummary, run_batch, run_scenario
+
+
+def _summary(seed, start, final, bankruptcies=0):
+    start, final = np.asarray(start, float), np.asarray(final, float)
+    return RunSummary(
+        seed=seed, ticks=0, days=0, companies=[], start_prices=start, final_prices=final,
+        price_paths=np.zeros((len(start), 0), np.float32), bankruptcies=bankruptcies, takeovers=0,
+        dividends_total=0.0, player_cash=0.0, ai_treasury=0.0, elapsed=0.5,
+    )
+
+
+def test_report_aggregates_runs():
+    report = BatchReport()
+    assert report.stats()["takeovers"]["mean"] == 0.0
+    report.add(_summary(0, [10, 10], [20, 10], bankruptcies=1))
+    report.add(_summary(1, [10, 10], [10, 10], bankruptcies=3))
+    stats = report.stats()
+    assert report.runs == 2 and report.elapsed == 1.0
+    assert stats["bankruptcies"]["mean"] == 2.0
+    assert stats["price_return"]["mean"] == 1.25
+    assert report.format().startswith("2 runs")
+
+
+def test_scenario_summary_shapes():
+    summary = run_scenario(seed=3, ticks=200, company_count=4)
+    assert summary.days == 200 // 64
+    assert summary.price_paths.shape == (len(summary.companies), summary.days)
+    assert summary.final_prices.shape == summary.start_prices.shape == (len(summary.companies),)
+    assert (summary.final_prices > 0).all()
+
+
+def test_inline_batch_reports_every_run():
+    seen = []
+    report = run_batch(3, 64, company_count=3, base_seed=5, workers=1,
+                       on_result=lambda s, r: seen.append(s.seed))
+    assert seen == [5, 6, 7]
+    assert report.runs == 3
@@ -0,0 +1,67 @@
+from core.order_book import BUY, SELL, MarketMaker, OrderBook
+
+
+def test_price_then_time_priority():
+    book = OrderBook()
+    first, _ = book.submit("a", SELL, 10, 10.00)
+    second, _ = book.submit("b", SELL, 10, 10.00)
+    book.submit("c", SELL, 10, 9.50)
+    _, fills = book.submit("taker", BUY, 25, 10.00)
+    assert [(f.seller, f.price, f.qty) for f in fills] == [("c", 9.5, 10), ("a", 10.0, 10), ("b", 10.0, 5)]
+    assert fills[1].sell_id == first.id
+    assert book.get(second.id).qty == 5
+    assert book.last_price == 10.0 and book.volume == 25
+
+
+def test_limit_rests_the_remainder_and_market_orders_never_rest():
+    book = OrderBook()
+    book.submit("mm", SELL, 5, 10.00)
+    order, fills = book.submit("p", BUY, 8, 10.00)
+    assert sum(f.qty for f in fills) == 5 and order.qty == 3 and order.limit == 10.0
+    assert book.best_bid() == 10.0 and book.best_ask() is None
+    order, fills = book.submit("p", BUY, 8)
+    assert order is None and fills == []
+    # A marketable sell fills against the resting bid at the bid's price
+    _, fills = book.submit("s", SELL, 2, 9.00)
+    assert [(f.buyer, f.price, f.qty) for f in fills] == [("p", 10.0, 2)]
+
+
+def test_cancel_is_lazy_and_skipped_at_the_top():
+    book = OrderBook()
+    best, _ = book.submit("a", SELL, 5, 9.00)
+    book.submit("b", SELL, 5, 9.50)
+    assert book.cancel(best.id).qty == 5
+    assert book.cancel(best.id) is None
+    assert len(book) == 1
+    assert book.best_ask() == 9.5
+    _, fills = book.submit("t", BUY, 5)
+    assert [f.seller for f in fills] == ["b"]
+
+
+def test_many_cancels_compact_the_heaps():
+    book = OrderBook()
+    ids = [book.submit("a", BUY, 1, 1 + i / 100)[0].id for i in range(200)]
+    for order_id in ids[:150]:
+        book.cancel(order_id)
+    assert len(book._bids) <= 2 * len(book) + 64
+    assert book.depth(BUY, levels=3) == [(2.99, 1), (2.98, 1), (2.97, 1)]
+
+
+def test_quote_cost_does_not_touch_the_book():
+    book = OrderBook()
+    book.submit("a", SELL, 4, 10.00)
+    book.submit("b", SELL, 4, 11.00)
+    assert book.quote_cost(BUY, 6) == (6, 4 * 10.0 + 2 * 11.0)
+    assert book.quote_cost(BUY, 20) == (8, 84.0)
+    assert len(book) == 2
+
+
+def test_market_maker_asks_never_exceed_the_float():
+    book, mm = OrderBook(), MarketMaker(levels=8)
+    mm.requote(book, price=50.0, total_shares=10_000, float_shares=300)
+    asks = book.depth(SELL, levels=20)
+    assert sum(q for _, q in asks) == 300
+    assert min(p for p, _ in asks) > 50.0 > book.best_bid()
+    # Requoting replaces the previous quotes instead of stacking them
+    mm.requote(book, price=50.0, total_shares=10_000, float_shares=300)
+    assert sum(q for _, q in book.depth(SELL, levels=20)) == 300
@@ -0,0 +1,74 @@
+import json
+import time
+
+import numpy as np
+
+from core.company_model import Company
+from core.persistence import BackgroundSaver, _split, load_game, read_state, save_game
+from core.rng import RngService
+from core.simulation import MarketSimulation
+
+
+def _played_game():
+    sim = MarketSimulation.new_game(15, "Medium", "P", "PCo", seed=17)
+    sim.step(200)
+    company = sim.companies[2]
+    sim.buy(company, 40)
+    sim.sell(company, 15)           # leaves a working sell order in the queues
+    sim.buy_bot()
+    sim.buy_asset("Mining Ship")
+    sim.step(40)
+    return sim
+
+
+def _assert_same_state(a, b):
+    arrays_a, arrays_b = {}, {}
+    meta_a, meta_b = _split(a.get_state(), arrays_a), _split(b.get_state(), arrays_b)
+    assert json.dumps(meta_a, sort_keys=True, default=str) == json.dumps(meta_b, sort_keys=True, default=str)
+    assert arrays_a.keys() == arrays_b.keys()
+    for path, array in arrays_a.items():
+        np.testing.assert_array_equal(array, arrays_b[path], err_msg=path)
+
+
+def test_load_restores_the_saved_state(tmp_path):
+    sim = _played_game()
+    loaded = load_game(save_game(sim, tmp_path / "game.smsave"))
+    _assert_same_state(loaded, sim)
+    assert loaded.autobot == sim.autobot
+    assert loaded.market.get_clock_display() == sim.market.get_clock_display()
+
+
+def test_loaded_game_plays_on_identically(tmp_path):
+    sim = _played_game()
+    loaded = load_game(save_game(sim, tmp_path / "game.smsave"))
+    sim.step(300)
+    loaded.step(300)
+    _assert_same_state(loaded, sim)
+
+
+def test_background_save_stores_the_state_at_submit(tmp_path):
+    sim = _played_game()
+    saver = BackgroundSaver()
+    saver.submit(sim, tmp_path / "bg.smsave")
+    expected = load_game(save_game(sim, tmp_path / "now.smsave"))
+    sim.step(50)  # ticks after submit() are not in the save
+    assert saver.wait(10.0) and saver.last_error is None
+    _assert_same_state(load_game(saver.last_path), expected)
+
+
+def test_large_world_loads_quickly(tmp_path):
+    rng = RngService(seed=11)
+    companies = [
+        Company(f"Co{i}", 20 + i % 90, 1.2, ("Mining", "Energy", "Biotech")[i % 3], rng=rng.company_stream(f"Co{i}"))
+        for i in range(2000)
+    ]
+    sim = MarketSimulation(companies, player_name="P", rng=rng)
+    sim.step(2)
+    state = read_state(save_game(sim, tmp_path / "big.smsave"))
+    start = time.perf_counter()
+    loaded = MarketSimulation.from_state(state)
+    elapsed = time.perf_counter() - start
+    # No holder reseeding, asset seeding or per-company streams on load
+    assert elapsed < 2.0, f"from_state took {elapsed:.2f}s"
+    assert loaded.ownership_engines == {}
+    _assert_same_state(loaded, sim)
@@ -0,0 +1,72 @@
+import json
+import threading
+
+import numpy as np
+
+from core.profiler import BUCKET_UPPER_NS, BUCKETS, RollingHistogram, TickProfiler, bucket_of
+
+
+def test_buckets_are_ordered_and_bound_their_durations():
+    durations = [0, 500, 1024, 1500, 4096, 10**6, 3 * 10**9]
+    buckets = [bucket_of(ns) for ns in durations]
+    assert buckets == sorted(buckets) and buckets[0] == buckets[1] == 0
+    for ns, b in zip(durations, buckets):
+        assert ns <= BUCKET_UPPER_NS[b]
+        assert b == 0 or BUCKET_UPPER_NS[b - 1] <= ns * (1 + 1 / 16)  # ~6% resolution
+    assert bucket_of(1 << 62) == BUCKETS - 1
+
+
+def test_histogram_percentiles_and_window_expiry():
+    now = [0.0]
+    hist = RollingHistogram(window=30.0, slots=6, clock=lambda: now[0])
+    for ms in range(1, 101):
+        hist.record(ms * 10**6, now[0])
+    summary = hist.summary()
+    assert summary["count"] == 100 and summary["max_ms"] == 100.0
+    assert 50 <= summary["p50_ms"] <= 54 and 99 <= summary["p99_ms"] <= 100
+    assert np.isclose(summary["mean_ms"], 50.5)
+
+    now[0] = 12.0                   # two slots later: still inside the window
+    hist.record(2 * 10**6, now[0])
+    assert hist.summary()["count"] == 101
+    now[0] = 31.0                   # the first slot has rotated out
+    assert hist.summary()["count"] == 1
+    now[0] = 500.0                  # idle past the whole window
+    assert hist.summary() == {"count": 0}
+
+
+def test_profiler_laps_only_when_enabled(tmp_path):
+    prof = TickProfiler()
+    prof.begin()
+    prof.lap("idle")
+    assert prof.report() == {}
+    prof.set_enabled(True)
+    for _ in range(3):
+        prof.begin()
+        prof.lap("a")
+        prof.lap("b")
+    assert prof.timed("c", sum, [1, 2]) == 3
+    report = prof.report()
+    assert list(report) == ["a", "b", "c"] and report["a"]["count"] == 3
+    assert "phase" in prof.format()
+    data = json.loads(open(prof.dump(tmp_path / "prof.json"), encoding="utf-8").read())
+    assert data["phases"]["c"]["count"] == 1
+    prof.reset()
+    assert prof.report() == {}
+
+
+def test_reports_while_another_thread_records():
+    prof = TickProfiler(window=3600.0)
+    prof.set_enabled(True)
+    calls = 20000
+
+    def work():
+        for i in range(calls):
+            prof.record(f"p{i % 4}", 1000 + i)
+
+    worker = threading.Thread(target=work)
+    worker.start()
+    while worker.is_alive():
+        prof.report()
+    worker.join()
+    assert sum(s["count"] for s in prof.report().values()) == calls
@@ -0,0 +1,50 @@
+import numpy as np
+
+from core.simulation import MarketSimulation
+
+
+def _decided_batch(sim):
+    """Move prices and decide AI orders until some holders trade."""
+    while True:
+        sim.market.tick()
+        batch = sim.ai_logic.decide_batch(sim.market, sim.disruption_engine, {}, holdings=sim.holdings)
+        if batch is not None and batch.orders().size:
+            return batch
+
+
+def _positions(sim, batch, k):
+    names = [batch.names[j] for j in k.tolist()]
+    return np.array([sim.companies[i].ai_owners.get(name, 0) for i, name in zip(batch.cidx[k].tolist(), names)])
+
+
+def _outside(sim):
+    return np.array([c.public_float + c.player_shares for c in sim.companies])
+
+
+def test_bulk_routing_conserves_shares_and_fills_in_holder_order():
+    sim = MarketSimulation.new_game(40, "Medium", "P", "PCo", seed=11)
+    sim.step(50)
+    for _ in range(20):
+        batch = _decided_batch(sim)
+        k = batch.orders()
+        before = _positions(sim, batch, k)
+        outside = _outside(sim)
+        sim._route_ai_orders(batch)
+        delta = _positions(sim, batch, k) - before
+
+        # Every share an AI gained or gave up came from / went to the float or the player
+        ai_change = np.bincount(batch.cidx[k], weights=delta, minlength=len(sim.companies))
+        np.testing.assert_array_equal(ai_change, outside - _outside(sim))
+        assert all(v > 0 for c in sim.companies for v in c.ai_owners.values())
+        np.testing.assert_array_equal(sim.holdings.ai_total, (sim.holdings.shares * sim.holdings.holders_mask()).sum(axis=1))
+
+        want = np.where(batch.qty[k] > 0, batch.qty[k], -np.minimum(-batch.qty[k], before))
+        assert np.all(np.abs(delta) <= np.abs(want))
+        assert np.all(delta * want >= 0)
+        # Within a company and side, a short fill leaves nothing for later orders
+        for i in np.unique(batch.cidx[k]).tolist():
+            for side in (want > 0, want < 0):
+                mask = side & (batch.cidx[k] == i)
+                short = np.flatnonzero(np.abs(delta[mask]) < np.abs(want[mask]))
+                if short.size:
+                    assert not np.any(delta[mask][short[0] + 1:])
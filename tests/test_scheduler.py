@@ -0,0 +1,70 @@
+from core.scheduler import TimingWheel
+
+
+def test_entries_come_due_in_order():
+    wheel = TimingWheel(size=8)
+    wheel.schedule(3, "b", 2)
+    wheel.schedule(1, "a", 1)
+    wheel.schedule(3, "c", 3)
+    assert wheel.advance(2) == [("a", (1,))]
+    assert wheel.advance(5) == [("b", (2,)), ("c", (3,))]
+    assert len(wheel) == 0
+
+
+def test_far_entries_wait_in_the_overflow_heap():
+    wheel = TimingWheel(size=4)
+    far = [wheel.schedule_at(t, "far", t) for t in (50, 9, 30)]
+    near = wheel.schedule(2, "near")
+    assert len(wheel._overflow) == 3 and len(wheel) == 4
+    assert wheel.advance(8) == [("near", ())]
+    assert wheel.advance(40) == [("far", (9,)), ("far", (30,))]
+    # A slot shared modulo size only yields the entry actually due
+    wheel.schedule_at(42, "same slot")
+    assert wheel.advance(46) == [("same slot", ())]
+    assert wheel.advance(50) == [("far", (50,))]
+    assert not wheel._overflow and len(wheel) == 0
+    assert far[0].cancelled and near.cancelled  # spent
+
+
+def test_cancel_is_lazy_and_late_cancels_are_ignored():
+    wheel = TimingWheel(size=4)
+    keep = wheel.schedule(2, "keep")
+    drop = wheel.schedule(2, "drop")
+    far = wheel.schedule(100, "far")
+    wheel.cancel(drop)
+    wheel.cancel(far)
+    wheel.cancel(far)
+    assert len(wheel) == 1
+    assert wheel.advance(200) == [("keep", ())]
+    wheel.cancel(keep)
+    assert len(wheel) == 0
+
+
+def test_past_ticks_run_at_the_next_advance_and_pending_lists_live_entries():
+    wheel = TimingWheel(size=4, now=10)
+    wheel.schedule_at(3, "late")
+    wheel.schedule_at(20, "later", "x")
+    assert wheel.pending() == [(11, "late", ()), (20, "later", ("x",))]
+    assert wheel.advance(11) == [("late", ())]
+
+
+def test_idle_wheel_jumps_straight_to_the_tick():
+    wheel = TimingWheel(size=4)
+    assert wheel.advance(1_000_000) == []
+    assert wheel.now == 1_000_000
+    wheel.schedule(1, "next")
+    assert wheel.advance(1_000_001) == [("next", ())]
+
+
+def test_simulation_works_a_sell_through_scheduled_lots():
+    from core.simulation import MarketSimulation
+
+    sim = MarketSimulation.new_game(6, "Medium", "P", "PCo", seed=2)
+    company = next(c for c in sim.companies if not c.is_player)
+    sim.player.earn(1_000_000)
+    bought = sim.buy(company, 400)
+    assert bought and sim.sell(company, bought)
+    assert sim.working_orders[company]
+    sim.step(40)
+    assert not sim.working_orders[company]
+    assert company.player_shares == 0
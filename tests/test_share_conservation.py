@@ -0,0 +1,57 @@
+from core.order_book import SELL
+from core.simulation import MarketSimulation
+
+
+def _escrowed(sim, company):
+    """Shares taken out of circulation by working sells and autobot exit asks."""
+    working = sum(o["remaining"] for o in sim.working_orders[company])
+    book = sim.order_books[company]
+    exits = sum(o.qty for o in book._side_orders(SELL) if o.owner == "autobot")
+    return working + exits
+
+
+def _assert_conserved(sim):
+    for c in sim.companies:
+        held = c.public_float + c.player_shares + sum(c.ai_owners.values())
+        assert held + _escrowed(sim, c) == c.total_shares, c.name
+
+
+def _target(sim):
+    return max((c for c in sim.companies if not c.is_player), key=lambda c: sum(c.ai_owners.values()))
+
+
+def test_trading_offers_and_takeovers_conserve_shares():
+    sim = MarketSimulation.new_game(8, "Medium", "P", "PCo", seed=5)
+    sim.player.earn(10_000_000)
+    sim.buy_bot()
+    company = _target(sim)
+    assert sim.buy(company, 200) > 0
+    assert sim.sell(company, company.player_shares // 2)
+    sim.step(3)
+    assert sim.working_orders[company], "sell should still be working"
+    _assert_conserved(sim)
+
+    # Private deal: AI -> player, the float does not move
+    engine = sim._ownership_engine(company)
+    ai_name = max(company.ai_owners, key=company.ai_owners.get)
+    float_before = company.public_float
+    for _ in range(200):
+        accepted, moved = engine.offer_purchase_from_ai(ai_name, 10, sim.disruption_engine, accept_bias=1.0)
+        if accepted:
+            break
+    assert accepted and moved == 10
+    assert company.public_float == float_before
+    _assert_conserved(sim)
+
+    # Takeover while the sell is still working: the remaining AI stake
+    # returns to the float (player control is handed over directly here)
+    company.player_shares += company.public_float
+    company.public_float = 0
+    stake = sum(company.ai_owners.values())
+    sim._check_takeovers()
+    assert company.public_float == stake
+    assert company.taken_over and not company.ai_owners
+    _assert_conserved(sim)
+
+    sim.step(300)
+    _assert_conserved(sim)
@@ -0,0 +1,87 @@
+import time
+
+import numpy as np
+import pytest
+
+from core.candle_store import CLOSE
+from core.history_archive import HistoryArchive
+from core.profiler import format_report
+from core.sim_worker import SimulationWorker
+from core.simulation import MarketSimulation
+
+
+def _worker(**kwargs):
+    return SimulationWorker(MarketSimulation.new_game(8, "Medium", "P", "PCo", seed=12), **kwargs)
+
+
+def test_commands_apply_at_the_tick_boundary():
+    worker = _worker()
+    sim = worker.sim
+    company = sim.companies[3]
+    future = worker.submit("buy", company, 25)
+    assert not future.done() and company.player_shares == 0
+    worker.run_once()
+    assert future.result() > 0 and company.player_shares == future.result()
+    failing = worker.call(lambda s: 1 / 0)
+    worker.run_once()
+    with pytest.raises(ZeroDivisionError):
+        failing.result()
+
+
+def test_take_coalesces_ticks_and_feed():
+    worker = _worker()
+    worker.take()
+    assert worker.take() is None
+    worker.watch(worker.sim.companies[2])
+    worker.sim.event_bus.emit("hello", "#ffffff")
+    for _ in range(3):
+        worker.run_once()
+    snapshot, results, feed = worker.take()
+    assert len(results) == 3 and ("hello", "#ffffff") in feed
+    assert snapshot.tick == worker.sim.market.global_tick and snapshot.selected_index == 2
+    assert snapshot.quote(2) is snapshot.selected and snapshot.quote(1).name == worker.sim.companies[1].name
+    with pytest.raises(ValueError):
+        snapshot.prices[0] = 1.0     # snapshots are read-only copies
+    worker.run_once()
+    assert worker.take()[0].seq > snapshot.seq
+    assert snapshot.tick < worker.sim.market.global_tick
+
+
+def test_thread_ticks_and_stops():
+    worker = _worker(interval=0.001)
+    sim = worker.sim
+    worker.start()
+    deadline = time.monotonic() + 5.0
+    while sim.market.global_tick < 3 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    tick = worker.call(lambda s: s.market.global_tick).result(timeout=5)
+    worker.stop(timeout=5)
+    assert worker.error is None and tick >= 3
+    assert worker.latest().tick == sim.market.global_tick
+
+
+def test_history_reader_stays_within_the_published_days(tmp_path):
+    worker = _worker()
+    sim = worker.sim
+    sim.history = HistoryArchive.attach(sim.market, tmp_path / "hist")
+    reader = sim.history.reader()
+    for _ in range(2 * sim.ticks_per_day + 1):
+        worker.run_once()
+    days = worker.latest().history_days
+    assert days == 2
+    bars = reader.daily(1, days)
+    assert bars.shape == (2, 4)
+    np.testing.assert_allclose(bars[:, CLOSE], sim.history.daily(row=1)[:, CLOSE])
+    assert not bars.flags.writeable
+
+
+def test_format_report_merges_profilers():
+    report = {
+        "sim.tick": {"count": 2, "mean_ms": 1.0, "p50_ms": 1.0, "p90_ms": 1.0, "p99_ms": 1.0,
+                     "max_ms": 1.0, "total_ms": 2.0},
+        "ui.frame": {"count": 1, "mean_ms": 5.0, "p50_ms": 5.0, "p90_ms": 5.0, "p99_ms": 5.0,
+                     "max_ms": 5.0, "total_ms": 5.0},
+        "idle": {"count": 0},
+    }
+    lines = format_report(report, 30.0).splitlines()
+    assert [line.split()[0] for line in lines[1:]] == ["ui.frame", "sim.tick"]
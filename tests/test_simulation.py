@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+
+from core.simulation import MarketSimulation, TickResult
+
+
+def _sim():
+    return MarketSimulation.new_game(8, "Medium", "P", "PCo")
+
+
+def test_kernel_imports_without_qt():
+    code = "import sys, core.simulation; sys.exit(any(m.startswith('PyQt6') for m in sys.modules))"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    assert subprocess.run([sys.executable, "-c", code], cwd=root).returncode == 0
+
+
+def test_step_advances_the_clock_and_reports_every_tick():
+    sim = _sim()
+    seen = []
+    first = sim.step(1)
+    last = sim.step(25, listener=seen.append)
+    assert isinstance(last, TickResult)
+    assert len(seen) == 25 and seen[-1] is last
+    assert last.tick == first.tick + 25
+    assert [r.tick for r in seen] == list(range(first.tick + 1, last.tick + 1))
+
+
+def test_player_buy_and_sell():
+    sim = _sim()
+    company = next(c for c in sim.companies if not c.is_player and c.public_float >= 50)
+    cash = sim.player.cash
+    assert sim.buy(company, 50)
+    assert company.player_shares == 50
+    assert sim.player.cash < cash
+
+    cash = sim.player.cash
+    assert sim.sell(company, 30)
+    assert company.player_shares == 20    # the 30 sold are held until they go out
+    sim.step(40)
+    assert sim.player.cash > cash
+    assert not sim.sell(company, 21)      # more than is left
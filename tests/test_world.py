@@ -0,0 +1,52 @@
+import numpy as np
+
+from core.candle_store import CandleStore, CLOSE, HIGH, LOW, OPEN
+from core.company_generator import COMPANY_NAME_PARTS, generate_world, procedural_names
+from core.company_model import Company
+from core.rng import RngService
+from core.simulation import MarketSimulation
+
+
+def test_procedural_names_are_distinct_and_skip_reserved():
+    gen = np.random.default_rng(0)
+    combos = int(np.prod([len(bank) for bank in COMPANY_NAME_PARTS]))
+    reserved = procedural_names(3, COMPANY_NAME_PARTS, np.random.default_rng(1))
+    names = procedural_names(combos + 50, COMPANY_NAME_PARTS, gen, reserved=reserved)
+    assert len(names) == combos + 50 == len(set(names))
+    assert not set(names) & set(reserved)
+    assert any(name[-1].isdigit() for name in names)  # past the word banks: numbered series
+
+
+def test_world_companies_hold_every_share():
+    companies = generate_world(300, "Hard", player_company_name="PCo", owners=40, holders=6, rng=RngService(3))
+    assert len(companies) == 301 and companies[0].name == "PCo" and companies[0].is_player
+    assert len({c.name for c in companies}) == 301
+    for c in companies:
+        assert c.public_float >= 0
+        assert c.public_float + c.player_shares + sum(c.ai_owners.values()) == c.total_shares
+        assert c.name not in c.ai_owners
+        assert ("CEO" in c.ai_owners) != c.is_player
+    again = generate_world(300, "Hard", player_company_name="PCo", owners=40, holders=6, rng=RngService(3))
+    assert [dict(c.ai_owners) for c in again] == [dict(c.ai_owners) for c in companies]
+
+
+def test_batched_histories_follow_the_candle_rules():
+    companies = [Company(f"C{i}", 50.0 + i, 1.5, "Mining", warm_up=False) for i in range(40)]
+    daily, quarterly = Company.generate_initial_histories(companies, np.random.default_rng(5), days=30)
+    assert isinstance(daily, CandleStore) and daily.count.tolist() == [30] * 40
+    for c in companies:
+        assert len(c.daily_candles) == 30 and len(c.quarterly_candles) == 30
+    bars = daily.window_all(30)
+    price = np.array([c.price for c in companies])[:, None]
+    np.testing.assert_allclose(bars[:, :, OPEN], np.broadcast_to(price, (40, 30)))
+    assert np.all(np.abs(bars[:, :, CLOSE] - bars[:, :, OPEN]) <= 1.5 + 1e-9)
+    assert np.all(bars[:, :, HIGH] >= np.maximum(bars[:, :, OPEN], bars[:, :, CLOSE]) - 1e-9)
+    assert np.all(bars[:, :, LOW] <= np.minimum(bars[:, :, OPEN], bars[:, :, CLOSE]) + 1e-9)
+
+
+def test_new_world_plays():
+    sim = MarketSimulation.new_world(150, "Medium", "P", "PCo", seed=8)
+    before = {c.name: dict(c.ai_owners) for c in sim.companies}
+    sim.step(sim.ticks_per_day + 1)
+    assert sim.market.global_day >= 1
+    assert sum(1 for c in sim.companies if dict(c.ai_owners) != before[c.name]) > 0
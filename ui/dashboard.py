@@ -10,8 +10,10 @@ from PyQt6.QtGui import QPixmap, QColor
 import pyqtgraph as pg
 from PyQt6.QtCore import QTimer
 from core.assets_engine import AssetManager
+from core.profiler import TickProfiler
 
 from charts.candle_plot import CandlestickItem
+from ui.feed_view import FeedView
 
 
 # --------------------------------------------------------------
@@ -80,11 +82,13 @@ class CompanyListItem(QWidget):
 # --------------------------------------------------------------
 
 class CompetitionDashboard(QWidget):
+    CHART_WINDOW = 30  # candles shown per chart mode ("Last 30 Days/Quarters")
+
     def __init__(self, companies,
                  buy_callback=None, sell_callback=None, dump_callback=None, offer_callback=None,
                  set_speed_callback=None, asset_purchase_callback=None,
                  pr_callback=None, rd_callback=None, sabotage_callback=None, fortify_callback=None,
-                 buy_bot_callback=None, upgrade_bot_callback=None):
+                 buy_bot_callback=None, upgrade_bot_callback=None, select_callback=None):
         super().__init__()
 
         self.setWindowTitle("Space Miner Guild — Market Dominion Dashboard")
@@ -115,8 +119,15 @@ class CompetitionDashboard(QWidget):
         """)
 
         self.companies = companies
+        self._index = {c: i for i, c in enumerate(companies)}
         self.selected_company = companies[0]
+        # Latest SimSnapshot when a SimulationWorker drives the dashboard;
+        # until then (or without a worker) the live companies are read
+        self.snapshot = None
         self.current_chart_mode = "daily"
+        self._bot_state = None  # autobot state the panel shows
+        self.history = None  # ArchiveReader (full daily history on disk), if any
+        self.profiler = TickProfiler()  # UI phases; the simulation keeps its own
         self.cash = 0.0
         self.company_trades = {}
         self.selected_owner_name = None
@@ -136,6 +147,7 @@ class CompetitionDashboard(QWidget):
         self.asset_purchase_callback = asset_purchase_callback
         self.buy_bot_callback = buy_bot_callback
         self.upgrade_bot_callback = upgrade_bot_callback
+        self.select_callback = select_callback
 
         self._build_ui()
         self.refresh_selected_company()
@@ -238,8 +250,7 @@ class CompetitionDashboard(QWidget):
 
         feed_row = QHBoxLayout()
 
-        self.feed_box = QTextEdit()
-        self.feed_box.setReadOnly(True)
+        self.feed_box = FeedView()
         self.feed_box.setStyleSheet("""
             background-color: rgba(11,17,30,0.92);
             color: #e5f1ff;
@@ -268,10 +279,12 @@ class CompetitionDashboard(QWidget):
 
         # ---------- Chart Buttons ----------
         time_row = QHBoxLayout()
+        self.btn_hourly = QPushButton("Last 30 Hours")
         self.btn_daily = QPushButton("Last 30 Days")
         self.btn_quarterly = QPushButton("Last 30 Quarters")
+        self.btn_history = QPushButton("All Days")
 
-        for b in (self.btn_daily, self.btn_quarterly):
+        for b in (self.btn_hourly, self.btn_daily, self.btn_quarterly, self.btn_history):
             b.setStyleSheet("""
                 padding: 9px 18px;
                 font-size: 15px;
@@ -282,11 +295,15 @@ class CompetitionDashboard(QWidget):
                 letter-spacing: 0.3px;
             """)
 
+        self.btn_hourly.clicked.connect(lambda: self._switch_chart("hourly"))
         self.btn_daily.clicked.connect(lambda: self._switch_chart("daily"))
         self.btn_quarterly.clicked.connect(lambda: self._switch_chart("quarterly"))
+        self.btn_history.clicked.connect(lambda: self._switch_chart("history"))
 
+        time_row.addWidget(self.btn_hourly)
         time_row.addWidget(self.btn_daily)
         time_row.addWidget(self.btn_quarterly)
+        time_row.addWidget(self.btn_history)
         center.addLayout(time_row)
 
         # ---------- Chart ----------
@@ -295,8 +312,12 @@ class CompetitionDashboard(QWidget):
         vb = self.chart.getViewBox()
         vb.setMouseEnabled(False, False)
         vb.setMenuEnabled(False)
+        vb.sigXRangeChanged.connect(self._fit_visible_prices)
         self.chart.hideButtons()
-        self.candle_item = None
+        # One persistent item, fed new candles on every refresh
+        self.candle_item = CandlestickItem()
+        self.chart.addItem(self.candle_item)
+        self._chart_view = None  # what the view range was last fitted to
         center.addWidget(self.chart, stretch=1)
 
         # ---------- Modifiers Panel ----------
@@ -774,10 +795,7 @@ class CompetitionDashboard(QWidget):
 
     def push_feed(self, text, color="#cccccc"):
         """Adds an entry to the activity feed."""
-        self.feed_box.append(f"<span style='color:{color};'>{text}</span>")
-        self.feed_box.verticalScrollBar().setValue(
-            self.feed_box.verticalScrollBar().maximum()
-        )
+        self.feed_box.append_lines([(text, color)])
 
     def log_trade(self, company_name, text, color="#cccccc"):
         """Store a per-company trade entry."""
@@ -864,10 +882,14 @@ class CompetitionDashboard(QWidget):
         if index == -1:
             return
         self.selected_company = self.companies[index]
+        if self.select_callback:
+            self.select_callback(self.selected_company)
         self.refresh_selected_company()
 
     def _select_owner(self):
-        c = self.selected_company
+        c = self._selected_state()
+        if c is None:
+            return
         items = self.owner_list.selectedItems()
         if not items:
             if self.selected_owner_name:
@@ -900,9 +922,10 @@ class CompetitionDashboard(QWidget):
 
     def refresh_selected_company(self):
         c = self.selected_company
+        s = self._state(c)
         self.header.setText(c.name)
-        self.subheader.setText(f"{c.sector} — ${c.price:.2f}")
-        self.owned_info.setText(f"You own {c.player_shares} • Float {c.public_float}")
+        self.subheader.setText(f"{c.sector} — ${s.price:.2f}")
+        self.owned_info.setText(f"You own {s.player_shares} • Float {s.public_float}")
 
         self._rebuild_ownership()
         self.update_disruption_ui()
@@ -914,6 +937,8 @@ class CompetitionDashboard(QWidget):
 
     def _switch_chart(self, mode):
         self.current_chart_mode = mode
+        # The full history can be zoomed / panned along x (mouse wheel, drag)
+        self.chart.getViewBox().setMouseEnabled(x=(mode == "history"), y=False)
         self._update_chart(mode)
 
     def _update_chart(self, mode):
@@ -922,44 +947,61 @@ class CompetitionDashboard(QWidget):
         if not self.isVisible():
             return
 
-        c = self.selected_company
-        base = c.daily_candles if mode == "daily" else c.quarterly_candles
+        c = self._selected_state()
+        if c is None:
+            return
+        row = self.history.rows.get(c.name) if self.history is not None else None
+        days = self.snapshot.history_days if self.snapshot is not None else 0
+        if mode == "history" and row is not None and days:
+            # Every archived day up to the snapshot (zero-copy view of the on-disk archive)
+            base = self.history.daily(row, days)
+        else:
+            if mode == "hourly" and c.hourly_candles is not None:
+                series = c.hourly_candles
+            elif mode == "quarterly":
+                series = c.quarterly_candles
+            else:
+                series = c.daily_candles
+            base = series.window(self.CHART_WINDOW)
 
-        if not base:
+        if not len(base):
             return
 
-        # Append forming candle for intraday view (daily only)
-        if mode == "daily":
-            forming = type(base[0])(
-                round(c.current_open, 2),
-                round(c.current_high, 2),
-                round(c.current_low, 2),
-                round(c.current_close, 2),
-            )
-            data = base + [forming]
-        else:
-            data = base
+        # Append forming candle for intraday views (hourly/daily)
+        forming = None
+        if mode in ("hourly", "daily", "history"):
+            forming = tuple(round(v, 2) for v in c.forming_candle("hour" if mode == "hourly" else "day"))
 
         try:
-            # Remove previous candle item without clearing axes to avoid pyqtgraph axis deletion
-            if getattr(self, "candle_item", None):
-                try:
-                    self.chart.removeItem(self.candle_item)
-                except RuntimeError:
-                    pass
-            item = CandlestickItem(data)
-            self.chart.addItem(item)
-            self.candle_item = item
-
-            highs = [x.high for x in data]
-            lows = [x.low for x in data]
-
-            self.chart.setYRange(min(lows) - 1, max(highs) + 1)
-            self.chart.setXRange(0, len(data))
+            self.candle_item.set_candles(base, forming)
+            if mode == "history":
+                # Fit once per company, then leave x to the user; y follows the visible days
+                view = (mode, c.name)
+                if view != self._chart_view:
+                    self._chart_view = view
+                    self.chart.setXRange(0, self.candle_item.count)
+                    self._fit_visible_prices()
+            else:
+                # Refit the view only when the candles outgrow it
+                view = (self.candle_item.count,) + self.candle_item.price_range()
+                if view != self._chart_view:
+                    self._chart_view = view
+                    count, lows, highs = view
+                    self.chart.setYRange(lows - 1, highs + 1)
+                    self.chart.setXRange(0, count)
         except RuntimeError:
             # Widget might be gone during shutdown; ignore
             return
 
+    def _fit_visible_prices(self, *_):
+        """History view: scale y to the candles currently in view."""
+        if self.current_chart_mode != "history":
+            return
+        x0, x1 = self.chart.getViewBox().viewRange()[0]
+        span = self.candle_item.price_range(x0, x1)
+        if span is not None:
+            self.chart.setYRange(span[0] - 1, span[1] + 1)
+
     def update_chart_only(self):
         """Refreshes candles every tick without changing mode."""
         if not self.isVisible():
@@ -970,9 +1012,11 @@ class CompetitionDashboard(QWidget):
             return
 
     def _rebuild_ownership(self):
+        c = self._selected_state()
+        if c is None:
+            return
         # Populate ownership list
         self.owner_list.clear()
-        c = self.selected_company
         parts = [("You", c.player_shares)]
 
         for name, amt in sorted(c.ai_owners.items(), key=lambda x: x[1], reverse=True):
@@ -999,7 +1043,7 @@ class CompetitionDashboard(QWidget):
             self.btn_offer.setEnabled(False)
 
     def _update_slider_limits(self):
-        c = self.selected_company
+        c = self._state(self.selected_company)
         affordable = int(self.cash / c.price) if c.price > 0 else 0
         max_buyable = max(1, min(int(c.public_float), affordable))
         max_sellable = max(1, int(c.player_shares))
@@ -1016,20 +1060,19 @@ class CompetitionDashboard(QWidget):
         self._update_trade_costs()
 
     def update_disruption_ui(self):
-        if not hasattr(self, "disruption_engine"):
+        if self.snapshot is None:
             return
-
-        txt = self.disruption_engine.get_display_text()
-        col = self.disruption_engine.get_color_for_disruption()
+        _, txt, col = self.snapshot.disruption
         self.disruption_label.setText(txt)
         self.disruption_label.setStyleSheet(f"font-size: 20px; color: {col};")
 
     def update_price_display(self):
         for w in self._sidebar_items:
             c = w.company
-            w.price_label.setText(f"${c.price:.2f}")
-            w.float_label.setText(f"Float: {c.public_float}")
-            w.owned_label.setText(f"Owned: {c.player_shares}")
+            s = self._state(c)
+            w.price_label.setText(f"${s.price:.2f}")
+            w.float_label.setText(f"Float: {s.public_float}")
+            w.owned_label.setText(f"Owned: {s.player_shares}")
             if hasattr(self, "ai_ratings"):
                 rating = self.ai_ratings.get(c.name, "--")
                 if getattr(c, "is_player", False):
@@ -1041,16 +1084,27 @@ class CompetitionDashboard(QWidget):
         self.clock_label.setText(t)
         self.quarter_label.setText(q)
 
-    def set_disruption_engine(self, engine):
-        self.disruption_engine = engine
+    def _state(self, company):
+        """What to draw for `company`: its copy in the current snapshot, or the live object."""
+        if self.snapshot is None:
+            return company
+        return self.snapshot.quote(self._index[company])
+
+    def _selected_state(self):
+        """Full state of the selected company (None until a snapshot watching it arrives)."""
+        if self.snapshot is None:
+            return self.selected_company
+        if self.snapshot.selected_index != self._index[self.selected_company]:
+            return None
+        return self.snapshot.selected
 
     def set_cash(self, cash):
         self.cash = cash
         self.cash_label.setText(f"${cash:,.2f}")
         self._update_slider_limits()
 
-    def set_asset_manager(self, asset_manager):
-        self.asset_manager = asset_manager
+    def set_history_archive(self, reader):
+        self.history = reader
 
     def set_company_ratings(self, player_rating, ai_ratings):
         self.player_rating = player_rating
@@ -1197,7 +1251,8 @@ class CompetitionDashboard(QWidget):
             self.btn_upg_size.setText("Upgrade Size")
 
     def update_assets_panel(self, cash, portfolio_value, ai_cash=0.0, active_events=None, external_income=0.0, dividends=None):
-        if not hasattr(self, "asset_manager"):
+        snapshot = self.snapshot
+        if snapshot is None:
             return
         # Clear grids/lists
         while self.asset_grid.count():
@@ -1212,29 +1267,8 @@ class CompetitionDashboard(QWidget):
             "Epic": "#f5d76b",
         }
 
-        def summarize(owner):
-            items = self.asset_manager.snapshot(owner)
-            if not items:
-                return {}, 0, 0
-            buckets = {}
-            total_income = 0.0
-            for a in items:
-                bucket = buckets.setdefault(a["type"], {"count": 0, "avg_cond": 0.0, "tiers": {}})
-                bucket["count"] += 1
-                bucket["avg_cond"] += a["condition"]
-                tier = a.get("tier", "Common")
-                bucket["tiers"][tier] = bucket["tiers"].get(tier, 0) + 1
-                cfg = self.asset_manager.ASSET_TYPES[a["type"]]
-                income_this = cfg["income_per_day"] * a["condition"]
-                bucket["income"] = bucket.get("income", 0.0) + income_this
-                total_income += income_this
-            for t, data in buckets.items():
-                data["avg_cond"] = (data["avg_cond"] / data["count"]) * 100
-            total_val = self.asset_manager.total_value(owner)
-            return buckets, total_val, total_income
-
         # Player cards
-        buckets, total_value, daily_income = summarize("player")
+        buckets, total_value, daily_income = snapshot.assets["player"]
         row = col = 0
         for name, data in buckets.items():
             tiers = " ".join([
@@ -1266,10 +1300,9 @@ class CompetitionDashboard(QWidget):
                 row += 1
 
         # Rivals summary
-        for owner in self.asset_manager.assets.keys():
+        for owner, (obuckets, ovalue, oincome) in snapshot.assets.items():
             if owner == "player":
                 continue
-            obuckets, ovalue, oincome = summarize(owner)
             item = QListWidgetItem()
             widget = QFrame()
             widget.setStyleSheet("""
@@ -1298,16 +1331,91 @@ class CompetitionDashboard(QWidget):
                 tone = "#9fe6ff" if ev.get("drift", 0) > 0 else "#ffcc88"
                 self.events_list.addItem(f"{ev['name']} ({ev['sector']}): drift {ev['drift']:+.2f}, vol {ev['vol']:+.2f} ({ev['days_left']}d)")
 
-        rating = self.asset_manager.ceo_rating(cash, portfolio_value)
-        self.ceo_rating_label.setText(f"CEO Rating: {rating} | Your Cash: ${cash:,.0f} | AI Treasury: ${ai_cash:,.0f}")
+        self.ceo_rating_label.setText(f"CEO Rating: {snapshot.ceo_rating} | Your Cash: ${cash:,.0f} | AI Treasury: ${ai_cash:,.0f}")
         self.asset_value_label.setText(
             f"Asset Value: ${total_value:,.0f} | Daily Income: ${daily_income:,.0f}"
         )
         self.asset_cash_label.setText(f"Liquidity: ${cash:,.0f}")
         self.external_income_label.setText(f"External Income (last tick): ${external_income:,.0f}")
 
+    def apply_snapshot(self, snapshot, results=(), feed=()):
+        """
+        Render one frame from a SimulationWorker: feed lines and the
+        TickResults queued since the last frame, read against `snapshot`.
+        Only the newest result is rendered in full; the autobot panel
+        follows the snapshot, so trades of coalesced ticks still show.
+        """
+        self.snapshot = snapshot
+        if feed:
+            self.feed_box.append_lines(feed)
+        if snapshot.autobot != self._bot_state:
+            self._bot_state = snapshot.autobot
+            self.update_automation(snapshot.autobot)
+        for result in results[:-1]:
+            self._log_trades(result)
+        if results:
+            self.apply_tick(results[-1])
+        else:
+            # Commands applied between ticks (player actions, a new selection)
+            self.set_cash(snapshot.cash)
+            self.update_assets_panel(snapshot.cash, snapshot.portfolio_value)
+            self.update_price_display()
+            self.refresh_selected_company()
+        self.set_modifiers_display(*snapshot.modifiers)
+
+    def _log_trades(self, result):
+        for company_name, delta_shares, actor in result.trades:
+            if delta_shares > 0:
+                self.log_trade(company_name, f"{actor} bought {delta_shares} {company_name}", "#7fd8ff")
+            else:
+                self.log_trade(company_name, f"{actor} sold {abs(delta_shares)} {company_name}", "#ff9b8f")
+
+    def apply_tick(self, result):
+        """Render one TickResult from the simulation kernel."""
+        prof = self.profiler
+        prof.begin()
+        self._log_trades(result)
+        prof.lap("ui.trade_log")
+
+        self.update_disruption_ui()
+        self.set_cash(result.cash)
+        prof.lap("ui.cash")
+        self.update_assets_panel(
+            result.cash,
+            result.portfolio_value,
+            result.ai_treasury,
+            active_events=result.active_events,
+            external_income=result.external_income,
+            dividends=result.dividends,
+        )
+        prof.lap("ui.assets_panel")
+        # Also refreshes sidebar prices
+        self.set_company_ratings(result.player_rating, result.ai_ratings)
+        self.set_clock(*result.clock)
+        prof.lap("ui.sidebar")
+
+        # Refresh chart visuals without resetting selection
+        self.update_chart_only()
+        prof.lap("ui.chart")
+
+        # Reports tab data
+        reports = []
+        for c in self.companies:
+            s = self._state(c)
+            reports.append({
+                "name": c.name,
+                "price": s.price,
+                "float": s.public_float,
+                "owned": s.player_shares,
+                "asset_income": result.income.get(c.name, 0.0),
+                "div_paid": result.dividends_paid.get(c.name, 0.0),
+                "div_received": result.dividends_received.get(c.name, 0.0),
+            })
+        self.update_reports(reports, dividends=result.dividends)
+        prof.lap("ui.reports")
+
     def _update_trade_costs(self):
-        c = self.selected_company
+        c = self._state(self.selected_company)
         buy_shares = self.buy_slider.value() if hasattr(self, "buy_slider") else 1
         sell_shares = self.sell_slider.value() if hasattr(self, "sell_slider") else 1
         buy_cost = c.price * buy_shares
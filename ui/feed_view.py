@@ -0,0 +1,98 @@
+"""
+feed_view.py
+------------
+
+Market activity feed widget. The newest FEED_CAPACITY lines live in a
+FeedRing and the widget paints only the rows on screen, straight from
+the ring (fixed row height, no per-line layout). Appending is
+O(new lines) and memory is capped, so the feed costs the same after an
+hour as after a minute.
+"""
+
+from PyQt6.QtWidgets import QAbstractScrollArea
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPainter, QColor
+
+from core.activity_feed import FEED_CAPACITY, FeedRing
+
+
+class FeedView(QAbstractScrollArea):
+    """
+    Read-only, virtualized feed of (text, color) lines. Follows new
+    lines while scrolled to the bottom; otherwise the rows in view stay
+    put, even as old lines drop out of the ring.
+    """
+
+    def __init__(self, capacity=FEED_CAPACITY, parent=None):
+        super().__init__(parent)
+        self.lines = FeedRing(capacity)
+        self._colors = {}   # color string -> QColor, shared by every row
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.verticalScrollBar().setSingleStep(1)
+
+    # ----------------------------------------------------------
+    #  DATA
+    # ----------------------------------------------------------
+
+    def append_lines(self, lines):
+        """Add (text, color) lines at the bottom, dropping the oldest past capacity."""
+        lines = list(lines)
+        if not lines:
+            return
+        bar = self.verticalScrollBar()
+        follow = bar.value() >= bar.maximum()
+        top = bar.value() - self.lines.extend(lines)
+        self._update_range()
+        bar.setValue(bar.maximum() if follow else max(0, top))
+        self.viewport().update()
+
+    def clear(self):
+        self.lines.clear()
+        self._update_range()
+        self.viewport().update()
+
+    # ----------------------------------------------------------
+    #  LAYOUT + PAINT
+    # ----------------------------------------------------------
+
+    def _row_height(self):
+        return self.fontMetrics().lineSpacing()
+
+    def _visible_rows(self):
+        return max(1, self.viewport().height() // self._row_height())
+
+    def _update_range(self):
+        bar = self.verticalScrollBar()
+        rows = self._visible_rows()
+        bar.setPageStep(rows)
+        bar.setRange(0, max(0, len(self.lines) - rows))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        bar = self.verticalScrollBar()
+        follow = bar.value() >= bar.maximum()
+        self._update_range()
+        if follow:
+            bar.setValue(bar.maximum())
+
+    def scrollContentsBy(self, dx, dy):
+        self.viewport().update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self.viewport())
+        metrics = self.fontMetrics()
+        row_h = metrics.lineSpacing()
+        width = self.viewport().width() - 4
+        first = self.verticalScrollBar().value()
+        last = min(len(self.lines), first + self._visible_rows() + 1)
+        y = metrics.ascent()
+        for i in range(first, last):
+            text, color = self.lines[i]
+            pen = self._colors.get(color)
+            if pen is None:
+                pen = self._colors[color] = QColor(color)
+            painter.setPen(pen)
+            painter.drawText(2, y, metrics.elidedText(text, Qt.TextElideMode.ElideRight, width))
+            y += row_h
+        painter.end()
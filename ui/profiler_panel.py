@@ -0,0 +1,110 @@
+"""
+profiler_panel.py
+-----------------
+
+Debug window for the TickProfiler: per-phase latency table for the
+simulation tick and the dashboard refresh, refreshed once a second.
+Toggle with F3 in the game window.
+
+The dashboard's profiler is read directly; the simulation's lives on
+the worker thread and is reached through `remote(fn)`, which runs
+fn(profiler) there and returns a Future (SimulationWorker.call). Its
+report shows up one refresh late.
+"""
+
+import os
+import time
+
+from PyQt6.QtWidgets import QWidget, QPushButton, QVBoxLayout, QHBoxLayout, QCheckBox, QPlainTextEdit
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QFont
+
+from core.profiler import format_report
+
+
+class ProfilerPanel(QWidget):
+    def __init__(self, profiler, remote=None, dump_dir=""):
+        super().__init__()
+        self.profiler = profiler
+        self.remote = remote
+        self.dump_dir = dump_dir
+        self._remote_report = {}
+        self._request = None   # Future of the pending remote report()
+
+        self.setWindowTitle("Tick Profiler")
+        self.resize(760, 460)
+
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+
+        # ---------- Controls ----------
+        row = QHBoxLayout()
+        self.enabled_box = QCheckBox("Profiling enabled")
+        self.enabled_box.setChecked(profiler.enabled)
+        self.enabled_box.toggled.connect(self._toggle)
+        row.addWidget(self.enabled_box)
+        row.addStretch(1)
+
+        reset_btn = QPushButton("Reset")
+        reset_btn.clicked.connect(self._reset)
+        row.addWidget(reset_btn)
+
+        dump_btn = QPushButton("Dump to File")
+        dump_btn.clicked.connect(self._dump)
+        row.addWidget(dump_btn)
+        layout.addLayout(row)
+
+        # ---------- Table ----------
+        self.table = QPlainTextEdit()
+        self.table.setReadOnly(True)
+        font = QFont("Consolas")
+        font.setStyleHint(QFont.StyleHint.Monospace)
+        self.table.setFont(font)
+        self.table.setStyleSheet("background-color: #05080f; color: #cfe3ff;")
+        layout.addWidget(self.table)
+
+        self.setStyleSheet("background-color: #0f0f17; color: #eaf2ff;")
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(1000)
+        self.refresh()
+
+    def _report(self):
+        """Simulation phases (as of the last answered request) and dashboard phases, merged."""
+        if self.remote is not None:
+            if self._request is not None and self._request.done():
+                self._remote_report = self._request.result()
+                self._request = None
+            if self._request is None:
+                self._request = self.remote(lambda profiler: profiler.report())
+        return {**self._remote_report, **self.profiler.report()}
+
+    def _on_both(self, fn):
+        fn(self.profiler)
+        if self.remote is not None:
+            self.remote(fn)
+
+    def refresh(self):
+        if not self.isVisible():
+            return
+        if not self.profiler.enabled:
+            self.table.setPlainText("Profiling is off. Tick the box above to start collecting.")
+            return
+        self.table.setPlainText(format_report(self._report(), self.profiler.window))
+
+    def _toggle(self, enabled):
+        self._on_both(lambda profiler: profiler.set_enabled(enabled))
+        self.refresh()
+
+    def _reset(self):
+        self._on_both(lambda profiler: profiler.reset())
+        self._remote_report = {}
+        self.refresh()
+
+    def _dump(self):
+        if self.dump_dir:
+            os.makedirs(self.dump_dir, exist_ok=True)
+        path = os.path.join(self.dump_dir, time.strftime("profile-%Y%m%d-%H%M%S.txt"))
+        self.profiler.dump(path, self._report())
+        self.table.appendPlainText(f"\nSaved {path}")
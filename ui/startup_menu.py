@@ -3,21 +3,24 @@ startup_menu.py
 ----------------
 
 Start screen for the Space Miner Guild - Market Dominion sim.
-Player chooses company count and difficulty, then launches the game.
+Player chooses company count and difficulty, then launches the game
+(or loads a saved one).
 """
 
 from PyQt6.QtWidgets import (
     QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout,
-    QSlider, QComboBox, QLineEdit
+    QSlider, QComboBox, QLineEdit, QFileDialog
 )
 from PyQt6.QtCore import Qt
 
 
 class StartupMenu(QWidget):
-    def __init__(self, start_callback):
+    def __init__(self, start_callback, load_callback=None, save_dir=""):
         super().__init__()
 
         self.start_callback = start_callback
+        self.load_callback = load_callback
+        self.save_dir = save_dir
 
         self.setWindowTitle("Space Miner Guild — Simulation Setup")
         self.resize(600, 400)
@@ -142,6 +145,18 @@ class StartupMenu(QWidget):
         start_btn.clicked.connect(self._start_clicked)
         layout.addWidget(start_btn)
 
+        if load_callback:
+            load_btn = QPushButton("Load Game")
+            load_btn.setStyleSheet("""
+                font-size: 16px;
+                padding: 6px 20px;
+                background-color: #2a2f3f;
+                border-radius: 8px;
+                color: white;
+            """)
+            load_btn.clicked.connect(self._load_clicked)
+            layout.addWidget(load_btn)
+
         # Padding
         layout.addSpacing(20)
 
@@ -162,3 +177,10 @@ class StartupMenu(QWidget):
 
         if self.start_callback:
             self.start_callback(count, difficulty, player_name, player_company)
+
+    def _load_clicked(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Load Game", self.save_dir, "Saved games (*.smsave);;All files (*)"
+        )
+        if path and self.load_callback:
+            self.load_callback(path)